@@ -0,0 +1,15 @@
+"""
+Análisis de posiciones de Backgammon
+
+rollout(game_o_posicion) estima las probabilidades de ganar, gammon y backgammon jugando la
+posición muchas veces con una política rápida. Busqueda elige jugadas con expectiminimax de n
+jugadas sobre un evaluador estático, por ejemplo la red neuronal de backgammon.analysis.red
+(requiere numpy, por eso no se importa acá). EvaluadorCarrera es un evaluador barato para
+carreras con los conteos efectivos de Keith o Thorp.
+"""
+
+from backgammon.analysis.montecarlo import ResultadoRollout, estimar_por_pips, rollout
+from backgammon.analysis.busqueda import Busqueda, PoliticaBusqueda, evaluar_por_pips
+from backgammon.analysis.carrera import (
+    EvaluadorCarrera, conteo_keith, conteo_thorp, evaluador_por_fase, probabilidad_carrera,
+)
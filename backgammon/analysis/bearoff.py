@@ -0,0 +1,330 @@
+"""
+Base de datos de bear off de un lado (NumPy)
+
+Para cada distribución de hasta `fichas` fichas propias en los seis puntos de casa guarda
+la cantidad esperada de tiradas para sacarlas todas y la distribución completa de esa
+cantidad, jugando siempre la jugada que minimiza la media. Es exacta para las reglas de
+este juego, en las que sin contacto ningún dado queda sin jugar.
+
+IMPORTANTE - no es la regla estándar: como en Game.mover_ficha (ver core/jugadas.py), un dado
+mayor o igual a la distancia saca una ficha de CUALQUIER punto de la casa, aunque haya fichas
+en puntos más altos. En el backgammon estándar solo saca la del punto más alto ocupado. Con
+esta regla sacar es más fácil, así que las medias y distribuciones de esta base (y las
+probabilidades de bearoff_doble, que la usa) son algo más optimistas que las publicadas para
+el backgammon estándar y no se pueden comparar directamente con ellas.
+
+Las posiciones se indexan con un hash perfecto combinatorio: las fichas de cada punto
+seguidas de un separador forman un subconjunto de 6 lugares entre fichas + 6, y el índice
+es su rango en el sistema combinatorial de números. El archivo es binario plano (cabecera,
+medias float32 y distribuciones uint16) y se lee con mmap sin cargarlo en memoria.
+
+Uso: python -m backgammon.analysis.bearoff --salida bearoff1.bin
+"""
+
+import argparse
+import mmap
+import struct
+from math import comb
+
+import numpy as np
+
+from backgammon.analysis.busqueda import TIRADAS_DISTINTAS
+from backgammon.core.board import SIGNO
+
+PUNTOS = 6
+FICHAS = 15
+# Largo de la distribución; la última casilla acumula "TIRADAS_MAXIMAS - 1 o más"
+TIRADAS_MAXIMAS = 32
+
+_MAGIA = b"BGBO"
+_VERSION = 1
+_CABECERA = struct.Struct("<4sBBBB")
+_ESCALA = 65535
+
+
+def cantidad_posiciones(fichas=FICHAS):
+    """
+    Retorna la cantidad de posiciones de hasta `fichas` fichas en los seis puntos
+    """
+    return comb(fichas + PUNTOS, PUNTOS)
+
+
+def indice_posicion(posicion):
+    """
+    Hash perfecto de una posición de bear off
+
+    Args:
+        posicion (sequence): Fichas en los puntos 1 a 6 (contados desde el borde)
+
+    Returns:
+        int: Índice entre 0 y cantidad_posiciones(fichas) - 1; 0 es la posición vacía
+    """
+    indice = 0
+    lugar = 0
+    for separador, fichas in enumerate(posicion):
+        lugar += fichas
+        indice += comb(lugar, separador + 1)
+        lugar += 1
+    return indice
+
+
+def posicion_indice(indice, fichas=FICHAS):
+    """
+    Inversa de indice_posicion
+
+    Returns:
+        tuple: Fichas en los puntos 1 a 6
+    """
+    # Se recuperan los lugares de los separadores de mayor a menor (orden colex)
+    lugares = []
+    lugar = fichas + PUNTOS - 1
+    for separador in range(PUNTOS, 0, -1):
+        while comb(lugar, separador) > indice:
+            lugar -= 1
+        indice -= comb(lugar, separador)
+        lugares.append(lugar)
+        lugar -= 1
+    lugares.reverse()
+    anterior = -1
+    posicion = []
+    for lugar in lugares:
+        posicion.append(lugar - anterior - 1)
+        anterior = lugar
+    return tuple(posicion)
+
+
+def posicion_bearoff(board, color):
+    """
+    Retorna la posición de bear off de `color` (fichas en los puntos 1 a 6 contados desde
+    el borde) o None si todavía no puede sacar fichas
+
+    Usa la misma condición que Game._puede_hacer_bear_off: barra vacía y ninguna ficha
+    fuera de casa.
+    """
+    if board.get_cantidad_barra(color) > 0 or board.get_fuera_de_casa(color) > 0:
+        return None
+    casillas = board.get_casillas()
+    signo = SIGNO[color]
+    if color == "blanco":
+        return tuple(max(casillas[punto] * signo, 0) for punto in range(PUNTOS))
+    return tuple(max(casillas[23 - punto] * signo, 0) for punto in range(PUNTOS))
+
+
+def _sucesores(posicion, dado):
+    """
+    Posiciones distintas a las que se llega moviendo una ficha con un dado
+    """
+    resultado = set()
+    for punto, fichas in enumerate(posicion):
+        if fichas == 0:
+            continue
+        nueva = list(posicion)
+        nueva[punto] -= 1
+        if dado <= punto:
+            nueva[punto - dado] += 1
+        resultado.add(tuple(nueva))
+    return resultado or {posicion}
+
+
+def generar(fichas=FICHAS, tiradas=TIRADAS_MAXIMAS):
+    """
+    Calcula la base de datos de un lado
+
+    Las posiciones se procesan por pip count creciente: todas las que tienen los mismos
+    pips dependen solo de posiciones con menos pips, así que cada nivel se resuelve de una
+    vez con operaciones sobre arreglos.
+
+    Args:
+        fichas (int): Máximo de fichas (hasta 15)
+        tiradas (int): Largo de la distribución
+
+    Returns:
+        tuple: (medias float64 de forma (n,), distribuciones float64 de forma (n, tiradas))
+    """
+    cantidad = cantidad_posiciones(fichas)
+    posiciones = [posicion_indice(indice, fichas) for indice in range(cantidad)]
+    centinela = cantidad  # Índice extra con media infinita para completar filas
+
+    # sucesores[dado - 1] es una matriz (n + 1, 6) de índices, completada con el centinela
+    sucesores = np.full((PUNTOS, cantidad + 1, PUNTOS), centinela, dtype=np.int64)
+    for indice, posicion in enumerate(posiciones):
+        for dado in range(1, 7):
+            destinos = sorted(indice_posicion(destino) for destino in _sucesores(posicion, dado))
+            sucesores[dado - 1, indice, :len(destinos)] = destinos
+
+    medias = np.full(cantidad + 1, np.inf)
+    distribuciones = np.zeros((cantidad + 1, tiradas))
+    # mejor[k][dado - 1]: menor media alcanzable moviendo k veces ese dado, y su posición final
+    mejor = np.full((5, PUNTOS, cantidad + 1), np.inf)
+    final = np.zeros((5, PUNTOS, cantidad + 1), dtype=np.int64)
+    mejor[0] = medias
+    final[0] = np.arange(cantidad + 1)
+
+    pips = np.array([sum((punto + 1) * n for punto, n in enumerate(posicion)) for posicion in posiciones])
+    for nivel in range(int(pips.max()) + 1):
+        indices = np.flatnonzero(pips == nivel)
+        if nivel == 0:
+            medias[indices] = 0.0
+            distribuciones[indices, 0] = 1.0
+            mejor[:, :, indices] = 0.0
+            final[:, :, indices] = indices
+            continue
+        filas = np.arange(len(indices))
+        for dado in range(PUNTOS):
+            destinos = sucesores[dado, indices]
+            for movidas in range(1, 5):
+                valores = mejor[movidas - 1, dado][destinos]
+                eleccion = valores.argmin(axis=1)
+                mejor[movidas, dado, indices] = valores[filas, eleccion]
+                final[movidas, dado, indices] = final[movidas - 1, dado][destinos[filas, eleccion]]
+
+        esperado = np.zeros(len(indices))
+        distribucion = np.zeros((len(indices), tiradas))
+        for dados, probabilidad in TIRADAS_DISTINTAS:
+            if len(dados) == 4:
+                elegidas = final[4, dados[0] - 1, indices]
+            else:
+                # Se prueban los dos órdenes: primero un dado y después el otro con su mejor jugada
+                primero, segundo = dados[0] - 1, dados[1] - 1
+                destinos = np.concatenate([sucesores[primero, indices], sucesores[segundo, indices]], axis=1)
+                valores = np.concatenate([mejor[1, segundo][destinos[:, :PUNTOS]], mejor[1, primero][destinos[:, PUNTOS:]]], axis=1)
+                eleccion = valores.argmin(axis=1)
+                segundo_dado = np.where(eleccion < PUNTOS, segundo, primero)
+                elegidas = final[1, segundo_dado, destinos[filas, eleccion]]
+            esperado += probabilidad * medias[elegidas]
+            distribucion[:, 1:] += probabilidad * distribuciones[elegidas, :-1]
+            distribucion[:, -1] += probabilidad * distribuciones[elegidas, -1]
+        medias[indices] = 1.0 + esperado
+        distribuciones[indices] = distribucion
+        mejor[0, :, indices] = medias[indices][:, np.newaxis]
+    return medias[:cantidad], distribuciones[:cantidad]
+
+
+def guardar(ruta, medias, distribuciones, fichas=FICHAS):
+    """
+    Escribe la base de datos en un archivo binario plano
+
+    Formato: cabecera de 8 bytes (b"BGBO", versión, puntos, fichas, tiradas), medias float32
+    y distribuciones uint16 (probabilidad * 65535), ambas little-endian en orden de índice.
+    """
+    tiradas = distribuciones.shape[1]
+    with open(ruta, "wb") as archivo:
+        archivo.write(_CABECERA.pack(_MAGIA, _VERSION, PUNTOS, fichas, tiradas))
+        archivo.write(medias.astype("<f4").tobytes())
+        archivo.write(np.rint(distribuciones * _ESCALA).astype("<u2").tobytes())
+
+
+class BaseBearoff:
+    """
+    Lector de la base de datos de bear off de un lado mapeada en memoria
+
+    Atributos:
+    __archivo__ (file): Archivo abierto
+    __mapa__ (mmap.mmap): Mapa del archivo en memoria
+    __fichas__ (int): Máximo de fichas de la base
+    __medias__ (numpy.ndarray): Vista float32 de las medias
+    __distribuciones__ (numpy.ndarray): Vista uint16 (n, tiradas) de las distribuciones
+    """
+    __slots__ = ("__archivo__", "__mapa__", "__fichas__", "__medias__", "__distribuciones__")
+
+    def __init__(self, ruta):
+        """
+        Abre una base generada con guardar()
+
+        Raises:
+            ValueError: Si el archivo no es una base de bear off válida
+        """
+        self.__archivo__ = open(ruta, "rb")
+        try:
+            self.__mapa__ = mmap.mmap(self.__archivo__.fileno(), 0, access=mmap.ACCESS_READ)
+            magia, version, puntos, fichas, tiradas = _CABECERA.unpack_from(self.__mapa__)
+            cantidad = cantidad_posiciones(fichas)
+            tamano = _CABECERA.size + cantidad * (4 + 2 * tiradas)
+            if magia != _MAGIA or version != _VERSION or puntos != PUNTOS or len(self.__mapa__) != tamano:
+                raise ValueError("El archivo no es una base de datos de bear off válida")
+        except Exception:
+            self.__archivo__.close()
+            raise
+        self.__fichas__ = fichas
+        self.__medias__ = np.frombuffer(self.__mapa__, dtype="<f4", count=cantidad, offset=_CABECERA.size)
+        self.__distribuciones__ = np.frombuffer(
+            self.__mapa__, dtype="<u2", count=cantidad * tiradas, offset=_CABECERA.size + 4 * cantidad,
+        ).reshape(cantidad, tiradas)
+
+    def get_fichas(self):
+        return self.__fichas__
+
+    def __len__(self):
+        return len(self.__medias__)
+
+    def _indice(self, posicion):
+        if len(posicion) != PUNTOS or sum(posicion) > self.__fichas__ or min(posicion) < 0:
+            raise ValueError(f"La posición debe tener {PUNTOS} puntos y hasta {self.__fichas__} fichas")
+        return indice_posicion(posicion)
+
+    def media(self, posicion):
+        """
+        Retorna la cantidad esperada de tiradas para sacar todas las fichas
+
+        Args:
+            posicion (sequence): Fichas en los puntos 1 a 6 (ver posicion_bearoff)
+        """
+        return float(self.__medias__[self._indice(posicion)])
+
+    def distribucion(self, posicion):
+        """
+        Retorna las probabilidades de sacar todas las fichas en exactamente 0, 1, 2, ... tiradas
+        """
+        return self.__distribuciones__[self._indice(posicion)] / _ESCALA
+
+    def probabilidad_ganar(self, board, color):
+        """
+        Probabilidad de que `color`, con el turno, termine de sacar antes que el rival
+
+        Si los dos lados ya están en bear off (carrera sin contacto) las tiradas de cada uno
+        son independientes: gana si el rival necesita al menos una tirada más que él.
+
+        Returns:
+            float or None: La probabilidad, o None si alguno de los dos no está en bear off o
+                           tiene más fichas que la base
+        """
+        propia = posicion_bearoff(board, color)
+        rival = posicion_bearoff(board, "negro" if color == "blanco" else "blanco")
+        if propia is None or rival is None:
+            return None
+        if sum(propia) > self.__fichas__ or sum(rival) > self.__fichas__:
+            return None
+        propias = self.distribucion(propia)
+        rivales = self.distribucion(rival)
+        # El rival necesita n tiradas o más: suma de su distribución desde n
+        rival_al_menos = np.cumsum(rivales[::-1])[::-1]
+        return float(np.dot(propias[1:], rival_al_menos[1:])) if propias[0] == 0 else 1.0
+
+    def cerrar(self):
+        """
+        Libera el mapa y cierra el archivo
+        """
+        self.__medias__ = self.__distribuciones__ = None
+        self.__mapa__.close()
+        self.__archivo__.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def main(argumentos=None):
+    """Genera la base de datos de bear off de un lado"""
+    parser = argparse.ArgumentParser(description="Genera la base de datos de bear off de un lado")
+    parser.add_argument("--salida", default="bearoff1.bin", help="Archivo a generar")
+    parser.add_argument("--fichas", type=int, default=FICHAS, help="Máximo de fichas (hasta 15)")
+    opciones = parser.parse_args(argumentos)
+    medias, distribuciones = generar(opciones.fichas)
+    guardar(opciones.salida, medias, distribuciones, opciones.fichas)
+    print(f"{len(medias)} posiciones guardadas en {opciones.salida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+Base de datos de bear off de dos lados (NumPy)
+
+Para cada par de posiciones de hasta `fichas` fichas en casa de cada lado guarda la
+probabilidad exacta (sin cubo) de ganar del jugador con el turno, jugando los dos en forma
+perfecta. Con 8 fichas o menos en el tablero cada lado ya sacó al menos 7, así que no hay
+gammons y la equidad es 2p - 1.
+
+Se calcula hacia atrás: P(a, b) = suma sobre las 21 tiradas de p * max(1 - P(b, a')) entre
+las posiciones finales a' de cada jugada. Los pares se procesan por pip count total
+creciente, porque todos los pares de un mismo total dependen solo de totales menores, y cada
+nivel se resuelve con operaciones sobre arreglos. Se usan las reglas de bearoff.py, incluida
+su regla no estándar de bear off con dado mayor desde cualquier punto (ver allí).
+
+El archivo guarda las filas P(a, ·) en bloques comprimidos con zlib o lzma y un índice de
+bloques al principio; se abre con mmap y cada bloque se descomprime la primera vez que se
+consulta (con una caché LRU de bloques), así que las consultas siguientes tardan
+microsegundos.
+
+Uso: python -m backgammon.analysis.bearoff_doble --fichas 6 --salida bearoff2.bin
+"""
+
+import argparse
+import lzma
+import mmap
+import struct
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+from backgammon.analysis.bearoff import (
+    _sucesores, cantidad_posiciones, indice_posicion, posicion_bearoff, posicion_indice,
+)
+from backgammon.analysis.busqueda import TIRADAS_DISTINTAS
+from backgammon.core.board import RIVAL
+
+FICHAS = 6
+# Con más de 8 fichas en el tablero un lado puede no haber sacado ninguna y perder un gammon,
+# que la tabla (solo probabilidad de ganar) no modela
+FICHAS_MAXIMAS = 8
+FILAS_POR_BLOQUE = 64
+CAPACIDAD_BLOQUES = 64
+
+# Elementos por trozo de cálculo, para acotar la memoria de los niveles grandes
+_TROZO = 1 << 20
+
+_MAGIA = b"BGB2"
+_VERSION = 1
+_CABECERA = struct.Struct("<4sBBBBII")
+_ENTRADA_INDICE = struct.Struct("<QI")
+
+COMPRESIONES = {"zlib": 0, "lzma": 1}
+_COMPRIMIR = {0: lambda datos: zlib.compress(datos, 9), 1: lzma.compress}
+_DESCOMPRIMIR = {0: zlib.decompress, 1: lzma.decompress}
+
+
+def _finales(posicion, dados):
+    """
+    Índices de las posiciones finales distintas después de jugar una tirada completa
+    """
+    if len(dados) == 4:
+        actuales = {posicion}
+        for _ in range(4):
+            actuales = {destino for actual in actuales for destino in _sucesores(actual, dados[0])}
+    else:
+        primero, segundo = dados
+        actuales = {final for medio in _sucesores(posicion, primero) for final in _sucesores(medio, segundo)}
+        actuales |= {final for medio in _sucesores(posicion, segundo) for final in _sucesores(medio, primero)}
+    return sorted(indice_posicion(actual) for actual in actuales)
+
+
+def generar(fichas=FICHAS):
+    """
+    Calcula la base de datos de dos lados
+
+    Args:
+        fichas (int): Máximo de fichas de cada lado
+
+    Returns:
+        numpy.ndarray: Matriz float32 (n, n) con P(posición con el turno, posición rival)
+
+    Raises:
+        ValueError: Si `fichas` no está entre 1 y FICHAS_MAXIMAS
+    """
+    if not 1 <= fichas <= FICHAS_MAXIMAS:
+        raise ValueError(f"La base de dos lados admite de 1 a {FICHAS_MAXIMAS} fichas por lado (sin gammons)")
+    cantidad = cantidad_posiciones(fichas)
+    posiciones = [posicion_indice(indice, fichas) for indice in range(cantidad)]
+    pips = np.array([sum((punto + 1) * n for punto, n in enumerate(posicion)) for posicion in posiciones])
+
+    # Por tirada, matriz (n, ancho) de posiciones finales completada con la columna centinela
+    finales = []
+    for dados, _ in TIRADAS_DISTINTAS:
+        filas = [_finales(posicion, dados) for posicion in posiciones]
+        matriz = np.full((cantidad, max(len(fila) for fila in filas)), cantidad, dtype=np.int64)
+        for indice, fila in enumerate(filas):
+            matriz[indice, :len(fila)] = fila
+        finales.append(matriz)
+
+    # La columna extra vale infinito para que 1 - P sea -infinito y nunca gane el máximo
+    tabla = np.zeros((cantidad, cantidad + 1), dtype=np.float32)
+    tabla[:, cantidad] = np.inf
+    tabla[0, :cantidad] = 1.0  # Quien tiene el turno ya sacó todo (el rival, vacío o no, perdió)
+
+    totales = (pips[:, np.newaxis] + pips[np.newaxis, :]).ravel()
+    orden = np.argsort(totales, kind="stable")
+    limites = np.searchsorted(totales[orden], np.arange(totales.max() + 2))
+    for nivel in range(1, totales.max() + 1):
+        pares = orden[limites[nivel]:limites[nivel + 1]]
+        propias, rivales = np.divmod(pares, cantidad)
+        validos = (propias > 0) & (rivales > 0)
+        propias, rivales = propias[validos], rivales[validos]
+        paso = max(1, _TROZO // max(matriz.shape[1] for matriz in finales))
+        for inicio in range(0, len(propias), paso):
+            a = propias[inicio:inicio + paso]
+            b = rivales[inicio:inicio + paso]
+            valor = np.zeros(len(a), dtype=np.float64)
+            for (_, probabilidad), matriz in zip(TIRADAS_DISTINTAS, finales):
+                candidatos = 1.0 - tabla[b[:, np.newaxis], matriz[a]]
+                valor += probabilidad * candidatos.max(axis=1)
+            tabla[a, b] = valor
+    return tabla[:, :cantidad]
+
+
+def guardar(ruta, tabla, fichas=FICHAS, compresion="zlib", filas_por_bloque=FILAS_POR_BLOQUE):
+    """
+    Escribe la tabla en bloques comprimidos de `filas_por_bloque` filas
+
+    Formato: cabecera (b"BGB2", versión, fichas, compresión, reservado, filas por bloque,
+    cantidad de bloques), índice de (desplazamiento, tamaño) de cada bloque y los bloques,
+    cada uno con sus filas float32 little-endian comprimidas.
+    """
+    codigo = COMPRESIONES[compresion]
+    tabla = np.ascontiguousarray(tabla, dtype="<f4")
+    bloques = [
+        _COMPRIMIR[codigo](tabla[inicio:inicio + filas_por_bloque].tobytes())
+        for inicio in range(0, tabla.shape[0], filas_por_bloque)
+    ]
+    desplazamiento = _CABECERA.size + _ENTRADA_INDICE.size * len(bloques)
+    with open(ruta, "wb") as archivo:
+        archivo.write(_CABECERA.pack(_MAGIA, _VERSION, fichas, codigo, 0, filas_por_bloque, len(bloques)))
+        for bloque in bloques:
+            archivo.write(_ENTRADA_INDICE.pack(desplazamiento, len(bloque)))
+            desplazamiento += len(bloque)
+        for bloque in bloques:
+            archivo.write(bloque)
+
+
+class BaseBearoffDoble:
+    """
+    Lector de la base de datos de bear off de dos lados mapeada en memoria
+
+    Atributos:
+    __archivo__ (file): Archivo abierto
+    __mapa__ (mmap.mmap): Mapa del archivo en memoria
+    __fichas__ (int): Máximo de fichas por lado
+    __posiciones__ (int): Cantidad de posiciones de un lado (largo de cada fila)
+    __filas_por_bloque__ (int): Filas de cada bloque comprimido
+    __indice__ (list): (desplazamiento, tamaño) de cada bloque
+    __descomprimir__ (callable): zlib.decompress o lzma.decompress
+    __bloques__ (OrderedDict): Caché LRU número de bloque -> memoryview de floats
+    __capacidad__ (int): Bloques descomprimidos que se guardan como máximo
+    """
+    __slots__ = (
+        "__archivo__", "__mapa__", "__fichas__", "__posiciones__", "__filas_por_bloque__", "__indice__",
+        "__descomprimir__", "__bloques__", "__capacidad__",
+    )
+
+    def __init__(self, ruta, capacidad_bloques=CAPACIDAD_BLOQUES):
+        """
+        Abre una base generada con guardar()
+
+        Raises:
+            ValueError: Si el archivo no es una base de bear off de dos lados válida
+        """
+        self.__archivo__ = open(ruta, "rb")
+        try:
+            self.__mapa__ = mmap.mmap(self.__archivo__.fileno(), 0, access=mmap.ACCESS_READ)
+            magia, version, fichas, codigo, _, filas, bloques = _CABECERA.unpack_from(self.__mapa__)
+            if magia != _MAGIA or version != _VERSION or codigo not in _DESCOMPRIMIR or fichas > FICHAS_MAXIMAS:
+                raise ValueError("El archivo no es una base de datos de bear off de dos lados válida")
+        except Exception:
+            self.__archivo__.close()
+            raise
+        self.__fichas__ = fichas
+        self.__posiciones__ = cantidad_posiciones(fichas)
+        self.__filas_por_bloque__ = filas
+        self.__indice__ = [
+            _ENTRADA_INDICE.unpack_from(self.__mapa__, _CABECERA.size + _ENTRADA_INDICE.size * numero)
+            for numero in range(bloques)
+        ]
+        self.__descomprimir__ = _DESCOMPRIMIR[codigo]
+        self.__bloques__ = OrderedDict()
+        self.__capacidad__ = capacidad_bloques
+
+    def get_fichas(self):
+        return self.__fichas__
+
+    def _bloque(self, numero):
+        bloques = self.__bloques__
+        bloque = bloques.get(numero)
+        if bloque is not None:
+            bloques.move_to_end(numero)
+            return bloque
+        desplazamiento, tamano = self.__indice__[numero]
+        datos = self.__descomprimir__(self.__mapa__[desplazamiento:desplazamiento + tamano])
+        bloque = memoryview(datos).cast("f")
+        bloques[numero] = bloque
+        if len(bloques) > self.__capacidad__:
+            bloques.popitem(last=False)
+        return bloque
+
+    def probabilidad(self, propia, rival):
+        """
+        Probabilidad de ganar del jugador con el turno
+
+        Args:
+            propia (sequence): Fichas en los puntos 1 a 6 del jugador con el turno
+            rival (sequence): Fichas en los puntos 1 a 6 del rival
+
+        Raises:
+            ValueError: Si alguna posición tiene más fichas que la base
+        """
+        if sum(propia) > self.__fichas__ or sum(rival) > self.__fichas__:
+            raise ValueError(f"La base tiene posiciones de hasta {self.__fichas__} fichas por lado")
+        fila = indice_posicion(propia)
+        numero, fila = divmod(fila, self.__filas_por_bloque__)
+        return self._bloque(numero)[fila * self.__posiciones__ + indice_posicion(rival)]
+
+    def probabilidad_ganar(self, board, color):
+        """
+        Probabilidad de ganar de `color` (con el turno) en un tablero
+
+        Returns:
+            float or None: La probabilidad, o None si la posición no está en la base (alguno no
+                           está en bear off o tiene más fichas que la base)
+        """
+        propia = posicion_bearoff(board, color)
+        rival = posicion_bearoff(board, RIVAL[color])
+        if propia is None or rival is None:
+            return None
+        if sum(propia) > self.__fichas__ or sum(rival) > self.__fichas__:
+            return None
+        return self.probabilidad(propia, rival)
+
+    def consultar(self, game):
+        """
+        Probabilidad de ganar del jugador con el turno de una partida, o None si no está en la base
+        """
+        if game.juego_terminado():
+            return None
+        return self.probabilidad_ganar(game.get_board(), game.get_turno_actual().get_color())
+
+    def evaluador(self, respaldo=None):
+        """
+        Retorna un evaluador para Busqueda que usa la tabla cuando puede
+
+        Con profundidad 1 elige la jugada que deja al rival con menor probabilidad, que es
+        el juego perfecto del final sin buscar más.
+
+        Args:
+            respaldo (callable): Evaluador (board, color) para las posiciones fuera de la base
+                                 (por defecto el de pip count)
+        """
+        if respaldo is None:
+            from backgammon.analysis.busqueda import evaluar_por_pips as respaldo
+
+        def evaluar(board, color):
+            probabilidad = self.probabilidad_ganar(board, color)
+            if probabilidad is None:
+                return respaldo(board, color)
+            return 2.0 * probabilidad - 1.0
+        return evaluar
+
+    def cerrar(self):
+        """
+        Libera los bloques y el mapa y cierra el archivo
+        """
+        self.__bloques__.clear()
+        self.__mapa__.close()
+        self.__archivo__.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def main(argumentos=None):
+    """Genera la base de datos de bear off de dos lados"""
+    parser = argparse.ArgumentParser(description="Genera la base de datos de bear off de dos lados")
+    parser.add_argument("--salida", default="bearoff2.bin", help="Archivo a generar")
+    parser.add_argument(
+        "--fichas", type=int, default=FICHAS, choices=range(1, FICHAS_MAXIMAS + 1), metavar=f"1-{FICHAS_MAXIMAS}",
+        help="Máximo de fichas por lado",
+    )
+    parser.add_argument("--compresion", choices=sorted(COMPRESIONES), default="zlib", help="Compresión de los bloques")
+    parser.add_argument("--filas-por-bloque", type=int, default=FILAS_POR_BLOQUE, help="Filas de cada bloque")
+    opciones = parser.parse_args(argumentos)
+    tabla = generar(opciones.fichas)
+    guardar(opciones.salida, tabla, opciones.fichas, opciones.compresion, opciones.filas_por_bloque)
+    print(f"{tabla.shape[0]} x {tabla.shape[1]} posiciones guardadas en {opciones.salida}")
+
+
+if __name__ == "__main__":
+    main()
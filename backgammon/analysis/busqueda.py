@@ -0,0 +1,321 @@
+"""
+Búsqueda expectiminimax de n jugadas con poda *-minimax y tabla de transposición
+
+Los nodos de decisión recorren todas las jugadas legales completas de una tirada y los
+nodos de azar las 21 tiradas distintas (1/36 los dobles, 2/36 las demás). Los valores son
+equidades desde el punto de vista del jugador que mueve, en puntos de victoria (entre -3
+y 3), así que las cotas de la poda Star1 son conocidas. Todo se calcula aplicando y
+revirtiendo movimientos sobre el mismo tablero, sin copiar la partida.
+"""
+
+import math
+
+from backgammon.analysis.montecarlo import probabilidad_por_pips
+from backgammon.core.board import BARRA, RIVAL, SACADAS
+from backgammon.core.cache import CACHE_JUGADAS
+from backgammon.sim.politicas import Politica
+
+# Cotas de la equidad: perder o ganar un backgammon
+MINIMO = -3.0
+MAXIMO = 3.0
+
+# Las 21 tiradas distintas con su probabilidad
+TIRADAS_DISTINTAS = tuple(
+    ([dado1] * 4, 1 / 36) if dado1 == dado2 else ([dado2, dado1], 2 / 36)
+    for dado1 in range(1, 7) for dado2 in range(dado1, 7)
+)
+
+# Tipos de valor guardados en la tabla de transposición
+EXACTO = 0
+COTA_INFERIOR = 1
+COTA_SUPERIOR = 2
+
+CAPACIDAD_TABLA = 200000
+
+
+def evaluar_por_pips(board, color):
+    """
+    Evaluador estático por defecto: equidad de carrera según el pip count
+
+    Args:
+        board (Board): Tablero a evaluar
+        color (str): Color del jugador que tiene el turno
+
+    Returns:
+        float: Equidad entre -1 y 1 para el jugador con el turno
+    """
+    return 2.0 * probabilidad_por_pips(board, color) - 1.0
+
+
+def puntos_ganados(board, color):
+    """
+    Retorna los puntos que gana `color` si ya no le quedan fichas, con las mismas reglas
+    que Game.verificar_ganador (1 simple, 2 gammon, 3 backgammon), o 0 si no terminó
+    """
+    if board.get_fichas_en_tablero(color) + board.get_cantidad_barra(color) > 0:
+        return 0
+    rival = RIVAL[color]
+    casillas = board.get_casillas()
+    if casillas[SACADAS[rival]] > 0:
+        return 1
+    if casillas[BARRA[rival]] > 0 or board.get_en_casa_rival(rival) > 0:
+        return 3
+    return 2
+
+
+class Busqueda:
+    """
+    Motor de búsqueda expectiminimax
+
+    La profundidad cuenta decisiones: 1 elige la jugada con mejor evaluación estática
+    inmediata y 2 además promedia la mejor respuesta del rival en sus 21 tiradas.
+
+    Atributos:
+    __profundidad__ (int): Decisiones a mirar hacia adelante
+    __evaluador__ (callable): Función (board, color) -> equidad del jugador con el turno
+    __evaluador_jugadas__ (callable): evaluar_jugadas del evaluador si lo tiene (puntúa
+                                      todas las jugadas de una tirada de una vez), o None
+    __cache__ (CacheJugadas): Caché de jugadas legales
+    __tabla__ (dict): (hash canónico, profundidad) -> (valor, tipo) de nodos de azar; los dos
+                      colores comparten entradas, así que el evaluador tiene que ser simétrico
+    __capacidad_tabla__ (int): Entradas máximas de la tabla antes de vaciarla
+    __nodos__ (int): Nodos de decisión visitados
+    __aciertos_tabla__ (int): Nodos de azar resueltos con la tabla
+    __podas__ (int): Nodos de azar cortados por Star1 o Star2
+    """
+    __slots__ = (
+        "__profundidad__", "__evaluador__", "__evaluador_jugadas__", "__cache__", "__tabla__", "__capacidad_tabla__",
+        "__nodos__", "__aciertos_tabla__", "__podas__",
+    )
+
+    def __init__(self, profundidad=2, evaluador=None, cache=None, capacidad_tabla=CAPACIDAD_TABLA):
+        """
+        Crea el motor de búsqueda
+
+        Args:
+            profundidad (int): Decisiones a mirar hacia adelante (al menos 1)
+            evaluador (callable): Evaluación estática (board, color) -> equidad entre -3 y 3;
+                                  si además tiene evaluar_jugadas(board, color, jugadas),
+                                  como RedNeuronal, las hojas se evalúan de a lotes
+            cache (CacheJugadas): Caché de jugadas legales (por defecto la compartida)
+            capacidad_tabla (int): Entradas máximas de la tabla de transposición
+
+        Raises:
+            ValueError: Si la profundidad es menor que 1
+        """
+        if profundidad < 1:
+            raise ValueError("La profundidad de búsqueda debe ser al menos 1")
+        self.__profundidad__ = profundidad
+        self.__evaluador__ = evaluar_por_pips if evaluador is None else evaluador
+        self.__evaluador_jugadas__ = getattr(evaluador, "evaluar_jugadas", None)
+        self.__cache__ = CACHE_JUGADAS if cache is None else cache
+        self.__tabla__ = {}
+        self.__capacidad_tabla__ = capacidad_tabla
+        self.__nodos__ = 0
+        self.__aciertos_tabla__ = 0
+        self.__podas__ = 0
+
+    def get_profundidad(self):
+        return self.__profundidad__
+
+    def get_estadisticas(self):
+        """
+        Retorna los contadores de la búsqueda
+
+        Returns:
+            dict: nodos, aciertos_tabla, podas y tamaño de la tabla
+        """
+        return {
+            "nodos": self.__nodos__,
+            "aciertos_tabla": self.__aciertos_tabla__,
+            "podas": self.__podas__,
+            "tabla": len(self.__tabla__),
+        }
+
+    def limpiar(self):
+        """
+        Vacía la tabla de transposición y reinicia los contadores
+        """
+        self.__tabla__.clear()
+        self.__nodos__ = 0
+        self.__aciertos_tabla__ = 0
+        self.__podas__ = 0
+
+    def mejor_jugada(self, game, dados):
+        """
+        Busca la mejor jugada del jugador actual de una partida para una tirada
+
+        El tablero de la partida se usa durante la búsqueda y queda igual que al principio.
+
+        Args:
+            game (Game): Partida en curso
+            dados (list): Valores de la tirada
+
+        Returns:
+            tuple: (jugada, equidad); la jugada es None si la tirada no se puede jugar
+        """
+        board = game.get_board()
+        color = game.get_turno_actual().get_color()
+        jugadas = self.__cache__.obtener(board, color, dados)
+        if not jugadas:
+            return None, self._despues_de_pasar(board, color, self.__profundidad__, -math.inf, math.inf)
+        return self.elegir_entre(board, color, jugadas)
+
+    def elegir_entre(self, board, color, jugadas):
+        """
+        Elige la mejor de una lista de jugadas de `color` (no vacía)
+
+        Returns:
+            tuple: (jugada, equidad)
+        """
+        profundidad = self.__profundidad__
+        if profundidad <= 1:
+            valores = self._valores_hoja(board, color, jugadas)
+            indice = max(range(len(jugadas)), key=valores.__getitem__)
+            return jugadas[indice], valores[indice]
+        mejor, mejor_valor = jugadas[0], -math.inf
+        for jugada in self._ordenar(board, color, jugadas, profundidad):
+            valor = self._valor_jugada(board, color, jugada, profundidad, mejor_valor, math.inf)
+            if valor > mejor_valor:
+                mejor, mejor_valor = jugada, valor
+        return mejor, mejor_valor
+
+    def evaluar(self, game):
+        """
+        Retorna la equidad esperada del jugador actual antes de tirar los dados
+        """
+        board = game.get_board()
+        return self._azar(board, game.get_turno_actual().get_color(), self.__profundidad__, -math.inf, math.inf)
+
+    def _estatico(self, board, color):
+        return self.__evaluador__(board, color)
+
+    def _ordenar(self, board, color, jugadas, profundidad):
+        """
+        Ordena las jugadas de mejor a peor según la evaluación estática para podar antes
+        """
+        if profundidad <= 1 or len(jugadas) < 2:
+            return jugadas
+        valores = self._valores_hoja(board, color, jugadas)
+        return [jugada for _, jugada in sorted(zip(valores, jugadas), key=lambda par: -par[0])]
+
+    def _valores_hoja(self, board, color, jugadas):
+        """
+        Valores estáticos de todas las jugadas de una tirada, de a lote si el evaluador puede
+        """
+        if self.__evaluador_jugadas__ is not None:
+            return [float(valor) for valor in self.__evaluador_jugadas__(board, color, jugadas)]
+        return [self._valor_jugada(board, color, jugada, 1, -math.inf, math.inf) for jugada in jugadas]
+
+    def _valor_jugada(self, board, color, jugada, profundidad, alfa, beta):
+        """
+        Aplica una jugada, evalúa la posición resultante para `color` y la revierte
+        """
+        comidas = [board.aplicar_movimiento(desde, hacia, color) for desde, hacia, _ in jugada]
+        puntos = puntos_ganados(board, color)
+        if puntos:
+            valor = float(puntos)
+        else:
+            valor = self._despues_de_pasar(board, color, profundidad, alfa, beta)
+        for (desde, hacia, _), comio in zip(reversed(jugada), reversed(comidas)):
+            board.revertir_movimiento(desde, hacia, color, comio)
+        return valor
+
+    def _despues_de_pasar(self, board, color, profundidad, alfa, beta):
+        """
+        Valor para `color` de la posición actual cuando el turno pasa al rival
+        """
+        rival = RIVAL[color]
+        if profundidad <= 1:
+            return -self._estatico(board, rival)
+        return -self._azar(board, rival, profundidad - 1, -beta, -alfa)
+
+    def _decision(self, board, color, dados, profundidad, alfa, beta):
+        """
+        Nodo de decisión: la mejor jugada de `color` con una tirada conocida
+        """
+        self.__nodos__ += 1
+        jugadas = self.__cache__.obtener(board, color, dados)
+        if not jugadas:
+            return self._despues_de_pasar(board, color, profundidad, alfa, beta)
+        if profundidad <= 1:
+            return max(self._valores_hoja(board, color, jugadas))
+        mejor = -math.inf
+        for jugada in self._ordenar(board, color, jugadas, profundidad):
+            valor = self._valor_jugada(board, color, jugada, profundidad, max(alfa, mejor), beta)
+            if valor > mejor:
+                mejor = valor
+                if mejor >= beta:
+                    break
+        return mejor
+
+    def _azar(self, board, color, profundidad, alfa, beta):
+        """
+        Nodo de azar: equidad esperada de `color` antes de tirar, con poda Star1/Star2
+        """
+        clave = (board.hash_canonico(color), profundidad)
+        guardado = self.__tabla__.get(clave)
+        if guardado is not None:
+            valor, tipo = guardado
+            if tipo == EXACTO or (tipo == COTA_INFERIOR and valor >= beta) or (tipo == COTA_SUPERIOR and valor <= alfa):
+                self.__aciertos_tabla__ += 1
+                return valor
+
+        # Star2: con profundidad 1 la primera jugada de cada tirada da una cota inferior barata
+        cotas = None
+        if profundidad == 1 and beta < MAXIMO:
+            cotas = []
+            for dados, probabilidad in TIRADAS_DISTINTAS:
+                jugadas = self.__cache__.obtener(board, color, dados)
+                if jugadas:
+                    cota = self._valor_jugada(board, color, jugadas[0], 1, -math.inf, math.inf)
+                else:
+                    cota = self._despues_de_pasar(board, color, 1, -math.inf, math.inf)
+                cotas.append(probabilidad * cota)
+            inferior = sum(cotas)
+            if inferior >= beta:
+                self.__podas__ += 1
+                return self._guardar(clave, inferior, COTA_INFERIOR)
+
+        # Star1: cotas con lo acumulado y lo que falta (peor y mejor caso, o las sondas de Star2)
+        acumulado = 0.0
+        restante = 1.0
+        restante_inferior = sum(cotas) if cotas is not None else MINIMO
+        for indice, (dados, probabilidad) in enumerate(TIRADAS_DISTINTAS):
+            restante -= probabilidad
+            if cotas is not None:
+                restante_inferior -= cotas[indice]
+            else:
+                restante_inferior = restante * MINIMO
+            alfa_hijo = max(MINIMO, (alfa - acumulado - restante * MAXIMO) / probabilidad)
+            beta_hijo = min(MAXIMO, (beta - acumulado - restante_inferior) / probabilidad)
+            acumulado += probabilidad * self._decision(board, color, dados, profundidad, alfa_hijo, beta_hijo)
+            if acumulado + restante_inferior >= beta:
+                self.__podas__ += 1
+                return self._guardar(clave, acumulado + restante_inferior, COTA_INFERIOR)
+            if acumulado + restante * MAXIMO <= alfa:
+                self.__podas__ += 1
+                return self._guardar(clave, acumulado + restante * MAXIMO, COTA_SUPERIOR)
+        return self._guardar(clave, acumulado, EXACTO)
+
+    def _guardar(self, clave, valor, tipo):
+        tabla = self.__tabla__
+        if len(tabla) >= self.__capacidad_tabla__:
+            # Reemplazo simple: se vacía entera cuando se llena
+            tabla.clear()
+        tabla[clave] = (valor, tipo)
+        return valor
+
+
+class PoliticaBusqueda(Politica):
+    """
+    Política de juego automático que elige con la búsqueda expectiminimax
+    """
+    __slots__ = ("__busqueda__",)
+    nombre = "busqueda"
+
+    def __init__(self, profundidad=1, evaluador=None):
+        self.__busqueda__ = Busqueda(profundidad, evaluador)
+
+    def elegir(self, game, jugadas):
+        return self.__busqueda__.elegir_entre(game.get_board(), game.get_turno_actual().get_color(), jugadas)[0]
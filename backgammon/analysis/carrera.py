@@ -0,0 +1,174 @@
+"""
+Evaluadores de carrera por pip count efectivo
+
+En una carrera (sin contacto) el pip count puro subestima lo que le falta a un jugador con
+fichas amontonadas en los puntos bajos o huecos en los altos, porque desperdicia pips al
+sacar. Las fórmulas clásicas corrigen eso con unos pocos ajustes:
+
+- Keith: suma 2 por cada ficha de más de una en el punto 1, 1 por cada ficha de más de una
+  en el 2, 1 por cada ficha de más de tres en el 3 y 1 por cada punto vacío entre el 4 y el 6.
+- Thorp: suma 2 por cada ficha en el tablero y 1 por cada ficha en el punto 1, y resta 1 por
+  cada punto ocupado de la casa.
+
+probabilidad_carrera pasa dos conteos a una probabilidad de ganar con una aproximación normal
+de las tiradas que necesita cada uno. EvaluadorCarrera la usa como evaluador estático para
+Busqueda y memoriza el resultado por posición en forma canónica (los dos colores comparten
+entradas). evaluador_por_fase cambia a ese evaluador apenas se rompe el contacto, que el
+tablero responde en O(1).
+"""
+
+import math
+
+from backgammon.core.board import RIVAL, SIGNO
+
+CAPACIDAD_MEMORIA = 100000
+
+# Media y varianza de los pips que avanza una tirada (los dobles cuentan cuatro veces)
+_AVANCES = [4 * a if a == b else a + b for a in range(1, 7) for b in range(1, 7)]
+MEDIA_TIRADA = sum(_AVANCES) / 36
+VARIANZA_TIRADA = sum(avance * avance for avance in _AVANCES) / 36 - MEDIA_TIRADA ** 2
+
+# Índice del punto n (1 a 6, contando desde el borde) de la casa de cada color
+_CASA = {"blanco": tuple(range(6)), "negro": tuple(range(23, 17, -1))}
+
+
+def _casa(board, color):
+    """
+    Fichas de `color` en los puntos 1 a 6 de su casa
+    """
+    casillas = board.get_casillas()
+    signo = SIGNO[color]
+    return [max(casillas[indice] * signo, 0) for indice in _CASA[color]]
+
+
+def conteo_keith(board, color):
+    """
+    Pip count ajustado de Keith de un jugador
+    """
+    casa = _casa(board, color)
+    conteo = board.get_pips(color)
+    conteo += 2 * max(casa[0] - 1, 0) + max(casa[1] - 1, 0) + max(casa[2] - 3, 0)
+    conteo += sum(1 for fichas in casa[3:] if fichas == 0)
+    return conteo
+
+
+def conteo_thorp(board, color):
+    """
+    Conteo de Thorp de un jugador
+    """
+    casa = _casa(board, color)
+    en_tablero = board.get_fichas_en_tablero(color) + board.get_cantidad_barra(color)
+    return board.get_pips(color) + 2 * en_tablero + casa[0] - sum(1 for fichas in casa if fichas > 0)
+
+
+def conteo_pips(board, color):
+    """
+    Pip count sin ajustes
+    """
+    return board.get_pips(color)
+
+
+CONTEOS = {"keith": conteo_keith, "thorp": conteo_thorp, "pips": conteo_pips}
+
+
+def probabilidad_carrera(propio, rival):
+    """
+    Probabilidad aproximada de ganar una carrera del jugador con el turno
+
+    Cada conteo se pasa a tiradas necesarias (conteo / media de una tirada) con varianza
+    conteo * varianza / media^3, como en un proceso de renovación. El que tiene el turno gana
+    si necesita las mismas tiradas o menos, por eso se suma media tirada a su favor.
+
+    Args:
+        propio (float): Conteo del jugador con el turno
+        rival (float): Conteo del rival
+
+    Returns:
+        float: Probabilidad entre 0 y 1
+    """
+    if propio <= 0:
+        return 1.0
+    if rival <= 0:
+        return 0.0
+    diferencia = (rival - propio) / MEDIA_TIRADA + 0.5
+    desvio = math.sqrt((propio + rival) * VARIANZA_TIRADA / MEDIA_TIRADA ** 3)
+    return 0.5 * (1.0 + math.erf(diferencia / (desvio * math.sqrt(2.0))))
+
+
+class EvaluadorCarrera:
+    """
+    Evaluador de carreras con memoria por posición
+
+    Atributos:
+    __conteo__ (callable): Conteo efectivo (board, color) -> número
+    __memoria__ (dict): Hash canónico del tablero para `color` -> equidad
+    __capacidad__ (int): Entradas máximas de la memoria (se vacía al llenarse)
+    __aciertos__ (int): Evaluaciones resueltas desde la memoria
+    """
+    __slots__ = ("__conteo__", "__memoria__", "__capacidad__", "__aciertos__")
+
+    def __init__(self, conteo="keith", capacidad=CAPACIDAD_MEMORIA):
+        """
+        Args:
+            conteo (str or callable): "keith", "thorp", "pips" o una función (board, color)
+
+        Raises:
+            ValueError: Si el nombre del conteo no existe
+        """
+        if isinstance(conteo, str):
+            if conteo not in CONTEOS:
+                raise ValueError(f"Conteo desconocido: {conteo} (opciones: {', '.join(CONTEOS)})")
+            conteo = CONTEOS[conteo]
+        self.__conteo__ = conteo
+        self.__memoria__ = {}
+        self.__capacidad__ = capacidad
+        self.__aciertos__ = 0
+
+    def get_estadisticas(self):
+        """
+        Retorna {"aciertos": int, "entradas": int} de la memoria
+        """
+        return {"aciertos": self.__aciertos__, "entradas": len(self.__memoria__)}
+
+    def probabilidad(self, board, color):
+        """
+        Probabilidad de ganar de `color`, con el turno, si la posición fuera una carrera
+        """
+        return (self(board, color) + 1.0) / 2.0
+
+    def __call__(self, board, color):
+        """
+        Equidad (2p - 1) de `color` con el turno
+        """
+        clave = board.hash_canonico(color)
+        memoria = self.__memoria__
+        equidad = memoria.get(clave)
+        if equidad is not None:
+            self.__aciertos__ += 1
+            return equidad
+        equidad = 2.0 * probabilidad_carrera(self.__conteo__(board, color), self.__conteo__(board, RIVAL[color])) - 1.0
+        if len(memoria) >= self.__capacidad__:
+            memoria.clear()
+        memoria[clave] = equidad
+        return equidad
+
+
+def evaluador_por_fase(contacto, carrera=None):
+    """
+    Combina un evaluador para posiciones con contacto y otro para carreras
+
+    Args:
+        contacto (callable): Evaluador (board, color) mientras hay contacto
+        carrera (callable): Evaluador (board, color) sin contacto (por defecto EvaluadorCarrera())
+
+    Returns:
+        callable: Evaluador (board, color) para Busqueda
+    """
+    if carrera is None:
+        carrera = EvaluadorCarrera()
+
+    def evaluar(board, color):
+        if board.hay_contacto():
+            return contacto(board, color)
+        return carrera(board, color)
+    return evaluar
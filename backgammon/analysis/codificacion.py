@@ -0,0 +1,136 @@
+"""
+Codificación vectorizada de lotes de posiciones para evaluadores y entrenamiento (NumPy)
+
+Las posiciones llegan como una matriz de enteros con signo (+ blancas, - negras), una fila
+por posición, en uno de dos formatos:
+
+- (n, 24): los 24 puntos, como los arma BackgammonCLI._obtener_posiciones. No trae barra
+  ni fichas sacadas: se asume la barra vacía y que las fichas que faltan fueron sacadas.
+- (n, 28): las 28 casillas de Board.get_casillas (puntos, barras y sacadas).
+
+Cada fila se codifica desde el punto de vista del jugador con el turno, contando los puntos
+desde su casa, y se escribe en una matriz float32 que se puede reservar de antemano. Todo se
+hace con operaciones sobre columnas completas, sin recorrer fichas ni posiciones en Python.
+"""
+
+import numpy as np
+
+from backgammon.core.board import BARRA, SACADAS
+
+ENTRADAS_TESAURO = 198
+ENTRADAS_COMPACTA = 100
+
+FICHAS_POR_JUGADOR = 15
+
+
+def _preparar(posiciones, color):
+    """
+    Pasa las posiciones al punto de vista del jugador con el turno
+
+    Returns:
+        tuple: (propias, rivales, barra_propia, barra_rival, sacadas_propias, sacadas_rivales),
+               las dos primeras de forma (n, 24) y el resto de forma (n,)
+    """
+    posiciones = np.asarray(posiciones)
+    if posiciones.ndim == 1:
+        posiciones = posiciones[np.newaxis]
+    if posiciones.ndim != 2 or posiciones.shape[1] not in (24, 28):
+        raise ValueError("Las posiciones deben ser una matriz de 24 o 28 columnas")
+    cantidad = posiciones.shape[0]
+    if isinstance(color, str):
+        negro = np.full(cantidad, color == "negro")
+    else:
+        negro = np.asarray(color) == "negro"
+        if negro.shape != (cantidad,):
+            raise ValueError("Debe haber un color por posición")
+
+    puntos = posiciones[:, :24].astype(np.int16)
+    # Para negro se invierte el tablero (su casa son los puntos 19-24) y el signo
+    puntos = np.where(negro[:, np.newaxis], -puntos[:, ::-1], puntos)
+    propias = np.maximum(puntos, 0)
+    rivales = np.maximum(-puntos, 0)
+
+    if posiciones.shape[1] == 28:
+        barra_blanco = posiciones[:, BARRA["blanco"]]
+        barra_negro = posiciones[:, BARRA["negro"]]
+        sacadas_blanco = posiciones[:, SACADAS["blanco"]]
+        sacadas_negro = posiciones[:, SACADAS["negro"]]
+        barra_propia = np.where(negro, barra_negro, barra_blanco)
+        barra_rival = np.where(negro, barra_blanco, barra_negro)
+        sacadas_propias = np.where(negro, sacadas_negro, sacadas_blanco)
+        sacadas_rivales = np.where(negro, sacadas_blanco, sacadas_negro)
+    else:
+        barra_propia = barra_rival = np.zeros(cantidad, dtype=np.int16)
+        sacadas_propias = FICHAS_POR_JUGADOR - propias.sum(axis=1)
+        sacadas_rivales = FICHAS_POR_JUGADOR - rivales.sum(axis=1)
+    return propias, rivales, barra_propia, barra_rival, sacadas_propias, sacadas_rivales
+
+
+def _reservar(salida, cantidad, entradas):
+    if salida is None:
+        return np.empty((cantidad, entradas), dtype=np.float32)
+    if salida.shape != (cantidad, entradas):
+        raise ValueError(f"La matriz de salida debe ser de {cantidad}x{entradas}")
+    return salida
+
+
+def codificar_tesauro(posiciones, color="blanco", salida=None):
+    """
+    Codifica posiciones con las 198 entradas de Tesauro
+
+    Por cada punto y jugador hay cuatro unidades: al menos 1, 2 y 3 fichas y (n - 3) / 2 para
+    el resto (96 del jugador con el turno y 96 del rival). Siguen la barra / 2 y las fichas
+    sacadas / 15 de cada jugador y dos unidades de turno (siempre las del jugador con el turno).
+
+    Args:
+        posiciones (array-like): Matriz (n, 24) o (n, 28) de conteos con signo (o una sola fila)
+        color (str or sequence): Color con el turno, para todas las filas o uno por fila
+        salida (numpy.ndarray): Matriz (n, 198) donde escribir (None reserva una float32)
+
+    Returns:
+        numpy.ndarray: La matriz de entradas
+
+    Raises:
+        ValueError: Si las formas no coinciden
+    """
+    propias, rivales, barra_propia, barra_rival, sacadas_propias, sacadas_rivales = _preparar(posiciones, color)
+    salida = _reservar(salida, propias.shape[0], ENTRADAS_TESAURO)
+    for desplazamiento, fichas in ((0, propias), (96, rivales)):
+        salida[:, desplazamiento:desplazamiento + 96:4] = fichas >= 1
+        salida[:, desplazamiento + 1:desplazamiento + 96:4] = fichas >= 2
+        salida[:, desplazamiento + 2:desplazamiento + 96:4] = fichas >= 3
+        salida[:, desplazamiento + 3:desplazamiento + 96:4] = np.maximum(fichas - 3, 0) / 2.0
+    salida[:, 192] = barra_propia / 2.0
+    salida[:, 193] = barra_rival / 2.0
+    salida[:, 194] = sacadas_propias / FICHAS_POR_JUGADOR
+    salida[:, 195] = sacadas_rivales / FICHAS_POR_JUGADOR
+    salida[:, 196] = 1.0
+    salida[:, 197] = 0.0
+    return salida
+
+
+def codificar_compacta(posiciones, color="blanco", salida=None):
+    """
+    Codifica posiciones con 100 entradas: por cada punto, ficha sola y punto hecho de cada
+    jugador (96), más la barra / 2 y las fichas sacadas / 15 de cada jugador
+
+    Args y Returns como codificar_tesauro, con matrices de 100 columnas.
+    """
+    propias, rivales, barra_propia, barra_rival, sacadas_propias, sacadas_rivales = _preparar(posiciones, color)
+    salida = _reservar(salida, propias.shape[0], ENTRADAS_COMPACTA)
+    salida[:, 0:96:4] = propias == 1
+    salida[:, 1:96:4] = propias >= 2
+    salida[:, 2:96:4] = rivales == 1
+    salida[:, 3:96:4] = rivales >= 2
+    salida[:, 96] = barra_propia / 2.0
+    salida[:, 97] = barra_rival / 2.0
+    salida[:, 98] = sacadas_propias / FICHAS_POR_JUGADOR
+    salida[:, 99] = sacadas_rivales / FICHAS_POR_JUGADOR
+    return salida
+
+
+# Codificador según la cantidad de entradas de un evaluador
+CODIFICADORES = {
+    ENTRADAS_TESAURO: codificar_tesauro,
+    ENTRADAS_COMPACTA: codificar_compacta,
+}
@@ -0,0 +1,269 @@
+"""
+Evaluación de posiciones por rollout (Monte Carlo)
+
+La posición se juega hasta el final muchas veces con una política rápida y se promedian los
+resultados desde el punto de vista del jugador que tiene el turno. Las categorías son las
+mismas que Game.get_tipo_victoria y la equidad coincide con Game.get_puntos_victoria
+(+1/+2/+3 al ganar simple/gammon/backgammon, negativo al perder).
+
+Las primeras tiradas de cada partida se estratifican con DadosRotados y el rollout se
+detiene en cuanto el error estándar de la equidad llega al objetivo pedido. Con una base de
+bear off (bearoff.py) las posiciones de bear off contra bear off se resuelven con la tabla.
+"""
+
+import math
+import os
+from collections import deque, namedtuple
+from multiprocessing import Event, Pool
+
+from backgammon.core.board import RIVAL, SACADAS
+from backgammon.core.dice import Dice
+from backgammon.core.game import Game
+from backgammon.core.position import Position
+from backgammon.core.rotacion import DadosRotados
+from backgammon.sim.motor import MAX_TURNOS, continuar_partida
+from backgammon.sim.paralelo import derivar_semilla
+from backgammon.sim.politicas import crear_politica
+
+# Partidas por lote; múltiplo de 36 para que cada lote complete rotaciones de la primera tirada
+TAMANO_LOTE = 36
+# Lotes enviados al pool por proceso y todavía sin leer: mantiene ocupados a los procesos sin
+# encolar todo el rollout, así la detención por error estándar ahorra los lotes que no se enviaron
+LOTES_EN_VUELO = 2
+
+# Aviso de detención compartido con los procesos del pool (lo fija _iniciar_proceso)
+_DETENER = None
+
+# Probabilidades acumuladas: ganar_gammon incluye los backgammons y ganar incluye a ambos
+ResultadoRollout = namedtuple("ResultadoRollout", [
+    "color", "partidas", "truncadas", "ganar", "ganar_gammon", "ganar_backgammon",
+    "perder_gammon", "perder_backgammon", "equidad", "error_estandar",
+])
+
+
+def probabilidad_por_pips(board, color):
+    """
+    Estima la probabilidad de ganar del jugador que tiene el turno a partir del pip count
+
+    Aproximación normal de una carrera: la ventaja de tener el turno vale unos 4 pips y
+    la dispersión crece con la raíz del total de pips que faltan. No estima gammons.
+
+    Args:
+        board (Board): Tablero a evaluar
+        color (str): Color del jugador que tiene el turno
+
+    Returns:
+        float: Probabilidad de ganar del jugador con el turno
+    """
+    propios = board.get_pips(color)
+    rivales = board.get_pips(RIVAL[color])
+    desvio = max(1.0, math.sqrt(propios + rivales))
+    return 0.5 * (1.0 + math.erf((rivales - propios + 4) / (desvio * math.sqrt(2))))
+
+
+def estimar_por_pips(game):
+    """
+    Estima la probabilidad de ganar del jugador con el turno de una partida cortada
+
+    Args:
+        game (Game): Partida cortada por el límite de tiradas
+
+    Returns:
+        float: Probabilidad de ganar del jugador con el turno
+    """
+    return probabilidad_por_pips(game.get_board(), game.get_turno_actual().get_color())
+
+
+def _abrir_bearoff(ruta):
+    # Import diferido: la base de bear off necesita numpy, que es opcional
+    from backgammon.analysis.bearoff import BaseBearoff
+    return BaseBearoff(ruta) if ruta is not None else None
+
+
+def _probabilidad_bearoff(base, board, color):
+    """
+    Probabilidad exacta de ganar de `color` (con el turno) según la base de bear off, o None
+    si no es bear off contra bear off o todavía puede haber gammon (alguno no sacó fichas)
+    """
+    if base is None:
+        return None
+    casillas = board.get_casillas()
+    if casillas[SACADAS[color]] == 0 or casillas[SACADAS[RIVAL[color]]] == 0:
+        return None
+    return base.probabilidad_ganar(board, color)
+
+
+def _resultado_partida(game, color, base=None):
+    """
+    Convierte el final de una partida en el vector de categorías desde el punto de vista de `color`
+
+    Returns:
+        tuple: (ganar, ganar_gammon, ganar_backgammon, perder_gammon, perder_backgammon, truncada)
+    """
+    if not game.juego_terminado():
+        probabilidad = _probabilidad_bearoff(base, game.get_board(), game.get_turno_actual().get_color())
+        if probabilidad is None:
+            probabilidad = estimar_por_pips(game)
+        if game.get_turno_actual().get_color() != color:
+            probabilidad = 1.0 - probabilidad
+        return (probabilidad, 0.0, 0.0, 0.0, 0.0, 1)
+
+    puntos = game.get_puntos_victoria()
+    gammon = 1.0 if puntos >= 2 else 0.0
+    backgammon = 1.0 if puntos >= 3 else 0.0
+    if game.get_ganador().get_color() == color:
+        return (1.0, gammon, backgammon, 0.0, 0.0, 0)
+    return (0.0, 0.0, 0.0, gammon, backgammon, 0)
+
+
+def _equidad(ganar, ganar_gammon, ganar_backgammon, perder_gammon, perder_backgammon):
+    return 2.0 * ganar - 1.0 + ganar_gammon - perder_gammon + ganar_backgammon - perder_backgammon
+
+
+def _iniciar_proceso(detener):
+    global _DETENER
+    _DETENER = detener
+
+
+def _jugar_lote(tarea):
+    """
+    Juega las partidas [inicio, fin) de un rollout y retorna sus vectores de resultado
+
+    En un proceso del pool corta entre partidas si el rollout ya se detuvo; ese lote se descarta.
+    """
+    datos, inicio, fin, politica, semilla, truncar, ruta_bearoff = tarea
+    posicion = Position(datos)
+    color = posicion.get_turno()
+    fuente = DadosRotados(semilla=semilla, partida_inicial=inicio)
+    base = _abrir_bearoff(ruta_bearoff)
+    resultados = []
+    for indice in range(inicio, fin):
+        if _DETENER is not None and _DETENER.is_set():
+            break
+        fuente.nueva_partida(indice)
+        game = Game("Blanco", "Negro", dice=Dice(rng=fuente))
+        game.cargar_posicion(posicion)
+        continuar_partida(
+            game,
+            crear_politica(politica, derivar_semilla(semilla, indice, "blanco")),
+            crear_politica(politica, derivar_semilla(semilla, indice, "negro")),
+            truncar,
+        )
+        resultados.append(_resultado_partida(game, color, base))
+    if base is not None:
+        base.cerrar()
+    return resultados
+
+
+def rollout(origen, partidas=1296, politica="codiciosa", truncar=None, error_objetivo=None,
+            minimo=TAMANO_LOTE, procesos=1, semilla=0, tamano_lote=TAMANO_LOTE, bearoff=None):
+    """
+    Estima las probabilidades de ganar, gammon y backgammon de una posición jugándola muchas veces
+
+    Args:
+        origen (Game or Position): Posición a evaluar, desde el punto de vista del jugador con el turno
+        partidas (int): Cantidad máxima de partidas
+        politica (str): Política de ambos jugadores ("codiciosa", "aleatoria" o "primera")
+        truncar (int): Tiradas a jugar antes de cortar y estimar por pip count (None juega hasta el final)
+        error_objetivo (float): Error estándar de la equidad con el que se detiene antes (None no se detiene)
+        minimo (int): Partidas mínimas antes de aplicar la regla de detención
+        procesos (int): Cantidad de procesos (None usa todos los núcleos)
+        semilla (int): Semilla de la rotación de dados y de las políticas
+        tamano_lote (int): Partidas por tarea; la regla de detención se revisa después de cada lote
+        bearoff (str): Archivo de la base de bear off de un lado (requiere numpy). Si la posición
+                       ya es bear off contra bear off sin gammons posibles se responde con la
+                       tabla sin jugar partidas (partidas=0); si no, se usa para las cortadas
+
+    Returns:
+        ResultadoRollout: Probabilidades medias, equidad y su error estándar
+
+    Raises:
+        ValueError: Si los parámetros no son válidos o la partida ya terminó
+    """
+    if isinstance(origen, Game):
+        if origen.juego_terminado():
+            raise ValueError("No se puede hacer un rollout de una partida terminada")
+        origen = Position.desde_game(origen)
+    if partidas < 1:
+        raise ValueError("El rollout necesita al menos una partida")
+    if tamano_lote < 1:
+        raise ValueError("El tamaño de lote debe ser al menos 1")
+    if procesos is not None and procesos < 1:
+        raise ValueError("La cantidad de procesos debe ser al menos 1")
+    truncar = MAX_TURNOS if truncar is None else truncar
+
+    base = _abrir_bearoff(bearoff)
+    if base is not None:
+        with base:
+            probabilidad = _probabilidad_bearoff(base, origen.to_board(), origen.get_turno())
+        if probabilidad is not None:
+            return ResultadoRollout(
+                origen.get_turno(), 0, 0, probabilidad, 0.0, 0.0, 0.0, 0.0, 2.0 * probabilidad - 1.0, 0.0,
+            )
+
+    tareas = [
+        (origen.to_bytes(), inicio, min(inicio + tamano_lote, partidas), politica, semilla, truncar, bearoff)
+        for inicio in range(0, partidas, tamano_lote)
+    ]
+
+    sumas = [0.0] * 5
+    truncadas = 0
+    cantidad = 0
+    media = 0.0
+    m2 = 0.0  # Suma de cuadrados de desvíos de la equidad (algoritmo de Welford)
+
+    def lotes():
+        if procesos == 1:
+            for tarea in tareas:
+                yield _jugar_lote(tarea)
+            return
+        cantidad_procesos = procesos or os.cpu_count() or 1
+        detener = Event()
+        pool = Pool(processes=cantidad_procesos, initializer=_iniciar_proceso, initargs=(detener,))
+        pendientes = deque()
+        try:
+            siguientes = iter(tareas)
+            for tarea in siguientes:
+                pendientes.append(pool.apply_async(_jugar_lote, (tarea,)))
+                if len(pendientes) >= LOTES_EN_VUELO * cantidad_procesos:
+                    break
+            # Los lotes se leen en el orden en que se enviaron: la detención es reproducible
+            while pendientes:
+                lote = pendientes.popleft().get()
+                tarea = next(siguientes, None)
+                if tarea is not None:
+                    pendientes.append(pool.apply_async(_jugar_lote, (tarea,)))
+                yield lote
+        finally:
+            # Al detenerse por el error estándar los lotes en vuelo cortan después de la partida en
+            # curso y se descartan. Se espera a que vuelvan antes de terminate: matar un proceso
+            # mientras escribe su resultado deja tomado el lock de la cola y terminate se bloquea
+            detener.set()
+            for pendiente in pendientes:
+                pendiente.wait()
+            pool.terminate()
+            pool.join()
+
+    iterador = lotes()
+    try:
+        for lote in iterador:
+            for resultado in lote:
+                for i in range(5):
+                    sumas[i] += resultado[i]
+                truncadas += resultado[5]
+                cantidad += 1
+                valor = _equidad(*resultado[:5])
+                delta = valor - media
+                media += delta / cantidad
+                m2 += delta * (valor - media)
+            error = math.sqrt(m2 / (cantidad - 1) / cantidad) if cantidad > 1 else float("inf")
+            if error_objetivo is not None and cantidad >= minimo and error <= error_objetivo:
+                break
+    finally:
+        # Con procesos, cierra el generador y con él el pool
+        iterador.close()
+
+    promedios = [suma / cantidad for suma in sumas]
+    return ResultadoRollout(
+        origen.get_turno(), cantidad, truncadas, *promedios, _equidad(*promedios), error,
+    )
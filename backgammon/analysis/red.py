@@ -0,0 +1,227 @@
+"""
+Evaluador de posiciones con una red neuronal al estilo TD-Gammon (NumPy)
+
+La red es un perceptrón multicapa con sigmoides que recibe la codificación de Tesauro
+(198 entradas) o la compacta (100), según su primera capa, desde el punto de vista del
+jugador con el turno (ver codificacion.py). Devuelve cinco probabilidades, en el mismo
+orden que ResultadoRollout: ganar, ganar_gammon, ganar_backgammon, perder_gammon y
+perder_backgammon.
+
+Se evalúa de a lotes: todas las posiciones del lote pasan por una sola multiplicación de
+matrices por capa, así que las jugadas candidatas de una tirada (cientos con algunos
+dobles) se puntúan con una única llamada.
+"""
+
+import numpy as np
+
+from backgammon.analysis.busqueda import puntos_ganados
+from backgammon.analysis.codificacion import CODIFICADORES, ENTRADAS_TESAURO
+from backgammon.core.board import RIVAL
+
+ENTRADAS = ENTRADAS_TESAURO
+OCULTAS = 80
+SALIDAS = 5
+
+# Coeficientes de cada salida en la equidad: 2g - 1 + gg - pg + gbg - pbg
+_COEFICIENTES_EQUIDAD = np.array([2.0, 1.0, 1.0, -1.0, -1.0])
+
+
+def _tablero(casillas):
+    # Vista sin copia de las 28 casillas del tablero compacto (array de bytes con signo)
+    return np.frombuffer(casillas, dtype=np.int8)
+
+
+def _codificador(entradas):
+    if entradas not in CODIFICADORES:
+        raise ValueError(f"No hay codificación de {entradas} entradas")
+    return CODIFICADORES[entradas]
+
+
+def _sigmoide(x):
+    # Forma con tanh: no desborda para valores muy negativos
+    return 0.5 * (1.0 + np.tanh(0.5 * x))
+
+
+class RedNeuronal:
+    """
+    Red neuronal de evaluación de posiciones
+
+    Se puede usar directamente como evaluador de Busqueda: llamarla con (board, color)
+    retorna la equidad del jugador con el turno, y evaluar_jugadas puntúa todas las
+    jugadas de una tirada de una vez.
+
+    Atributos:
+    __pesos__ (list): Matrices (entradas, salidas) de cada capa
+    __sesgos__ (list): Vectores de sesgo de cada capa
+    __dtype__ (numpy.dtype): Tipo de los pesos y de los cálculos
+    __codificador__ (callable): Codificación de posiciones que corresponde a la primera capa
+    """
+    __slots__ = ("__pesos__", "__sesgos__", "__dtype__", "__codificador__")
+
+    def __init__(self, capas=(ENTRADAS, OCULTAS, SALIDAS), semilla=None, dtype=np.float32):
+        """
+        Crea una red con pesos iniciales al azar
+
+        Args:
+            capas (tuple): Cantidad de unidades por capa, de la entrada (198 o 100) a la salida
+            semilla (int): Semilla de los pesos iniciales
+            dtype: Tipo de los pesos (float32 por defecto)
+
+        Raises:
+            ValueError: Si hay menos de dos capas o ninguna codificación tiene esas entradas
+        """
+        if len(capas) < 2:
+            raise ValueError("La red necesita al menos una capa de entrada y una de salida")
+        self.__codificador__ = _codificador(capas[0])
+        rng = np.random.default_rng(semilla)
+        self.__dtype__ = np.dtype(dtype)
+        self.__pesos__ = []
+        self.__sesgos__ = []
+        for entrada, salida in zip(capas, capas[1:]):
+            limite = 1.0 / np.sqrt(entrada)
+            self.__pesos__.append(rng.uniform(-limite, limite, (entrada, salida)).astype(self.__dtype__))
+            self.__sesgos__.append(np.zeros(salida, dtype=self.__dtype__))
+
+    @classmethod
+    def cargar(cls, ruta, dtype=np.float32):
+        """
+        Carga una red guardada con guardar()
+
+        Args:
+            ruta (str): Archivo .npz
+            dtype: Tipo al que se convierten los pesos
+
+        Returns:
+            RedNeuronal: La red cargada
+        """
+        with np.load(ruta) as datos:
+            cantidad = int(datos["capas"])
+            pesos = [datos[f"pesos_{i}"] for i in range(cantidad)]
+            sesgos = [datos[f"sesgos_{i}"] for i in range(cantidad)]
+        red = cls.__new__(cls)
+        red.__dtype__ = np.dtype(dtype)
+        red.__pesos__ = [matriz.astype(red.__dtype__) for matriz in pesos]
+        red.__sesgos__ = [vector.astype(red.__dtype__) for vector in sesgos]
+        red.__codificador__ = _codificador(red.__pesos__[0].shape[0])
+        return red
+
+    def guardar(self, ruta, **metadatos):
+        """
+        Guarda los pesos en un archivo .npz
+
+        Args:
+            ruta (str or file): Archivo .npz (o archivo abierto en modo binario)
+            **metadatos: Valores extra que se guardan junto a los pesos (cargar los ignora)
+        """
+        datos = {clave: np.asarray(valor) for clave, valor in metadatos.items()}
+        datos["capas"] = np.array(len(self.__pesos__))
+        for i, (pesos, sesgos) in enumerate(zip(self.__pesos__, self.__sesgos__)):
+            datos[f"pesos_{i}"] = pesos
+            datos[f"sesgos_{i}"] = sesgos
+        np.savez(ruta, **datos)
+
+    def get_capas(self):
+        """
+        Retorna la cantidad de unidades de cada capa
+        """
+        return (self.__pesos__[0].shape[0],) + tuple(pesos.shape[1] for pesos in self.__pesos__)
+
+    def get_dtype(self):
+        return self.__dtype__
+
+    def get_pesos(self):
+        """
+        Retorna las listas de matrices de pesos y de sesgos (las mismas que usa la red)
+        """
+        return self.__pesos__, self.__sesgos__
+
+    def propagar(self, entradas):
+        """
+        Propaga un lote por la red y retorna las activaciones de todas las capas
+
+        Args:
+            entradas (numpy.ndarray): Matriz (n, entradas)
+
+        Returns:
+            list: Activaciones de cada capa, empezando por las entradas
+        """
+        activaciones = [np.asarray(entradas, dtype=self.__dtype__)]
+        for pesos, sesgos in zip(self.__pesos__, self.__sesgos__):
+            activaciones.append(_sigmoide(activaciones[-1] @ pesos + sesgos))
+        return activaciones
+
+    def evaluar_lote(self, entradas):
+        """
+        Evalúa un lote de posiciones codificadas
+
+        Args:
+            entradas (numpy.ndarray): Matriz (n, entradas)
+
+        Returns:
+            numpy.ndarray: Matriz (n, 5) de probabilidades
+        """
+        salida = np.asarray(entradas, dtype=self.__dtype__)
+        for pesos, sesgos in zip(self.__pesos__, self.__sesgos__):
+            salida = _sigmoide(salida @ pesos + sesgos)
+        return salida
+
+    def equidades(self, probabilidades):
+        """
+        Convierte una matriz (n, 5) de probabilidades en las n equidades
+        """
+        return probabilidades @ _COEFICIENTES_EQUIDAD.astype(self.__dtype__) - 1.0
+
+    def codificar(self, posiciones, color="blanco", salida=None):
+        """
+        Codifica un lote de posiciones (n, 24) o (n, 28) con la codificación de la red
+        """
+        return self.__codificador__(posiciones, color, salida)
+
+    def probabilidades(self, board, color):
+        """
+        Retorna las cinco probabilidades de la posición para el jugador con el turno
+        """
+        entradas = self.__codificador__(_tablero(board.get_casillas()), color)
+        return tuple(float(valor) for valor in self.evaluar_lote(entradas)[0])
+
+    def evaluar(self, board, color):
+        """
+        Retorna la equidad de la posición para el jugador con el turno
+        """
+        entradas = self.__codificador__(_tablero(board.get_casillas()), color)
+        return float(self.equidades(self.evaluar_lote(entradas))[0])
+
+    __call__ = evaluar
+
+    def evaluar_jugadas(self, board, color, jugadas):
+        """
+        Puntúa todas las jugadas de `color` con una sola evaluación del lote
+
+        Cada jugada se aplica, se copia el tablero resultante a una fila de un lote y se
+        revierte; después el lote se codifica con el rival en turno y se evalúa entero. Las
+        jugadas que terminan la partida valen los puntos ganados.
+
+        Args:
+            board (Board): Tablero (queda igual que al principio)
+            color (str): Color del jugador que mueve
+            jugadas (list): Jugadas legales de la tirada
+
+        Returns:
+            numpy.ndarray: Equidad para `color` después de cada jugada
+        """
+        rival = RIVAL[color]
+        casillas = board.get_casillas()
+        tableros = np.empty((len(jugadas), 28), dtype=np.int8)
+        terminadas = {}
+        for indice, jugada in enumerate(jugadas):
+            comidas = [board.aplicar_movimiento(desde, hacia, color) for desde, hacia, _ in jugada]
+            puntos = puntos_ganados(board, color)
+            if puntos:
+                terminadas[indice] = puntos
+            tableros[indice] = _tablero(casillas)
+            for (desde, hacia, _), comio in zip(reversed(jugada), reversed(comidas)):
+                board.revertir_movimiento(desde, hacia, color, comio)
+        valores = -self.equidades(self.evaluar_lote(self.__codificador__(tableros, rival)))
+        for indice, puntos in terminadas.items():
+            valores[indice] = puntos
+        return valores
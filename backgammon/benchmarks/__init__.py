@@ -0,0 +1,4 @@
+"""
+Benchmarks del core de Backgammon
+Se ejecutan como módulos, por ejemplo: python -m backgammon.benchmarks.bench_memoria
+"""
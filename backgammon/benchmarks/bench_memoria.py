@@ -0,0 +1,48 @@
+"""
+Benchmark de memoria: cuántos bytes ocupa cada partida viva y cada ficha creada
+
+Uso: python -m backgammon.benchmarks.bench_memoria [cantidad_de_partidas]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from backgammon.core.checker import Checker
+from backgammon.core.game import Game
+
+
+def medir_bytes_por_objeto(fabrica, cantidad):
+    """
+    Mide la memoria retenida promedio por objeto creado con `fabrica`
+
+    Args:
+        fabrica (callable): Función sin argumentos que crea un objeto
+        cantidad (int): Cantidad de objetos que se mantienen vivos a la vez
+
+    Returns:
+        float: Bytes retenidos por objeto
+    """
+    gc.collect()
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    objetos = [fabrica() for _ in range(cantidad)]
+    usado = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+    del objetos
+    return usado / cantidad
+
+
+def main(cantidad=10000):
+    """Ejecuta el benchmark e imprime los resultados"""
+    por_partida = medir_bytes_por_objeto(lambda: Game("Blanco", "Negro"), cantidad)
+    por_ficha = medir_bytes_por_objeto(lambda: Checker("blanco"), cantidad)
+
+    print(f"Partidas vivas: {cantidad}")
+    print(f"Bytes por Game:      {por_partida:10.1f}")
+    print(f"Bytes por Checker(): {por_ficha:10.1f}  (instancia compartida por color)")
+    print(f"Total estimado para {cantidad} partidas: {por_partida * cantidad / 1024 / 1024:.2f} MiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
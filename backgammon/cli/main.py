@@ -6,6 +6,7 @@ Interfaz de línea de comandos para Backgammon
 import sys
 from backgammon.core.game import Game
 from backgammon.core.exceptions import MovimientoInvalidoError, JuegoTerminadoError
+from backgammon.analysis.busqueda import Busqueda
 
 
 class BackgammonCLI:
@@ -16,6 +17,8 @@ class BackgammonCLI:
         self.__running__ = True
         self.__dados_disponibles__ = []
         self.__dados_usados__ = []
+        # Una sola búsqueda para toda la sesión: su tabla de transposición sirve entre sugerencias
+        self.__busqueda__ = Busqueda(profundidad=2)
 
     def run(self):
         """Ejecuta el juego"""
@@ -47,7 +50,7 @@ class BackgammonCLI:
             jugador = self.__game__.get_turno_actual()
             color = "⚪" if jugador.get_color() == "blanco" else "⚫"
             print(f"\n🎯 Turno: {jugador.get_name()} {color}")
-            print("Comandos: nueva, tablero, dados, mover, pasar, ayuda, salir")
+            print("Comandos: nueva, tablero, dados, mover, jugadas, sugerir, pasar, ayuda, salir")
         else:
             print("\n📋 MENÚ:")
             print("1. nueva - Crear partida")
@@ -69,6 +72,10 @@ class BackgammonCLI:
             'mover': self._mover_ficha,
             'm': self._mover_ficha,
             '4': self._mover_ficha,
+            'jugadas': self._ver_jugadas,
+            'j': self._ver_jugadas,
+            'sugerir': self._sugerir_jugada,
+            'su': self._sugerir_jugada,
             'pasar': self._cambiar_turno,
             'p': self._cambiar_turno,
             '5': self._cambiar_turno,
@@ -136,6 +143,8 @@ class BackgammonCLI:
             
             # Fichas fuera
             print("Fichas fuera - Blancas: 0 | Negras: 0")
+            pips = self.__game__.get_pips()
+            print(f"Pips - Blancas: {pips['blanco']} | Negras: {pips['negro']}")
             print()
             
             # Parte superior del tablero (posiciones 13-24)
@@ -163,19 +172,8 @@ class BackgammonCLI:
         if not self.__game__:
             return []
             
-        puntos = self.__game__.get_board().get_puntos()
-        posiciones = []
-        
-        for punto in puntos:
-            if len(punto) == 0:
-                posiciones.append(0)
-            else:
-                color = punto[0].get_color()
-                cantidad = len(punto)
-                if color == "blanco":
-                    posiciones.append(cantidad)
-                else:
-                    posiciones.append(-cantidad)
+        # El tablero ya guarda los conteos con signo (+ blancas, - negras)
+        posiciones = list(self.__game__.get_board().get_casillas()[:24])
         
         return posiciones
 
@@ -184,10 +182,10 @@ class BackgammonCLI:
         if not self.__game__:
             return {"blancas": 0, "negras": 0}
             
-        barra = self.__game__.get_board().get_barra()
+        board = self.__game__.get_board()
         return {
-            "blancas": len(barra.get("blanco", [])),
-            "negras": len(barra.get("negro", []))
+            "blancas": board.get_cantidad_barra("blanco"),
+            "negras": board.get_cantidad_barra("negro")
         }
     
     def _mostrar_fila_superior(self, posiciones):
@@ -345,6 +343,10 @@ class BackgammonCLI:
                 print("2 movimientos disponibles")
             
             print(f"Dados disponibles: {self.__dados_disponibles__}")
+            
+            if not self.__game__.tiene_movimiento_legal(self.__dados_disponibles__):
+                print("🚫 No hay movimientos posibles con esta tirada. Se pasa el turno.")
+                self._cambiar_turno()
                 
         except JuegoTerminadoError:
             print("❌ El juego terminó")
@@ -410,6 +412,9 @@ class BackgammonCLI:
             if self.__game__.juego_terminado():
                 ganador = self.__game__.get_ganador()
                 print(f"\n🏆 ¡JUEGO TERMINADO! Ganador: {ganador.get_name()}")
+            elif self.__dados_disponibles__ and not self.__game__.tiene_movimiento_legal(self.__dados_disponibles__):
+                print(f"🚫 No hay movimientos posibles con {self.__dados_disponibles__}. Se pasa el turno.")
+                self._cambiar_turno()
                 
         except ValueError:
             print("❌ Ingrese números válidos")
@@ -420,6 +425,49 @@ class BackgammonCLI:
         except Exception as e:
             print(f"❌ Error: {e}")
 
+    def _ver_jugadas(self):
+        """Muestra las jugadas legales con los dados disponibles"""
+        if not self.__game__:
+            print("❌ No hay partida. Use 'nueva' para iniciar.")
+            return
+            
+        if not self.__dados_disponibles__:
+            print("❌ No hay dados disponibles. Use 'dados' para tirar primero.")
+            return
+            
+        jugadas = self.__game__.movimientos_legales(self.__dados_disponibles__)
+        if not jugadas:
+            print("🚫 No hay movimientos posibles. Use 'pasar' para cambiar turno.")
+            return
+            
+        print(f"\n📋 JUGADAS LEGALES ({len(jugadas)}) con dados {self.__dados_disponibles__}:")
+        for jugada in jugadas:
+            print("   " + "  ".join(self._formatear_movimiento(desde, hacia) for desde, hacia, _ in jugada))
+
+    def _sugerir_jugada(self):
+        """Muestra la mejor jugada según la búsqueda de 2 jugadas"""
+        if not self.__game__:
+            print("❌ No hay partida. Use 'nueva' para iniciar.")
+            return
+            
+        if not self.__dados_disponibles__:
+            print("❌ No hay dados disponibles. Use 'dados' para tirar primero.")
+            return
+            
+        jugada, equidad = self.__busqueda__.mejor_jugada(self.__game__, self.__dados_disponibles__)
+        if jugada is None:
+            print("🚫 No hay movimientos posibles. Use 'pasar' para cambiar turno.")
+            return
+            
+        movimientos = "  ".join(self._formatear_movimiento(desde, hacia) for desde, hacia, _ in jugada)
+        print(f"\n🤖 SUGERENCIA con dados {self.__dados_disponibles__}: {movimientos} (equidad {equidad:+.3f})")
+
+    def _formatear_movimiento(self, desde, hacia):
+        """Convierte un movimiento con índices 0-based a la notación de puntos 1-24"""
+        origen = "barra" if desde == -1 else str(desde + 1)
+        destino = "fuera" if hacia == -1 else str(hacia + 1)
+        return f"{origen}/{destino}"
+
     def _cambiar_turno(self):
         """Cambia el turno"""
         if not self.__game__:
@@ -452,6 +500,9 @@ class BackgammonCLI:
         print("   tablero  - Ver tablero")
         print("   dados    - Tirar dados")
         print("   mover    - Mover ficha")
+        print("   jugadas  - Ver jugadas legales")
+        print("   sugerir  - Sugerir la mejor jugada (búsqueda a 2 jugadas: menos de 1 s en")
+        print("              tiradas comunes, unos segundos con dobles en medio de la partida)")
         print("   pasar    - Cambiar turno")
         print("   ayuda    - Ver ayuda")
         print("   salir    - Terminar")
@@ -1,4 +1,6 @@
 class Player:
+    __slots__ = ("__nombre__", "__color__")
+
     def __init__(self, nombre, color):
         self.__nombre__ = nombre
         self.__color__ = color
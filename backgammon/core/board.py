@@ -1,79 +1,556 @@
+from array import array
+from collections.abc import Mapping, Sequence
+
 from backgammon.core.checker import Checker
+from backgammon.core.zobrist import CLAVES, CLAVES_ESPEJO, ESPEJO, MAX_CONTEO, hash_casillas, hash_espejo
+
+# Disposición del arreglo de casillas del tablero:
+# - índices 0-23: puntos del tablero, conteo con signo (+ blanco, - negro)
+# - índices 24-25: fichas en la barra de blanco y de negro
+# - índices 26-27: fichas sacadas (bear off) de blanco y de negro
+TOTAL_CASILLAS = 28
+BARRA = {"blanco": 24, "negro": 25}
+SACADAS = {"blanco": 26, "negro": 27}
+SIGNO = {"blanco": 1, "negro": -1}
+RIVAL = {"blanco": "negro", "negro": "blanco"}
+
+# Tablas por color y punto para mantener los agregados del tablero
+# Pips: distancia de una ficha en cada punto hasta salir del tablero (la barra vale 25)
+PIPS = {
+    "blanco": tuple(i + 1 for i in range(24)),
+    "negro": tuple(24 - i for i in range(24)),
+}
+PIPS_BARRA = 25
+# Puntos fuera del cuadrante de casa de cada jugador (blanco: índices 0-5, negro: 18-23)
+FUERA_DE_CASA = {
+    "blanco": tuple(i >= 6 for i in range(24)),
+    "negro": tuple(i <= 17 for i in range(24)),
+}
+# Puntos dentro del cuadrante de casa del rival
+EN_CASA_RIVAL = {
+    "blanco": tuple(i >= 18 for i in range(24)),
+    "negro": tuple(i <= 5 for i in range(24)),
+}
+
+POSICION_INICIAL = (
+    -2, 0, 0, 0, 0, 5, 0, 3, 0, 0, 0, -5,
+    5, 0, 0, 0, -3, 0, -5, 0, 0, 0, 0, 2,
+    0, 0, 0, 0,
+)
+
+
+def espejar_casillas(casillas):
+    """
+    Intercambia los colores de un arreglo de 28 casillas: el punto i pasa a 23 - i con el signo
+    invertido y la barra y las fichas sacadas de cada color pasan a las del otro
+
+    Returns:
+        array: Casillas nuevas (array("b"))
+    """
+    espejadas = array("b", bytes(TOTAL_CASILLAS))
+    for indice, destino in enumerate(ESPEJO):
+        espejadas[destino] = -casillas[indice] if indice < 24 else casillas[indice]
+    return espejadas
+
+
+class VistaFichas(Sequence):
+    """
+    Vista perezosa de solo lectura de las fichas de una casilla del tablero
+    Se comporta como la lista de Checker que usaba el tablero antes del arreglo compacto
+    """
+    __slots__ = ("__casillas__", "__indice__", "__color__")
+
+    def __init__(self, casillas, indice, color=None):
+        """
+        Args:
+            casillas (array): Arreglo de casillas del tablero
+            indice (int): Casilla que representa la vista
+            color (str): Color fijo de las fichas (barra); None para deducirlo del signo
+        """
+        self.__casillas__ = casillas
+        self.__indice__ = indice
+        self.__color__ = color
+
+    def _color(self):
+        if self.__color__ is not None:
+            return self.__color__
+        return "blanco" if self.__casillas__[self.__indice__] > 0 else "negro"
+
+    def __len__(self):
+        return abs(self.__casillas__[self.__indice__])
+
+    def __getitem__(self, i):
+        cantidad = len(self)
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(cantidad))]
+        if i < 0:
+            i += cantidad
+        if not 0 <= i < cantidad:
+            raise IndexError("No hay ficha en esa posición del punto")
+        return Checker(self._color())
+
+    def __iter__(self):
+        cantidad = len(self)
+        if cantidad:
+            color = self._color()
+            for _ in range(cantidad):
+                yield Checker(color)
+
+    def __repr__(self):
+        return repr([str(ficha) for ficha in self])
+
+
+class VistaPuntos(Sequence):
+    """
+    Vista perezosa de los 24 puntos del tablero como secuencia de VistaFichas
+    """
+    __slots__ = ("__casillas__",)
+
+    def __init__(self, casillas):
+        self.__casillas__ = casillas
+
+    def __len__(self):
+        return 24
+
+    def __getitem__(self, i):
+        indices = range(24)[i]
+        if isinstance(indices, range):
+            return [VistaFichas(self.__casillas__, k) for k in indices]
+        return VistaFichas(self.__casillas__, indices)
+
+    def __iter__(self):
+        casillas = self.__casillas__
+        for i in range(24):
+            yield VistaFichas(casillas, i)
+
+
+class VistaBarra(Mapping):
+    """
+    Vista perezosa de la barra como diccionario {"blanco": fichas, "negro": fichas}
+    """
+    __slots__ = ("__fichas__",)
+
+    def __init__(self, casillas):
+        self.__fichas__ = {
+            color: VistaFichas(casillas, indice, color) for color, indice in BARRA.items()
+        }
+
+    def __getitem__(self, color):
+        return self.__fichas__[color]
+
+    def __iter__(self):
+        return iter(self.__fichas__)
+
+    def __len__(self):
+        return len(self.__fichas__)
+
 
 class Board:
     """
     Representa el tablero de la partida de backgammon
-    
+
     Atributos:
-    __puntos__ (list):lista de 24 listas,cada una representa un punto en el tablero
-    __barra__(dict):Fichas capturadas de cada jugador
+    __casillas__ (array): arreglo compacto de 28 enteros con signo (puntos, barra y fichas sacadas)
+    __puntos__ (VistaPuntos): vista compatible de 24 puntos, cada uno como secuencia de Checker
+    __barra__ (VistaBarra): vista compatible de las fichas capturadas de cada jugador
+    __en_tablero__ (dict): fichas de cada color sobre los 24 puntos
+    __fuera_de_casa__ (dict): fichas de cada color en puntos fuera de su cuadrante de casa
+    __en_casa_rival__ (dict): fichas de cada color dentro del cuadrante de casa del rival
+    __pips__ (dict): pip count de cada color (incluye la barra)
+    __ocupados__ (dict): máscara de bits de los puntos ocupados por cada color (bit i = punto i)
+    __zobrist__ (int): hash de Zobrist de 64 bits de la posición
+    __zobrist_espejo__ (int): hash de Zobrist del tablero espejado (colores intercambiados)
     """
+    __slots__ = (
+        "__casillas__", "__vista_puntos__", "__vista_barra__", "__en_tablero__",
+        "__fuera_de_casa__", "__en_casa_rival__", "__pips__", "__ocupados__", "__zobrist__",
+        "__zobrist_espejo__",
+    )
+
     def __init__(self):
         """
         Inicializa el tablero con la configuración estandar del Backgammon
         """
-        self.__puntos__=[[]for _ in range(24)]
-        self.__barra__={"blanco":[],"negro":[]}
+        self.__casillas__ = array("b", bytes(TOTAL_CASILLAS))
+        # Las vistas de compatibilidad se crean recién cuando alguien las pide
+        self.__vista_puntos__ = None
+        self.__vista_barra__ = None
+        self.__en_tablero__ = {"blanco": 0, "negro": 0}
+        self.__fuera_de_casa__ = {"blanco": 0, "negro": 0}
+        self.__en_casa_rival__ = {"blanco": 0, "negro": 0}
+        self.__pips__ = {"blanco": 0, "negro": 0}
+        self.__ocupados__ = {"blanco": 0, "negro": 0}
+        self.__zobrist__ = 0
+        self.__zobrist_espejo__ = 0
         self.inicializar_tablero()
-    
+
     def inicializar_tablero(self):
         """
-        Coloca las fichas en la posición inicial estándar de Backgammon usando objetos Checker
-        """
-        self.__puntos__ = [[] for _ in range(24)]
-        # Fichas del jugador blanco
-        self.__puntos__[23] = [Checker("blanco"), Checker("blanco")]                
-        self.__puntos__[12] = [Checker("blanco") for _ in range(5)]             
-        self.__puntos__[7]  = [Checker("blanco") for _ in range(3)]             
-        self.__puntos__[5]  = [Checker("blanco") for _ in range(5)]             
-        # Fichas del jugador negro
-        self.__puntos__[0]  = [Checker("negro"), Checker("negro")]                
-        self.__puntos__[11] = [Checker("negro") for _ in range(5)]             
-        self.__puntos__[16] = [Checker("negro") for _ in range(3)]             
-        self.__puntos__[18] = [Checker("negro") for _ in range(5)]             
-        # Limpio la barra
-        self.__barra__ = {"blanco": [], "negro": []}
-    
+        Coloca las fichas en la posición inicial estándar de Backgammon y limpia barra y fichas sacadas
+        """
+        self.__casillas__[:] = array("b", POSICION_INICIAL)
+        self._recalcular_agregados()
+
+    def cargar_casillas(self, casillas):
+        """
+        Carga el tablero completo desde 28 conteos sin construir objetos Checker
+
+        Args:
+            casillas: Secuencia de 28 enteros o buffer de bytes con signo (mismo formato que get_casillas)
+
+        Raises:
+            ValueError: Si no hay exactamente 28 casillas
+        """
+        nuevas = array("b", casillas)
+        if len(nuevas) != TOTAL_CASILLAS:
+            raise ValueError(f"El tablero necesita {TOTAL_CASILLAS} casillas, se recibieron {len(nuevas)}")
+        self.__casillas__[:] = nuevas
+        self._recalcular_agregados()
+
+    def _recalcular_agregados(self):
+        """
+        Recalcula desde cero los agregados del tablero (solo para cargas completas)
+        """
+        for color, signo in SIGNO.items():
+            pips = PIPS[color]
+            fuera = FUERA_DE_CASA[color]
+            rival = EN_CASA_RIVAL[color]
+            en_tablero = fuera_de_casa = en_casa_rival = total_pips = ocupados = 0
+            for punto in range(24):
+                cantidad = self.__casillas__[punto] * signo
+                if cantidad > 0:
+                    ocupados |= 1 << punto
+                    en_tablero += cantidad
+                    total_pips += pips[punto] * cantidad
+                    if fuera[punto]:
+                        fuera_de_casa += cantidad
+                    if rival[punto]:
+                        en_casa_rival += cantidad
+            self.__en_tablero__[color] = en_tablero
+            self.__fuera_de_casa__[color] = fuera_de_casa
+            self.__en_casa_rival__[color] = en_casa_rival
+            self.__pips__[color] = total_pips + PIPS_BARRA * self.__casillas__[BARRA[color]]
+            self.__ocupados__[color] = ocupados
+        self.__zobrist__ = hash_casillas(self.__casillas__)
+        self.__zobrist_espejo__ = hash_espejo(self.__casillas__)
+
+    def _set_casilla(self, indice, conteo):
+        """
+        Cambia el conteo de una casilla actualizando los hashes de Zobrist en O(1)
+        """
+        anterior = self.__casillas__[indice] + MAX_CONTEO
+        nuevo = conteo + MAX_CONTEO
+        claves = CLAVES[indice]
+        self.__zobrist__ ^= claves[anterior] ^ claves[nuevo]
+        claves = CLAVES_ESPEJO[indice]
+        self.__zobrist_espejo__ ^= claves[anterior] ^ claves[nuevo]
+        self.__casillas__[indice] = conteo
+
+    def _actualizar_agregados(self, color, punto, delta):
+        """
+        Actualiza los agregados al agregar (delta=1) o quitar (delta=-1) una ficha de un punto
+        """
+        self.__en_tablero__[color] += delta
+        self.__pips__[color] += PIPS[color][punto] * delta
+        if FUERA_DE_CASA[color][punto]:
+            self.__fuera_de_casa__[color] += delta
+        if EN_CASA_RIVAL[color][punto]:
+            self.__en_casa_rival__[color] += delta
+
     def agregar_ficha(self, color, punto):
         """
         Agrega una ficha a un punto del tablero
+
+        Raises:
+            ValueError: Si el punto está ocupado por fichas del otro color
         """
-        self.__puntos__[punto].append(Checker(color))
-    
+        conteo = self.__casillas__[punto]
+        signo = SIGNO[color]
+        if conteo * signo < 0:
+            raise ValueError(f"El punto {punto} está ocupado por fichas del otro color")
+        if conteo == 0:
+            self.__ocupados__[color] |= 1 << punto
+        self._set_casilla(punto, conteo + signo)
+        self._actualizar_agregados(color, punto, 1)
+
     def quitar_ficha(self, punto):
         """
         Quita una ficha de un punto del tablero
         """
-        if self.__puntos__[punto] == []:
+        conteo = self.__casillas__[punto]
+        if conteo == 0:
             return False
-        else:
-            self.__puntos__[punto].pop()                
-            return True
-    
+        color = "blanco" if conteo > 0 else "negro"
+        if conteo == SIGNO[color]:
+            self.__ocupados__[color] &= ~(1 << punto)
+        self._set_casilla(punto, conteo - SIGNO[color])
+        self._actualizar_agregados(color, punto, -1)
+        return True
+
     def agregar_barra(self, color):
         """
         Agrega una ficha a la barra
         """
-        self.__barra__[color].append(Checker(color))
-    
+        indice = BARRA[color]
+        self._set_casilla(indice, self.__casillas__[indice] + 1)
+        self.__pips__[color] += PIPS_BARRA
+
     def quitar_barra(self, color):
         """
         Quita una ficha de la barra
         """
-        if self.__barra__[color] == []:
+        indice = BARRA[color]
+        if self.__casillas__[indice] == 0:
             return False
+        self._set_casilla(indice, self.__casillas__[indice] - 1)
+        self.__pips__[color] -= PIPS_BARRA
+        return True
+
+    def agregar_sacada(self, color):
+        """
+        Suma una ficha sacada del tablero (bear off) al contador del jugador
+        """
+        indice = SACADAS[color]
+        self._set_casilla(indice, self.__casillas__[indice] + 1)
+
+    def quitar_sacada(self, color):
+        """
+        Devuelve al tablero el conteo de una ficha sacada (para deshacer un bear off)
+        """
+        indice = SACADAS[color]
+        if self.__casillas__[indice] == 0:
+            return False
+        self._set_casilla(indice, self.__casillas__[indice] - 1)
+        return True
+
+    def aplicar_movimiento(self, desde, hacia, color):
+        """
+        Aplica un movimiento ya validado: si el destino tiene una ficha solitaria del rival la manda a la barra
+
+        Args:
+            desde (int): Punto de origen (-1 para la barra)
+            hacia (int): Punto de destino (-1 para bear off)
+            color (str): Color de la ficha que se mueve
+
+        Returns:
+            bool: True si se comió una ficha del rival
+        """
+        comio = hacia != -1 and self.__casillas__[hacia] * SIGNO[color] < 0
+        if comio:
+            self.quitar_ficha(hacia)
+            self.agregar_barra(RIVAL[color])
+
+        if desde == -1:
+            self.quitar_barra(color)
         else:
-            self.__barra__[color].pop()
+            self.quitar_ficha(desde)
+
+        if hacia == -1:
+            self.agregar_sacada(color)
+        else:
+            self.agregar_ficha(color, hacia)
+        return comio
+
+    def revertir_movimiento(self, desde, hacia, color, comio):
+        """
+        Revierte un movimiento aplicado con aplicar_movimiento
+        """
+        if hacia == -1:
+            self.quitar_sacada(color)
+        else:
+            self.quitar_ficha(hacia)
+
+        if desde == -1:
+            self.agregar_barra(color)
+        else:
+            self.agregar_ficha(color, desde)
+
+        if comio:
+            rival = RIVAL[color]
+            self.quitar_barra(rival)
+            self.agregar_ficha(rival, hacia)
+
+    def get_conteo(self, punto):
+        """
+        Obtiene la cantidad de fichas de un punto con signo (+ blanco, - negro)
+        """
+        return self.__casillas__[punto]
+
+    def get_color(self, punto):
+        """
+        Obtiene el color de las fichas de un punto, None si está vacío
+        """
+        conteo = self.__casillas__[punto]
+        if conteo > 0:
+            return "blanco"
+        if conteo < 0:
+            return "negro"
+        return None
+
+    def get_cantidad_barra(self, color):
+        """
+        Obtiene la cantidad de fichas de un jugador en la barra
+        """
+        return self.__casillas__[BARRA[color]]
+
+    def get_sacadas(self):
+        """
+        Obtiene las fichas sacadas por bear off de cada jugador
+
+        Returns:
+            dict: {"blanco": int, "negro": int}
+        """
+        return {color: self.__casillas__[indice] for color, indice in SACADAS.items()}
+
+    def set_sacadas(self, sacadas):
+        """
+        Establece las fichas sacadas por bear off de cada jugador
+
+        Args:
+            sacadas (dict): {"blanco": int, "negro": int}
+        """
+        for color, indice in SACADAS.items():
+            self._set_casilla(indice, sacadas.get(color, 0))
+
+    def get_fichas_en_tablero(self, color):
+        """
+        Obtiene la cantidad de fichas de un jugador sobre los 24 puntos (sin contar la barra)
+        """
+        return self.__en_tablero__[color]
+
+    def get_fuera_de_casa(self, color):
+        """
+        Obtiene la cantidad de fichas de un jugador en puntos fuera de su cuadrante de casa
+        """
+        return self.__fuera_de_casa__[color]
+
+    def get_en_casa_rival(self, color):
+        """
+        Obtiene la cantidad de fichas de un jugador dentro del cuadrante de casa del rival
+        """
+        return self.__en_casa_rival__[color]
+
+    def get_pips(self, color):
+        """
+        Obtiene el pip count de un jugador (las fichas en la barra cuentan 25)
+        """
+        return self.__pips__[color]
+
+    def get_ocupados(self, color):
+        """
+        Obtiene la máscara de bits de los puntos ocupados por un jugador (bit i = punto i)
+        """
+        return self.__ocupados__[color]
+
+    def get_mas_atrasada(self, color):
+        """
+        Obtiene el punto de la ficha más atrasada de un jugador sobre los 24 puntos (sin la barra)
+
+        Returns:
+            int or None: Índice del punto (el más alto para blanco, el más bajo para negro) o
+                         None si no tiene fichas en los puntos
+        """
+        ocupados = self.__ocupados__[color]
+        if not ocupados:
+            return None
+        if color == "blanco":
+            return ocupados.bit_length() - 1
+        return (ocupados & -ocupados).bit_length() - 1
+
+    def hay_contacto(self):
+        """
+        Indica si las fichas de los dos jugadores todavía pueden cruzarse
+
+        No hay contacto cuando todas las fichas blancas están en puntos más bajos que todas
+        las negras. Una ficha en la barra siempre cuenta como contacto.
+        """
+        casillas = self.__casillas__
+        if casillas[BARRA["blanco"]] or casillas[BARRA["negro"]]:
             return True
-    
+        blancas = self.__ocupados__["blanco"]
+        negras = self.__ocupados__["negro"]
+        if not blancas or not negras:
+            return False
+        return blancas.bit_length() > (negras & -negras).bit_length()
+
+    def hash(self):
+        """
+        Obtiene el hash de Zobrist de 64 bits de la posición (no incluye el turno)
+        """
+        return self.__zobrist__
+
+    def hash_espejo(self):
+        """
+        Obtiene el hash del tablero espejado (igual a espejar().hash()), mantenido en O(1)
+        """
+        return self.__zobrist_espejo__
+
+    def hash_canonico(self, color):
+        """
+        Obtiene el hash de la forma canónica: la posición vista desde `color`, que mueve como blanco
+
+        Una posición con negro al turno y su espejo con blanco al turno tienen el mismo hash
+        canónico, así las cachés guardan una sola entrada para las dos.
+        """
+        if color == "blanco":
+            return self.__zobrist__
+        return self.__zobrist_espejo__
+
+    def espejar(self):
+        """
+        Retorna un tablero nuevo con los colores intercambiados
+        """
+        board = Board()
+        board.cargar_casillas(espejar_casillas(self.__casillas__))
+        return board
+
+    def get_casillas(self):
+        """
+        Obtiene el arreglo compacto de casillas (no debe modificarse desde afuera)
+        """
+        return self.__casillas__
+
     def get_puntos(self):
         """
         Obtiene los puntos del tablero
         """
-        return self.__puntos__
-    
+        if self.__vista_puntos__ is None:
+            self.__vista_puntos__ = VistaPuntos(self.__casillas__)
+        return self.__vista_puntos__
+
     def get_barra(self):
         """
         Obtiene la barra del tablero
         """
-        return self.__barra__
+        if self.__vista_barra__ is None:
+            self.__vista_barra__ = VistaBarra(self.__casillas__)
+        return self.__vista_barra__
+
+    def _get_puntos_compat(self):
+        return self.get_puntos()
+
+    def _set_puntos_compat(self, puntos):
+        """
+        Carga los 24 puntos desde listas de fichas (formato anterior del tablero)
+        """
+        for i, punto in enumerate(puntos):
+            fichas = list(punto)
+            if fichas:
+                self.__casillas__[i] = SIGNO[fichas[0].get_color()] * len(fichas)
+            else:
+                self.__casillas__[i] = 0
+        self._recalcular_agregados()
+
+    def _get_barra_compat(self):
+        return self.get_barra()
+
+    def _set_barra_compat(self, barra):
+        """
+        Carga la barra desde un diccionario de listas de fichas (formato anterior del tablero)
+        """
+        for color, indice in BARRA.items():
+            self.__casillas__[indice] = len(barra.get(color, []))
+        self._recalcular_agregados()
+
+    __puntos__ = property(_get_puntos_compat, _set_puntos_compat)
+    __barra__ = property(_get_barra_compat, _set_barra_compat)
@@ -0,0 +1,143 @@
+from collections import OrderedDict
+
+from backgammon.core.jugadas import espejar_jugada, generar_jugadas
+
+CAPACIDAD_POR_DEFECTO = 4096
+
+
+class CacheJugadas:
+    """
+    Caché LRU acotada de jugadas legales por posición y tirada
+
+    La clave es (hash canónico del tablero, dados ordenados), así que las dos formas de
+    escribir una misma tirada ([3, 1] y [1, 3]) comparten entrada, y también una posición con
+    negro al turno y su espejo con blanco al turno. Las jugadas se guardan en la forma canónica
+    (como las jugaría blanco), ordenadas, y se espejan al devolverlas a negro: el orden de la
+    lista no depende de qué color llenó la entrada ni de si la caché está activa. Cuando la
+    posición no está, genera las jugadas con generar_jugadas y las guarda; al superar la
+    capacidad descarta la entrada usada hace más tiempo.
+
+    Atributos:
+    __capacidad__ (int): Cantidad máxima de entradas
+    __entradas__ (OrderedDict): Clave -> jugadas, de la menos a la más usada recientemente
+    __aciertos__ (int): Consultas resueltas desde la caché
+    __fallos__ (int): Consultas que tuvieron que generar las jugadas
+    __desalojos__ (int): Entradas descartadas por falta de lugar
+    """
+    __slots__ = ("__capacidad__", "__entradas__", "__aciertos__", "__fallos__", "__desalojos__")
+
+    def __init__(self, capacidad=CAPACIDAD_POR_DEFECTO):
+        """
+        Crea una caché vacía
+
+        Args:
+            capacidad (int): Cantidad máxima de posiciones guardadas (0 desactiva la caché)
+
+        Raises:
+            ValueError: Si la capacidad es negativa
+        """
+        self.__entradas__ = OrderedDict()
+        self.__aciertos__ = 0
+        self.__fallos__ = 0
+        self.__desalojos__ = 0
+        self.set_capacidad(capacidad)
+
+    def obtener(self, board, color, dados):
+        """
+        Retorna las jugadas legales de un jugador para una tirada
+
+        Args:
+            board (Board): Tablero a analizar
+            color (str): Color del jugador que mueve
+            dados (list): Valores de la tirada ([a, b] o [d, d, d, d])
+
+        Returns:
+            list: Jugadas legales en orden determinista (una lista nueva en cada llamada, se
+                  puede modificar)
+        """
+        clave = (board.hash_canonico(color), tuple(sorted(dados)))
+        entradas = self.__entradas__
+        jugadas = entradas.get(clave)
+        if jugadas is not None:
+            self.__aciertos__ += 1
+            entradas.move_to_end(clave)
+            if color == "blanco":
+                return list(jugadas)
+            return [espejar_jugada(jugada) for jugada in jugadas]
+
+        self.__fallos__ += 1
+        # Se generan siempre como blanco (sobre el espejo si mueve negro) para que la secuencia
+        # elegida para cada posición final sea la misma sin importar el color
+        if color != "blanco":
+            board = board.espejar()
+        canonicas = tuple(sorted(generar_jugadas(board, "blanco", dados)))
+        if self.__capacidad__ > 0:
+            entradas[clave] = canonicas
+            if len(entradas) > self.__capacidad__:
+                entradas.popitem(last=False)
+                self.__desalojos__ += 1
+        if color == "blanco":
+            return list(canonicas)
+        return [espejar_jugada(jugada) for jugada in canonicas]
+
+    def get_capacidad(self):
+        """
+        Retorna la cantidad máxima de entradas
+        """
+        return self.__capacidad__
+
+    def set_capacidad(self, capacidad):
+        """
+        Cambia la capacidad, descartando las entradas más viejas si sobran
+
+        Raises:
+            ValueError: Si la capacidad es negativa
+        """
+        if capacidad < 0:
+            raise ValueError("La capacidad de la caché no puede ser negativa")
+        self.__capacidad__ = capacidad
+        while len(self.__entradas__) > capacidad:
+            self.__entradas__.popitem(last=False)
+            self.__desalojos__ += 1
+
+    def get_aciertos(self):
+        return self.__aciertos__
+
+    def get_fallos(self):
+        return self.__fallos__
+
+    def get_desalojos(self):
+        return self.__desalojos__
+
+    def get_estadisticas(self):
+        """
+        Retorna los contadores de la caché
+
+        Returns:
+            dict: tamaño, capacidad, aciertos, fallos, desalojos y tasa de aciertos
+        """
+        consultas = self.__aciertos__ + self.__fallos__
+        return {
+            "tamaño": len(self.__entradas__),
+            "capacidad": self.__capacidad__,
+            "aciertos": self.__aciertos__,
+            "fallos": self.__fallos__,
+            "desalojos": self.__desalojos__,
+            "tasa_aciertos": self.__aciertos__ / consultas if consultas else 0.0,
+        }
+
+    def limpiar(self):
+        """
+        Vacía la caché y reinicia los contadores
+        """
+        self.__entradas__.clear()
+        self.__aciertos__ = 0
+        self.__fallos__ = 0
+        self.__desalojos__ = 0
+
+    def __len__(self):
+        return len(self.__entradas__)
+
+
+# Caché compartida por Game, las interfaces y los bots del mismo proceso
+CACHE_JUGADAS = CacheJugadas()
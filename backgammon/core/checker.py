@@ -1,12 +1,29 @@
 class Checker:
     """
     Representa una ficha de Backgammon
+
+    Una ficha solo tiene color, así que hay una única instancia inmutable por color
+    que se comparte en todo el programa (Checker("blanco") is Checker("blanco"))
     """
-    def __init__(self, color):
+    __slots__ = ("__color__",)
+    _instancias = {}
+
+    def __new__(cls, color):
         """
-        Inicializa una ficha con el color del jugador
+        Retorna la ficha compartida del color del jugador, creándola la primera vez
         """
-        self.__color__ = color
+        ficha = cls._instancias.get(color)
+        if ficha is None:
+            ficha = object.__new__(cls)
+            object.__setattr__(ficha, "__color__", color)
+            cls._instancias[color] = ficha
+        return ficha
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError("Checker es inmutable")
+
+    def __reduce__(self):
+        return (Checker, (self.__color__,))
 
     def get_color(self):
         """Devuelve el color de la ficha"""
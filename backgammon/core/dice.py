@@ -1,28 +1,116 @@
 import random
 
+# Las 36 tiradas posibles (dado1, dado2), indexadas por 6 * (dado1 - 1) + (dado2 - 1)
+TIRADAS = tuple((dado1, dado2) for dado1 in range(1, 7) for dado2 in range(1, 7))
+
+# Un byte aleatorio b < 252 (7 * 36) se convierte en la tirada b % 36 sin sesgo;
+# los bytes 252-255 se descartan (muestreo por rechazo)
+_LIMITE_BYTE = 252
+_BYTE_A_TIRADA = bytes(b % 36 if b < _LIMITE_BYTE else 0 for b in range(256))
+_BYTES_DESCARTADOS = bytes(range(_LIMITE_BYTE, 256))
+
+
 class Dice:
-    def __init__(self):
+    __slots__ = (
+        "__dado1__", "__dado2__", "__tirada_doble__", "__rng__", "__tamano_buffer__", "__buffer__", "__posicion__",
+    )
+
+    def __init__(self, rng=None, semilla=None, tamano_buffer=0):
         """
         Inicializa dos dados de seis caras
+
+        Sin rng ni semilla usa el generador global del módulo random, como siempre.
+
+        Args:
+            rng (random.Random): Generador propio de los dados, o una fuente compatible como
+                                 rotacion.DadosRotados (con randint y randbytes)
+            semilla (int): Semilla para crear un generador propio (se ignora si se pasa rng)
+            tamano_buffer (int): Si es mayor que 0, las tiradas se generan de a bloques de
+                                 este tamaño con una sola llamada al generador y se consumen
+                                 de a una en tirar()
         """
+        if tamano_buffer < 0:
+            raise ValueError("El tamaño del buffer no puede ser negativo")
         self.__dado1__ = 0
         self.__dado2__ = 0
         self.__tirada_doble__ = False
+        if rng is None and semilla is not None:
+            rng = random.Random(semilla)
+        self.__rng__ = rng
+        self.__tamano_buffer__ = tamano_buffer
+        self.__buffer__ = b""
+        self.__posicion__ = 0
     def tirar(self):
         """
         Tira los dos dados y retorna los valores
         Si es doble, los valores se repiten
         """
-        self.__dado1__ = random.randint(1, 6)
-        self.__dado2__ = random.randint(1, 6)
+        if self.__tamano_buffer__:
+            if self.__posicion__ >= len(self.__buffer__):
+                self.__buffer__ = self._generar_tiradas(self.__tamano_buffer__)
+                self.__posicion__ = 0
+            self.__dado1__, self.__dado2__ = TIRADAS[self.__buffer__[self.__posicion__]]
+            self.__posicion__ += 1
+        elif self.__rng__ is not None:
+            self.__dado1__ = self.__rng__.randint(1, 6)
+            self.__dado2__ = self.__rng__.randint(1, 6)
+        else:
+            self.__dado1__ = random.randint(1, 6)
+            self.__dado2__ = random.randint(1, 6)
         self.__tirada_doble__ = (self.__dado1__ == self.__dado2__)
         return self.get_valores()
+
+    def tirar_lote(self, cantidad):
+        """
+        Genera muchas tiradas de una vez sin cambiar los valores de la última tirada
+
+        Usa el mismo flujo aleatorio que tirar(): en modo buffer consume primero lo que
+        quedó generado.
+
+        Args:
+            cantidad (int): Cantidad de tiradas
+
+        Returns:
+            list: Tuplas (dado1, dado2)
+        """
+        if cantidad < 0:
+            raise ValueError("La cantidad de tiradas no puede ser negativa")
+        if not self.__tamano_buffer__:
+            return [TIRADAS[tirada] for tirada in self._generar_tiradas(cantidad)]
+
+        pendientes = self.__buffer__[self.__posicion__:self.__posicion__ + cantidad]
+        self.__posicion__ += len(pendientes)
+        if len(pendientes) < cantidad:
+            pendientes += self._generar_tiradas(cantidad - len(pendientes))
+        return [TIRADAS[tirada] for tirada in pendientes]
+
+    def _generar_tiradas(self, cantidad):
+        """
+        Genera `cantidad` tiradas (índices 0-35 en bytes) con bloques de bytes aleatorios
+        """
+        randbytes = self.__rng__.randbytes if self.__rng__ is not None else random.randbytes
+        tiradas = b""
+        while len(tiradas) < cantidad:
+            # Se piden solo los bytes que faltan (así una fuente que ya entrega índices de
+            # tirada, como DadosRotados, no pierde ninguna) y se repite por los descartados
+            datos = randbytes(cantidad - len(tiradas))
+            tiradas += datos.translate(_BYTE_A_TIRADA, _BYTES_DESCARTADOS)
+        return tiradas
+
+    def reiniciar(self):
+        """
+        Vuelve los dados al estado inicial conservando el generador
+        """
+        self.__dado1__ = 0
+        self.__dado2__ = 0
+        self.__tirada_doble__ = False
+
     def get_valores(self):
         """
         Retorna lista con los valores de los dados,si es doble, repite el valor 4 veces
         """
         if self.__tirada_doble__:
-            return [self.__dado1__] * 4  
+            return [self.__dado1__] * 4
         else:
             return [self.__dado1__, self.__dado2__]
 
@@ -31,7 +119,7 @@ class Dice:
         Retorna True si la última tirada fue doble
         """
         return self.__tirada_doble__
-    
+
     def get_dado1(self):
         return self.__dado1__
 
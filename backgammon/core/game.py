@@ -1,6 +1,15 @@
-from backgammon.core.board import Board
+from backgammon.core.board import Board, SIGNO
 from backgammon.core.Player import Player
+from backgammon.core.cache import CACHE_JUGADAS
 from backgammon.core.dice import Dice
+from backgammon.core.jugadas import existe_movimiento, posiciones_finales
+from backgammon.core.movimiento import Movimiento
+from backgammon.core.position import Position
+from backgammon.core.reglas import (
+    DESTINO_FUERA_DE_RANGO, JUEGO_TERMINADO, ORIGEN_FUERA_DE_RANGO, VALIDO, describir_motivo, validar_movimiento,
+)
+from backgammon.core.tablas import DISTANCIA, ENTRADA_INVALIDA, SACAR_DESDE_BARRA
+from backgammon.core.zobrist import CLAVE_TURNO_NEGRO
 from backgammon.core.exceptions import GameError, MovimientoInvalidoError, JuegoTerminadoError
 
 
@@ -8,13 +17,21 @@ class Game:
     """
     Clase principal que coordina el flujo general del juego de Backgammon
     """
-    def __init__(self, nombre_jugador1, nombre_jugador2):
+    __slots__ = (
+        "__board__", "__player1__", "__player2__", "__dice__", "__turno_actual__",
+        "__juego_terminado__", "__ganador__", "__tipo_victoria__", "__historial__", "__rehechos__",
+        "__cache__",
+    )
+    
+    def __init__(self, nombre_jugador1, nombre_jugador2, cache=None, dice=None):
         """
         Inicializa una nueva partida de Backgammon
         
         Args:
             nombre_jugador1 (str): Nombre del primer jugador
             nombre_jugador2 (str): Nombre del segundo jugador
+            cache (CacheJugadas): Caché de jugadas legales (por defecto la compartida del proceso)
+            dice (Dice): Dados a usar, por ejemplo con un generador o semilla propia
             
         Raises:
             ValueError: Si los nombres son inválidos
@@ -27,12 +44,40 @@ class Game:
         self.__board__ = Board()
         self.__player1__ = Player(nombre_jugador1, "blanco")
         self.__player2__ = Player(nombre_jugador2, "negro")
-        self.__dice__ = Dice()
+        self.__dice__ = Dice() if dice is None else dice
         self.__turno_actual__ = self.__player1__  
         self.__juego_terminado__ = False
         self.__ganador__ = None
         self.__tipo_victoria__ = None  # "simple", "gammon", "backgammon"
-        self.__fichas_sacadas__ = {"blanco": 0, "negro": 0}  # Contador de fichas sacadas por bear off
+        self.__historial__ = []  # Movimientos realizados, para deshacer
+        self.__rehechos__ = []  # Movimientos deshechos, para rehacer
+        self.__cache__ = CACHE_JUGADAS if cache is None else cache
+    
+    @classmethod
+    def desde_posicion(cls, posicion, nombre_jugador1="Jugador Blanco", nombre_jugador2="Jugador Negro"):
+        """
+        Crea una partida nueva a partir de una posición
+        
+        Args:
+            posicion (Position): Posición inicial de la partida
+            nombre_jugador1 (str): Nombre del jugador blanco
+            nombre_jugador2 (str): Nombre del jugador negro
+            
+        Returns:
+            Game: Partida con el tablero y el turno de la posición
+        """
+        game = cls(nombre_jugador1, nombre_jugador2)
+        game.cargar_posicion(posicion)
+        return game
+    
+    def _get_fichas_sacadas_compat(self):
+        return self.__board__.get_sacadas()
+    
+    def _set_fichas_sacadas_compat(self, sacadas):
+        self.__board__.set_sacadas(sacadas)
+    
+    # Contador de fichas sacadas por bear off, guardado en el arreglo compacto del tablero
+    __fichas_sacadas__ = property(_get_fichas_sacadas_compat, _set_fichas_sacadas_compat)
     
     def get_board(self):
         """
@@ -88,6 +133,53 @@ class Game:
         else:
             self.__turno_actual__ = self.__player1__
     
+    def get_posicion(self):
+        """
+        Retorna una instantánea inmutable de la posición actual
+        
+        Returns:
+            Position: Tablero, barra, fichas sacadas y jugador que mueve
+        """
+        return Position.desde_game(self)
+    
+    def cargar_posicion(self, posicion):
+        """
+        Carga una posición en la partida sin construir objetos Checker
+        El estado de fin de juego se reinicia
+        
+        Args:
+            posicion (Position): Posición a cargar
+        """
+        self.__board__.cargar_casillas(posicion.get_casillas())
+        if posicion.get_turno() == "blanco":
+            self.__turno_actual__ = self.__player1__
+        else:
+            self.__turno_actual__ = self.__player2__
+        self.__juego_terminado__ = False
+        self.__ganador__ = None
+        self.__tipo_victoria__ = None
+        self.limpiar_historial()
+    
+    def hash(self):
+        """
+        Retorna el hash de Zobrist de la posición incluyendo el jugador que mueve
+        
+        Returns:
+            int: Hash de 64 bits, actualizado en O(1) con cada movimiento
+        """
+        if self.__turno_actual__.get_color() == "negro":
+            return self.__board__.hash() ^ CLAVE_TURNO_NEGRO
+        return self.__board__.hash()
+    
+    def hash_canonico(self):
+        """
+        Retorna el hash de la forma canónica de la posición (el jugador que mueve como blanco)
+
+        Returns:
+            int: Igual para una posición con negro al turno y su espejo con blanco al turno
+        """
+        return self.__board__.hash_canonico(self.__turno_actual__.get_color())
+
     def tirar_dados(self):
         """
         Tira los dados y retorna los valores
@@ -112,89 +204,173 @@ class Game:
             hacia (int): Punto de destino (-1 para eliminar ficha)
             valor_dado (int): Valor del dado a usar para el movimiento
             
+        Returns:
+            Movimiento: Registro del movimiento, que se puede deshacer con deshacer()
+            
         Raises:
             JuegoTerminadoError: Si el juego ya terminó
             MovimientoInvalidoError: Si el movimiento no es válido
         """
-        if self.__juego_terminado__:
-            raise JuegoTerminadoError("No se pueden hacer movimientos en un juego terminado")
-        
         color_actual = self.__turno_actual__.get_color()
-        
-        # Validar posiciones
-        if desde != -1 and not 0 <= desde <= 23:
-            raise ValueError("La posición de origen debe estar entre 0 y 23 o ser -1")
-        if hacia != -1 and not 0 <= hacia <= 23:
-            raise ValueError("La posición de destino debe estar entre 0 y 23 o ser -1")
-        
-        # No se puede mover al mismo punto
-        if desde == hacia:
-            raise MovimientoInvalidoError("No se puede mover una ficha al mismo punto")
-        
-        # Verificar que hay fichas en el punto de origen
-        if desde == -1:
-            # Mover desde la barra
-            if len(self.__board__.get_barra()[color_actual]) == 0:
-                raise MovimientoInvalidoError("No hay fichas en la barra para reintroducir")
-        else:
-            # Mover desde un punto del tablero
-            puntos = self.__board__.get_puntos()
-            if len(puntos[desde]) == 0:
-                raise MovimientoInvalidoError(f"No hay fichas en el punto {desde}")
-            if puntos[desde][0].get_color() != color_actual:
-                raise MovimientoInvalidoError(f"Las fichas en el punto {desde} no son del color {color_actual}")
-        
-        # Validar distancia del movimiento (reglas del Backgammon)
-        if valor_dado is not None:
-            distancia = self._calcular_distancia(desde, hacia, color_actual)
-            # Para bear off (hacia == -1), permitir dados mayores o iguales
-            if hacia == -1:
-                if valor_dado < distancia:
-                    raise MovimientoInvalidoError(f"El dado ({valor_dado}) es menor que la distancia necesaria ({distancia}) para guardar esta ficha")
-            else:
-                # Para movimientos normales, debe ser exacto
-                if distancia != valor_dado:
-                    raise MovimientoInvalidoError(f"El movimiento debe usar exactamente el valor del dado ({valor_dado}), distancia: {distancia}")
-        
-        # Verificar destino
-        if hacia == -1:
-            # Eliminar ficha (llevar a casa - bear off)
-            if desde == -1:
-                raise MovimientoInvalidoError("No se puede eliminar una ficha ya en la barra")
-            # Verificar que el jugador pueda hacer bear off
-            if not self._puede_hacer_bear_off(color_actual):
-                cuadrante_casa = "puntos 1-6" if color_actual == "blanco" else "puntos 19-24"
-                raise MovimientoInvalidoError(f"Solo puedes sacar fichas cuando todas tus fichas están en tu cuadrante de casa ({cuadrante_casa})")
-        else:
-            # Mover a un punto del tablero
-            puntos = self.__board__.get_puntos()
-            
-            # Verificar si el punto está ocupado por el oponente
-            if len(puntos[hacia]) > 0 and puntos[hacia][0].get_color() != color_actual:
-                if len(puntos[hacia]) > 1:
-                    raise MovimientoInvalidoError(f"El punto {hacia} está bloqueado por el oponente")
-                # Si hay solo una ficha del oponente, se puede "comer"
-                ficha_comida = puntos[hacia][0]
-                self.__board__.quitar_ficha(hacia)
-                self.__board__.agregar_barra(ficha_comida.get_color())
+        codigo = self.es_movimiento_valido(desde, hacia, valor_dado)
+        if codigo != VALIDO:
+            mensaje = describir_motivo(codigo, color_actual, desde, hacia, valor_dado)
+            if codigo == JUEGO_TERMINADO:
+                raise JuegoTerminadoError(mensaje)
+            if codigo in (ORIGEN_FUERA_DE_RANGO, DESTINO_FUERA_DE_RANGO):
+                raise ValueError(mensaje)
+            raise MovimientoInvalidoError(mensaje)
+        
+        # Si hay una sola ficha del oponente en el destino, se la "come"
+        board = self.__board__
+        comio = hacia != -1 and board.get_conteo(hacia) * SIGNO[color_actual] < 0
           
         # Realizar el movimiento
-        if desde == -1:
-            # Reintroducir ficha desde la barra
-            self.__board__.quitar_barra(color_actual)
-        else:
-            # Mover desde un punto del tablero
-            self.__board__.quitar_ficha(desde)
-        
-        if hacia != -1:
-            # Mover a un punto del tablero
-            self.__board__.agregar_ficha(color_actual, hacia)
-        else:
-            # Bear off: la ficha se saca del tablero
-            self.__fichas_sacadas__[color_actual] += 1
+        board.aplicar_movimiento(desde, hacia, color_actual)
         
         # Verificar si el movimiento resultó en una victoria
         self.verificar_ganador()
+        
+        movimiento = Movimiento(desde, hacia, valor_dado, color_actual, comio, hacia == -1, self.__juego_terminado__)
+        self.__historial__.append(movimiento)
+        self.__rehechos__.clear()
+        return movimiento
+    
+    def es_movimiento_valido(self, desde, hacia, valor_dado=None):
+        """
+        Verifica un movimiento del jugador actual sin lanzar excepciones ni modificar el juego
+        
+        Args:
+            desde (int): Punto de origen (-1 para fichas en barra)
+            hacia (int): Punto de destino (-1 para eliminar ficha)
+            valor_dado (int): Valor del dado a usar para el movimiento
+            
+        Returns:
+            int: reglas.VALIDO (0) si mover_ficha aceptaría el movimiento, o el código del motivo
+        """
+        if self.__juego_terminado__:
+            return JUEGO_TERMINADO
+        return validar_movimiento(self.__board__, self.__turno_actual__.get_color(), desde, hacia, valor_dado)
+    
+    def deshacer(self):
+        """
+        Deshace el último movimiento en O(1), sin copiar el tablero
+        Si ese movimiento había terminado la partida, la partida vuelve a estar en juego
+        
+        Returns:
+            Movimiento or None: El movimiento deshecho, None si no hay movimientos
+        """
+        if not self.__historial__:
+            return None
+        movimiento = self.__historial__.pop()
+        self.__board__.revertir_movimiento(movimiento.desde, movimiento.hacia, movimiento.color, movimiento.comio)
+        if movimiento.fin:
+            self.__juego_terminado__ = False
+            self.__ganador__ = None
+            self.__tipo_victoria__ = None
+        self.__rehechos__.append(movimiento)
+        return movimiento
+    
+    def rehacer(self):
+        """
+        Vuelve a aplicar el último movimiento deshecho en O(1)
+        
+        Returns:
+            Movimiento or None: El movimiento rehecho, None si no hay movimientos deshechos
+        """
+        if not self.__rehechos__:
+            return None
+        movimiento = self.__rehechos__.pop()
+        self.__board__.aplicar_movimiento(movimiento.desde, movimiento.hacia, movimiento.color)
+        if movimiento.fin:
+            self.verificar_ganador()
+        self.__historial__.append(movimiento)
+        return movimiento
+    
+    def limpiar_historial(self):
+        """
+        Descarta los movimientos guardados para deshacer y rehacer
+        """
+        self.__historial__.clear()
+        self.__rehechos__.clear()
+    
+    def movimientos_legales(self, dados):
+        """
+        Genera todas las jugadas legales completas del jugador actual para una tirada
+        
+        Args:
+            dados (list): Valores de la tirada (por ejemplo el resultado de tirar_dados)
+            
+        Returns:
+            list: Jugadas, cada una una tupla de movimientos (desde, hacia, dado) que se
+                  pueden aplicar en orden con mover_ficha; lista vacía si no se puede mover
+        """
+        if self.__juego_terminado__:
+            return []
+        return self.__cache__.obtener(self.__board__, self.__turno_actual__.get_color(), dados)
+    
+    def tiene_movimiento_legal(self, dados):
+        """
+        Indica si el jugador actual puede mover con alguno de los dados, sin generar jugadas
+        
+        Args:
+            dados (list): Valores de dados disponibles
+            
+        Returns:
+            bool: False si la tirada no se puede jugar (el turno se pasa) o el juego terminó
+        """
+        if self.__juego_terminado__ or not dados:
+            return False
+        return existe_movimiento(self.__board__, self.__turno_actual__.get_color(), dados)
+    
+    def dado_para_movimiento(self, desde, hacia, dados):
+        """
+        Elige con qué dado de la tirada se juega un movimiento suelto del jugador actual
+        
+        El movimiento se acepta si forma parte de alguna jugada legal de la tirada. Como cada
+        jugada guarda un solo orden de movimientos por posición final, alcanza con que los dados
+        que quedan todavía lleguen a la posición final de alguna jugada legal.
+        
+        Args:
+            desde (int): Punto de origen (-1 para fichas en barra)
+            hacia (int): Punto de destino (-1 para eliminar ficha)
+            dados (list): Valores de dados disponibles
+            
+        Returns:
+            int or None: El menor dado con el que se puede jugar, None si el movimiento no
+                         empieza ninguna jugada legal
+        """
+        jugadas = self.movimientos_legales(dados) if dados else []
+        if not jugadas:
+            return None
+        board = self.__board__
+        color = self.__turno_actual__.get_color()
+        legales = None
+        for dado in sorted(set(dados)):
+            if self.es_movimiento_valido(desde, hacia, dado) != VALIDO:
+                continue
+            if any(jugada[0] == (desde, hacia, dado) for jugada in jugadas):
+                return dado
+            if legales is None:
+                legales = posiciones_finales(board, color, jugadas)
+            resto = list(dados)
+            resto.remove(dado)
+            comio = board.aplicar_movimiento(desde, hacia, color)
+            siguientes = self.__cache__.obtener(board, color, resto) if resto else []
+            alcanzables = posiciones_finales(board, color, siguientes) or {board.hash()}
+            board.revertir_movimiento(desde, hacia, color, comio)
+            if alcanzables & legales:
+                return dado
+        return None
+    
+    def get_cache(self):
+        """
+        Retorna la caché de jugadas legales que usa la partida
+        
+        Returns:
+            CacheJugadas: Caché de jugadas (compartida por defecto)
+        """
+        return self.__cache__
     
     def _calcular_distancia(self, desde, hacia, color):
         """
@@ -208,43 +384,20 @@ class Game:
         Returns:
             int: Distancia entre los puntos
         """
-        if desde == -1:  # Desde la barra
-            if hacia == -1:  # Bear off desde barra (no permitido)
-                raise MovimientoInvalidoError("No se puede sacar una ficha desde la barra")
-            if color == "blanco":
-                # Jugador blanco reintroduce en el cuadrante del oponente (puntos 19-24, índices 18-23)
-                # Dado 1 → punto 24 (idx 23), dado 6 → punto 19 (idx 18)
-                if hacia < 18:  # Solo puede entrar en puntos 19-24
-                    raise MovimientoInvalidoError("Blanco solo puede reintroducir en puntos 19-24")
-                return 24 - hacia  # Dado 1 = distancia 1 (hacia idx=23), dado 6 = distancia 6 (hacia idx=18)
-            else:
-                # Jugador negro reintroduce en el cuadrante del oponente (puntos 1-6, índices 0-5)
-                # Dado 1 → punto 1 (idx 0), dado 6 → punto 6 (idx 5)
-                if hacia > 5:  # Solo puede entrar en puntos 1-6
-                    raise MovimientoInvalidoError("Negro solo puede reintroducir en puntos 1-6")
-                return hacia + 1  # Dado 1 = distancia 1 (hacia idx=0), dado 6 = distancia 6 (hacia idx=5)
-        
-        if hacia == -1:  # Bear off (sacando ficha)
+        # La distancia (o el motivo por el que el movimiento no es posible) sale de una tabla precalculada
+        distancia = DISTANCIA[color][desde + 1][hacia + 1]
+        if distancia >= 0:
+            return distancia
+        if distancia == SACAR_DESDE_BARRA:
+            raise MovimientoInvalidoError("No se puede sacar una ficha desde la barra")
+        if distancia == ENTRADA_INVALIDA:
             if color == "blanco":
-                # Blanco: distancia desde punto actual hasta casa (punto 0)
-                return desde + 1
-            else:
-                # Negro: distancia desde punto actual hasta casa (punto 23)
-                return 24 - desde
-        
-        # Para el Backgammon, los jugadores deben avanzar siempre en su dirección:
-        # - Blanco: de 24 a 1 (índices 23 a 0), es decir, índices decrecientes
-        # - Negro: de 1 a 24 (índices 0 a 23), es decir, índices crecientes
-        if color == "blanco":
-            # Blanco retrocede si hacia > desde
-            if hacia > desde:
-                raise MovimientoInvalidoError("El jugador blanco no puede retroceder")
-            return desde - hacia
-        else:
-            # Negro retrocede si hacia < desde
-            if hacia < desde:
-                raise MovimientoInvalidoError("El jugador negro no puede retroceder")
-            return hacia - desde
+                # Blanco reintroduce en el cuadrante del oponente (puntos 19-24, índices 18-23)
+                raise MovimientoInvalidoError("Blanco solo puede reintroducir en puntos 19-24")
+            # Negro reintroduce en el cuadrante del oponente (puntos 1-6, índices 0-5)
+            raise MovimientoInvalidoError("Negro solo puede reintroducir en puntos 1-6")
+        # Blanco avanza de 24 a 1 (índices decrecientes) y negro de 1 a 24 (índices crecientes)
+        raise MovimientoInvalidoError(f"El jugador {color} no puede retroceder")
     
     def _puede_hacer_bear_off(self, color):
         """
@@ -257,32 +410,17 @@ class Game:
         Returns:
             bool: True si puede hacer bear off, False en caso contrario
         """
-        puntos = self.__board__.get_puntos()
-        barra = self.__board__.get_barra()
+        board = self.__board__
         
         # Verificar que no haya fichas en la barra (deben ser reintroducidas primero)
-        if len(barra[color]) > 0:
+        if board.get_cantidad_barra(color) > 0:
             return False
         
         # Verificar que todas las fichas estén en el cuadrante de casa
-        # BLANCO: puntos 0-17 (índices 0-17, pero cuadrante de casa es 0-5)
-        # NEGRO: puntos 7-24 (índices 6-23, pero cuadrante de casa es 18-23)
-        
-        if color == "blanco":
-            # Blanco: cuadrante de casa son los puntos 1-6 (índices 0-5)
-            cuadrante_casa = list(range(6))
-        else:
-            # Negro: cuadrante de casa son los puntos 19-24 (índices 18-23)
-            cuadrante_casa = list(range(18, 24))
-        
-        # Verificar que todas las fichas del jugador estén en su cuadrante de casa
-        for i, punto in enumerate(puntos):
-            for ficha in punto:
-                if ficha.get_color() == color:
-                    if i not in cuadrante_casa:
-                        return False
-        
-        return True
+        # BLANCO: cuadrante de casa son los puntos 1-6 (índices 0-5)
+        # NEGRO: cuadrante de casa son los puntos 19-24 (índices 18-23)
+        # El tablero mantiene este conteo actualizado en cada movimiento
+        return board.get_fuera_de_casa(color) == 0
          
     def verificar_ganador(self):
         """
@@ -292,27 +430,17 @@ class Game:
         Returns:
             Player or None: El ganador si existe, None si no hay ganador aún
         """
-        puntos = self.__board__.get_puntos()
-        barra = self.__board__.get_barra()
+        board = self.__board__
         
         # Contar fichas del jugador blanco en el tablero y en la barra
-        fichas_blancas_en_tablero = 0
-        for punto in puntos:
-            for ficha in punto:
-                if ficha.get_color() == "blanco":
-                    fichas_blancas_en_tablero += 1
-        
-        fichas_blancas_en_barra = len(barra["blanco"])
+        # (el tablero mantiene estos agregados actualizados en cada movimiento)
+        fichas_blancas_en_tablero = board.get_fichas_en_tablero("blanco")
+        fichas_blancas_en_barra = board.get_cantidad_barra("blanco")
         total_fichas_blancas = fichas_blancas_en_tablero + fichas_blancas_en_barra
         
         # Contar fichas del jugador negro en el tablero y en la barra
-        fichas_negras_en_tablero = 0
-        for punto in puntos:
-            for ficha in punto:
-                if ficha.get_color() == "negro":
-                    fichas_negras_en_tablero += 1
-        
-        fichas_negras_en_barra = len(barra["negro"])
+        fichas_negras_en_tablero = board.get_fichas_en_tablero("negro")
+        fichas_negras_en_barra = board.get_cantidad_barra("negro")
         total_fichas_negras = fichas_negras_en_tablero + fichas_negras_en_barra
         
         # Si un jugador no tiene fichas en el tablero ni en la barra, gana
@@ -331,11 +459,7 @@ class Game:
                     self.__tipo_victoria__ = "backgammon"
                 elif fichas_negras_en_tablero > 0:
                     # Verificar si negro tiene fichas en la casa de blanco (puntos 0-5)
-                    fichas_negras_en_casa_blanca = 0
-                    for i in range(6):
-                        for ficha in puntos[i]:
-                            if ficha.get_color() == "negro":
-                                fichas_negras_en_casa_blanca += 1
+                    fichas_negras_en_casa_blanca = board.get_en_casa_rival("negro")
                     if fichas_negras_en_casa_blanca > 0:
                         self.__tipo_victoria__ = "backgammon"
                     else:
@@ -357,11 +481,7 @@ class Game:
                     self.__tipo_victoria__ = "backgammon"
                 elif fichas_blancas_en_tablero > 0:
                     # Verificar si blanco tiene fichas en la casa de negro (puntos 18-23)
-                    fichas_blancas_en_casa_negra = 0
-                    for i in range(18, 24):
-                        for ficha in puntos[i]:
-                            if ficha.get_color() == "blanco":
-                                fichas_blancas_en_casa_negra += 1
+                    fichas_blancas_en_casa_negra = board.get_en_casa_rival("blanco")
                     if fichas_blancas_en_casa_negra > 0:
                         self.__tipo_victoria__ = "backgammon"
                     else:
@@ -424,18 +544,41 @@ class Game:
             dict: {"blanco": int, "negro": int}
         """
         return self.__fichas_sacadas__.copy()
-    
+
+    def get_pips(self, color=None):
+        """
+        Retorna el pip count, que el tablero mantiene actualizado con cada movimiento
+
+        Args:
+            color (str): Color del jugador, o None para los dos
+
+        Returns:
+            int or dict: Pips de `color`, o {"blanco": int, "negro": int} si no se indica color
+        """
+        if color is None:
+            return {"blanco": self.__board__.get_pips("blanco"), "negro": self.__board__.get_pips("negro")}
+        return self.__board__.get_pips(color)
+
+    def es_carrera(self):
+        """
+        Indica si la partida es una carrera: los dos ejércitos ya se cruzaron y no hay contacto
+
+        Returns:
+            bool: True si no hay contacto (consulta en O(1) con las máscaras del tablero)
+        """
+        return not self.__board__.hay_contacto()
+
     def reiniciar_juego(self):
         """
         Reinicia el juego a su estado inicial
         """
         self.__board__ = Board()
-        self.__dice__ = Dice()
+        self.__dice__.reiniciar()
         self.__turno_actual__ = self.__player1__
         self.__juego_terminado__ = False
         self.__ganador__ = None
         self.__tipo_victoria__ = None
-        self.__fichas_sacadas__ = {"blanco": 0, "negro": 0}
+        self.limpiar_historial()
     
     
         
@@ -0,0 +1,189 @@
+"""
+Generador de jugadas legales completas para una tirada
+
+Una jugada es una tupla de movimientos (desde, hacia, dado) con el mismo formato que
+Game.mover_ficha: -1 como origen es la barra y -1 como destino es bear off.
+
+IMPORTANTE - regla de bear off de este juego: un dado mayor o igual a la distancia saca una
+ficha de CUALQUIER punto de la casa, aunque haya fichas propias en puntos más altos. En el
+backgammon estándar un dado mayor solo saca la ficha del punto más alto ocupado; si hay
+fichas más arriba hay que mover una de ellas. Por ejemplo, blanco con fichas en los índices
+5 y 0 y dados [6, 1] puede jugar ((0, -1, 6), (5, 4, 1)), que en el estándar no es legal.
+El generador sigue la regla de Game.mover_ficha (reglas.validar_movimiento) para que toda
+jugada generada se pueda aplicar, y las bases de bear off (analysis.bearoff y
+analysis.bearoff_doble) heredan esta misma regla.
+"""
+
+from backgammon.core.board import BARRA, SIGNO
+from backgammon.core.tablas import DESTINO
+
+# Punto espejado de cada índice; el último elemento hace que -1 (barra o bear off) quede igual
+_ESPEJO_PUNTO = tuple(23 - i for i in range(24)) + (-1,)
+
+
+def espejar_jugada(jugada):
+    """
+    Pasa una jugada al tablero espejado (colores intercambiados)
+
+    Args:
+        jugada (tuple): Movimientos (desde, hacia, dado)
+
+    Returns:
+        tuple: Movimientos con cada punto i en 23 - i; la barra y el bear off no cambian
+    """
+    return tuple((_ESPEJO_PUNTO[desde], _ESPEJO_PUNTO[hacia], dado) for desde, hacia, dado in jugada)
+
+
+def movimientos_simples(board, color, dado):
+    """
+    Lista los movimientos legales de una sola ficha con un dado
+
+    Respeta las mismas reglas que Game.mover_ficha y además obliga a reintroducir
+    primero las fichas de la barra.
+
+    Returns:
+        list: Tuplas (desde, hacia)
+    """
+    casillas = board.get_casillas()
+    signo = SIGNO[color]
+    destinos = DESTINO[color]
+
+    if casillas[BARRA[color]] > 0:
+        hacia = destinos[0][dado]
+        if casillas[hacia] * signo >= -1:
+            return [(-1, hacia)]
+        return []
+
+    puede_sacar = board.get_fuera_de_casa(color) == 0
+    movimientos = []
+    for desde in range(24):
+        if casillas[desde] * signo <= 0:
+            continue
+        hacia = destinos[desde + 1][dado]
+        if hacia == -1:
+            if puede_sacar:
+                movimientos.append((desde, -1))
+        elif casillas[hacia] * signo >= -1:
+            # Punto vacío, propio o con una sola ficha del rival (se come)
+            movimientos.append((desde, hacia))
+    return movimientos
+
+
+def existe_movimiento(board, color, dados):
+    """
+    Indica si al menos un dado de la tirada se puede usar, sin enumerar jugadas completas
+
+    Se detiene en el primer movimiento legal que encuentra. Si ningún dado se puede usar
+    como primer movimiento, la tirada no tiene jugadas y el turno se pasa.
+
+    Args:
+        board (Board): Tablero a analizar
+        color (str): Color del jugador que mueve
+        dados (list): Valores de dados disponibles
+
+    Returns:
+        bool: True si hay algún movimiento legal
+    """
+    casillas = board.get_casillas()
+    signo = SIGNO[color]
+    destinos = DESTINO[color]
+    en_barra = casillas[BARRA[color]] > 0
+    puede_sacar = not en_barra and board.get_fuera_de_casa(color) == 0
+
+    for dado in set(dados):
+        if en_barra:
+            if casillas[destinos[0][dado]] * signo >= -1:
+                return True
+            continue
+        for desde in range(24):
+            if casillas[desde] * signo <= 0:
+                continue
+            hacia = destinos[desde + 1][dado]
+            if hacia == -1:
+                if puede_sacar:
+                    return True
+            elif casillas[hacia] * signo >= -1:
+                return True
+    return False
+
+
+def posiciones_finales(board, color, jugadas):
+    """
+    Hashes de las posiciones a las que llevan las jugadas
+
+    El tablero se modifica durante el recorrido y queda igual que al principio.
+
+    Args:
+        board (Board): Tablero desde el que se aplican las jugadas
+        color (str): Color del jugador que mueve
+        jugadas (list): Jugadas (tuplas de movimientos (desde, hacia, dado))
+
+    Returns:
+        set: Hash de Zobrist del tablero después de cada jugada
+    """
+    finales = set()
+    for jugada in jugadas:
+        comidas = [board.aplicar_movimiento(desde, hacia, color) for desde, hacia, _ in jugada]
+        finales.add(board.hash())
+        for (desde, hacia, _), comio in zip(reversed(jugada), reversed(comidas)):
+            board.revertir_movimiento(desde, hacia, color, comio)
+    return finales
+
+
+def generar_jugadas(board, color, dados):
+    """
+    Genera todas las jugadas legales completas de un jugador para una tirada
+
+    Incluye dobles (cuatro movimientos), reintroducción desde la barra y bear off
+    con dados mayores. Aplica la regla de usar la mayor cantidad de dados posible y,
+    si solo se puede usar uno de dos dados distintos, el mayor. Las secuencias que
+    llegan a la misma posición final se colapsan por hash de Zobrist.
+
+    El tablero se modifica durante la búsqueda y queda igual que al principio.
+
+    Args:
+        board (Board): Tablero a analizar
+        color (str): Color del jugador que mueve
+        dados (list): Valores de la tirada ([a, b] o [d, d, d, d])
+
+    Returns:
+        list: Jugadas (tuplas de movimientos (desde, hacia, dado)); lista vacía si no hay movimientos
+    """
+    finales = {}  # hash de la posición final -> jugada
+    visitados = set()
+    maximo = [0]
+
+    def explorar(restantes, jugada):
+        clave = (board.hash(), restantes)
+        if clave in visitados:
+            return
+        visitados.add(clave)
+
+        hubo_movimiento = False
+        for i, dado in enumerate(restantes):
+            if dado in restantes[:i]:
+                continue
+            siguientes = restantes[:i] + restantes[i + 1:]
+            for desde, hacia in movimientos_simples(board, color, dado):
+                hubo_movimiento = True
+                comio = board.aplicar_movimiento(desde, hacia, color)
+                explorar(siguientes, jugada + ((desde, hacia, dado),))
+                board.revertir_movimiento(desde, hacia, color, comio)
+
+        if not hubo_movimiento and jugada:
+            if len(jugada) > maximo[0]:
+                maximo[0] = len(jugada)
+                finales.clear()
+            if len(jugada) == maximo[0]:
+                finales.setdefault(board.hash(), jugada)
+
+    explorar(tuple(sorted(dados, reverse=True)), ())
+
+    jugadas = list(finales.values())
+    if maximo[0] == 1 and len(set(dados)) == 2:
+        # Si solo se puede usar un dado, hay que usar el mayor cuando es posible
+        mayor = max(dados)
+        con_mayor = [jugada for jugada in jugadas if jugada[0][2] == mayor]
+        if con_mayor:
+            jugadas = con_mayor
+    return jugadas
@@ -0,0 +1,11 @@
+from collections import namedtuple
+
+# Registro compacto de un movimiento ya realizado, suficiente para deshacerlo o rehacerlo en O(1)
+#   desde (int): punto de origen (-1 para la barra)
+#   hacia (int): punto de destino (-1 para bear off)
+#   dado (int or None): valor del dado usado
+#   color (str): color del jugador que movió
+#   comio (bool): True si se comió una ficha solitaria del rival en el destino
+#   sacada (bool): True si la ficha salió del tablero (bear off)
+#   fin (bool): True si el movimiento terminó la partida
+Movimiento = namedtuple("Movimiento", ["desde", "hacia", "dado", "color", "comio", "sacada", "fin"])
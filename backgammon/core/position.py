@@ -0,0 +1,157 @@
+import copyreg
+from array import array
+
+from backgammon.core.board import Board, TOTAL_CASILLAS, espejar_casillas
+from backgammon.core.zobrist import CLAVE_TURNO_NEGRO, hash_casillas
+
+COLORES = ("blanco", "negro")
+
+# Código de extensión de pickle (240-255 es el rango de uso privado, PEP 307). Registrado en
+# copyreg, pickle escribe la clase como un código de 2 bytes en lugar de su ruta completa
+# "backgammon.core.position Position". El proceso que lee tiene que haber importado este
+# módulo, como pasa con cualquier parte del core (los workers importan la función antes que
+# sus argumentos).
+CODIGO_PICKLE = 0xF0
+copyreg.add_extension(__name__, "Position", CODIGO_PICKLE)
+
+
+class Position:
+    """
+    Instantánea inmutable y hasheable de una posición de Backgammon
+
+    Guarda las 28 casillas del tablero compacto (puntos, barra y fichas sacadas) como
+    bytes con signo más un byte con el jugador que mueve. Se puede usar como clave de
+    diccionario, comparar, ordenar y enviar entre procesos con pickle (menos de 64 bytes).
+
+    Atributos:
+    __datos__ (bytes): 28 conteos con signo seguidos del turno (0 blanco, 1 negro)
+    """
+    __slots__ = ("__datos__",)
+
+    def __init__(self, datos):
+        """
+        Crea una posición a partir de su representación en bytes
+
+        Args:
+            datos (bytes): 29 bytes (28 casillas con signo y el turno)
+
+        Raises:
+            ValueError: Si los datos no tienen el largo esperado o el turno es inválido
+        """
+        datos = bytes(datos)
+        if len(datos) != TOTAL_CASILLAS + 1:
+            raise ValueError(f"Una posición necesita {TOTAL_CASILLAS + 1} bytes, se recibieron {len(datos)}")
+        if datos[-1] not in (0, 1):
+            raise ValueError("El byte de turno debe ser 0 (blanco) o 1 (negro)")
+        object.__setattr__(self, "__datos__", datos)
+
+    @classmethod
+    def desde_board(cls, board, turno="blanco"):
+        """
+        Crea una posición a partir de un tablero sin construir objetos Checker
+
+        Args:
+            board (Board): Tablero de origen
+            turno (str): Color del jugador que mueve
+        """
+        return cls(board.get_casillas().tobytes() + bytes((COLORES.index(turno),)))
+
+    @classmethod
+    def desde_game(cls, game):
+        """
+        Crea una posición a partir del tablero y el turno actual de una partida
+        """
+        return cls.desde_board(game.get_board(), game.get_turno_actual().get_color())
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError("Position es inmutable")
+
+    def __delattr__(self, nombre):
+        raise AttributeError("Position es inmutable")
+
+    def get_casillas(self):
+        """
+        Retorna una vista de solo lectura de las 28 casillas (enteros con signo) sin copiar
+        """
+        return memoryview(self.__datos__)[:TOTAL_CASILLAS].cast("b")
+
+    def get_turno(self):
+        """
+        Retorna el color del jugador que mueve
+        """
+        return COLORES[self.__datos__[TOTAL_CASILLAS]]
+
+    def to_bytes(self):
+        """
+        Retorna la representación compacta de la posición
+        """
+        return self.__datos__
+
+    def to_board(self):
+        """
+        Crea un tablero nuevo con esta posición
+        """
+        board = Board()
+        board.cargar_casillas(self.__datos__[:TOTAL_CASILLAS])
+        return board
+
+    def zobrist(self):
+        """
+        Retorna el hash de Zobrist de la posición, igual a Game.hash() de la partida equivalente
+        """
+        clave = hash_casillas(self.get_casillas())
+        if self.__datos__[TOTAL_CASILLAS]:
+            clave ^= CLAVE_TURNO_NEGRO
+        return clave
+
+    def espejar(self):
+        """
+        Retorna la misma posición con los colores intercambiados (y el turno del otro color)
+        """
+        turno = 1 - self.__datos__[TOTAL_CASILLAS]
+        return Position(espejar_casillas(self.get_casillas()).tobytes() + bytes((turno,)))
+
+    def canonica(self):
+        """
+        Retorna la forma canónica: la misma posición con el jugador que mueve como blanco
+        """
+        if self.__datos__[TOTAL_CASILLAS]:
+            return self.espejar()
+        return self
+
+    def __bytes__(self):
+        return self.__datos__
+
+    def __hash__(self):
+        return hash(self.__datos__)
+
+    def __eq__(self, otra):
+        if not isinstance(otra, Position):
+            return NotImplemented
+        return self.__datos__ == otra.__datos__
+
+    def __lt__(self, otra):
+        if not isinstance(otra, Position):
+            return NotImplemented
+        return self.__datos__ < otra.__datos__
+
+    def __le__(self, otra):
+        if not isinstance(otra, Position):
+            return NotImplemented
+        return self.__datos__ <= otra.__datos__
+
+    def __gt__(self, otra):
+        if not isinstance(otra, Position):
+            return NotImplemented
+        return self.__datos__ > otra.__datos__
+
+    def __ge__(self, otra):
+        if not isinstance(otra, Position):
+            return NotImplemented
+        return self.__datos__ >= otra.__datos__
+
+    def __reduce__(self):
+        return (Position, (self.__datos__,))
+
+    def __repr__(self):
+        return f"Position({list(array('b', self.__datos__[:TOTAL_CASILLAS]))}, turno={self.get_turno()!r})"
@@ -0,0 +1,144 @@
+"""
+Validación de movimientos sin excepciones ni efectos secundarios
+
+validar_movimiento aplica las mismas reglas y en el mismo orden que Game.mover_ficha,
+pero retorna un código de motivo en lugar de lanzar una excepción. Esto permite probar
+miles de movimientos candidatos por segundo en la búsqueda y la generación de jugadas.
+"""
+
+from backgammon.core.board import BARRA, SIGNO
+from backgammon.core import tablas
+from backgammon.core.tablas import DISTANCIA
+
+# Códigos de motivo (VALIDO es el único que permite mover)
+VALIDO = 0
+JUEGO_TERMINADO = 1
+ORIGEN_FUERA_DE_RANGO = 2
+DESTINO_FUERA_DE_RANGO = 3
+MISMO_PUNTO = 4
+BARRA_VACIA = 5
+ORIGEN_VACIO = 6
+ORIGEN_RIVAL = 7
+SACAR_DESDE_BARRA = 8
+ENTRADA_INVALIDA = 9
+RETROCESO = 10
+DADO_INSUFICIENTE = 11
+DISTANCIA_DISTINTA = 12
+ELIMINAR_DESDE_BARRA = 13
+BEAR_OFF_NO_PERMITIDO = 14
+DESTINO_BLOQUEADO = 15
+
+# Códigos de error de la tabla de distancias -> código de motivo
+_ERRORES_DISTANCIA = {
+    tablas.SACAR_DESDE_BARRA: SACAR_DESDE_BARRA,
+    tablas.ENTRADA_INVALIDA: ENTRADA_INVALIDA,
+    tablas.RETROCESO: RETROCESO,
+}
+
+
+def validar_movimiento(board, color, desde, hacia, dado=None):
+    """
+    Verifica si un movimiento es legal sin modificar el tablero
+
+    Args:
+        board (Board): Tablero sobre el que se movería
+        color (str): Color del jugador que mueve
+        desde (int): Punto de origen (-1 para fichas en barra)
+        hacia (int): Punto de destino (-1 para bear off)
+        dado (int): Valor del dado a usar; None no valida la distancia
+
+    Returns:
+        int: VALIDO o el código del primer motivo por el que el movimiento no es legal
+    """
+    if desde != -1 and not 0 <= desde <= 23:
+        return ORIGEN_FUERA_DE_RANGO
+    if hacia != -1 and not 0 <= hacia <= 23:
+        return DESTINO_FUERA_DE_RANGO
+    if desde == hacia:
+        return MISMO_PUNTO
+
+    casillas = board.get_casillas()
+    signo = SIGNO[color]
+    if desde == -1:
+        if casillas[BARRA[color]] == 0:
+            return BARRA_VACIA
+    else:
+        conteo = casillas[desde]
+        if conteo == 0:
+            return ORIGEN_VACIO
+        if conteo * signo < 0:
+            return ORIGEN_RIVAL
+
+    if dado is not None:
+        distancia = DISTANCIA[color][desde + 1][hacia + 1]
+        if distancia < 0:
+            return _ERRORES_DISTANCIA[distancia]
+        if hacia == -1:
+            # Para bear off se permiten dados mayores o iguales a la distancia
+            if dado < distancia:
+                return DADO_INSUFICIENTE
+        elif distancia != dado:
+            return DISTANCIA_DISTINTA
+
+    if hacia == -1:
+        if desde == -1:
+            return ELIMINAR_DESDE_BARRA
+        if casillas[BARRA[color]] > 0 or board.get_fuera_de_casa(color) > 0:
+            return BEAR_OFF_NO_PERMITIDO
+    elif casillas[hacia] * signo < -1:
+        return DESTINO_BLOQUEADO
+    return VALIDO
+
+
+def describir_motivo(codigo, color, desde, hacia, dado=None):
+    """
+    Retorna el mensaje de error de un código de motivo, igual al que muestra mover_ficha
+
+    Args:
+        codigo (int): Código retornado por validar_movimiento
+        color (str): Color del jugador que mueve
+        desde (int): Punto de origen del movimiento
+        hacia (int): Punto de destino del movimiento
+        dado (int): Valor del dado usado
+
+    Returns:
+        str: Descripción del motivo
+    """
+    if codigo == VALIDO:
+        return "Movimiento válido"
+    if codigo == JUEGO_TERMINADO:
+        return "No se pueden hacer movimientos en un juego terminado"
+    if codigo == ORIGEN_FUERA_DE_RANGO:
+        return "La posición de origen debe estar entre 0 y 23 o ser -1"
+    if codigo == DESTINO_FUERA_DE_RANGO:
+        return "La posición de destino debe estar entre 0 y 23 o ser -1"
+    if codigo == MISMO_PUNTO:
+        return "No se puede mover una ficha al mismo punto"
+    if codigo == BARRA_VACIA:
+        return "No hay fichas en la barra para reintroducir"
+    if codigo == ORIGEN_VACIO:
+        return f"No hay fichas en el punto {desde}"
+    if codigo == ORIGEN_RIVAL:
+        return f"Las fichas en el punto {desde} no son del color {color}"
+    if codigo == SACAR_DESDE_BARRA:
+        return "No se puede sacar una ficha desde la barra"
+    if codigo == ENTRADA_INVALIDA:
+        if color == "blanco":
+            return "Blanco solo puede reintroducir en puntos 19-24"
+        return "Negro solo puede reintroducir en puntos 1-6"
+    if codigo == RETROCESO:
+        return f"El jugador {color} no puede retroceder"
+    if codigo == DADO_INSUFICIENTE:
+        distancia = DISTANCIA[color][desde + 1][hacia + 1]
+        return f"El dado ({dado}) es menor que la distancia necesaria ({distancia}) para guardar esta ficha"
+    if codigo == DISTANCIA_DISTINTA:
+        distancia = DISTANCIA[color][desde + 1][hacia + 1]
+        return f"El movimiento debe usar exactamente el valor del dado ({dado}), distancia: {distancia}"
+    if codigo == ELIMINAR_DESDE_BARRA:
+        return "No se puede eliminar una ficha ya en la barra"
+    if codigo == BEAR_OFF_NO_PERMITIDO:
+        cuadrante_casa = "puntos 1-6" if color == "blanco" else "puntos 19-24"
+        return f"Solo puedes sacar fichas cuando todas tus fichas están en tu cuadrante de casa ({cuadrante_casa})"
+    if codigo == DESTINO_BLOQUEADO:
+        return f"El punto {hacia} está bloqueado por el oponente"
+    raise ValueError(f"Código de motivo desconocido: {codigo}")
@@ -0,0 +1,114 @@
+"""
+Fuente de dados estratificada para rollouts (rotación de dados)
+
+En un rollout de N partidas, las primeras tiradas de cada partida se reparten en forma
+pareja entre las 36 combinaciones en lugar de sortearse: la partida i usa en su tirada t
+(t < turnos_rotados) la combinación número (i // 36**t) % 36, pasada por una permutación
+al azar propia de esa tirada. Cada bloque de 36 partidas ve todas las primeras tiradas
+exactamente una vez, y cada bloque de 36**2 todos los pares de primeras tiradas. Así se
+elimina la varianza de la suerte inicial, que es la que más pesa en el resultado. Las
+tiradas siguientes son al azar.
+
+Ofrece randint y randbytes para poder pasarla a Dice en lugar de un random.Random. Conviene
+usarla sin buffer (tamano_buffer=0): el buffer generaría por adelantado tiradas que
+pertenecen a la partida siguiente.
+"""
+
+import random
+
+from backgammon.core.dice import TIRADAS
+
+
+class DadosRotados:
+    """
+    Generador de tiradas con rotación de las primeras tiradas de cada partida
+
+    Atributos:
+    __rng__ (random.Random): Generador de las permutaciones y de las tiradas no rotadas
+    __permutaciones__ (tuple): Una permutación de las 36 tiradas por cada tirada rotada
+    __partida__ (int): Número de partida actual dentro del rollout
+    __tirada__ (int): Número de tirada dentro de la partida actual
+    __pendiente__ (int or None): Segundo dado de la tirada en curso (para randint)
+    """
+    __slots__ = ("__rng__", "__permutaciones__", "__partida__", "__tirada__", "__pendiente__")
+
+    def __init__(self, semilla=None, turnos_rotados=2, partida_inicial=0):
+        """
+        Crea la fuente de dados
+
+        Args:
+            semilla (int): Semilla de las permutaciones y de las tiradas al azar
+            turnos_rotados (int): Cantidad de tiradas iniciales estratificadas por partida
+            partida_inicial (int): Número de la primera partida (para repartir un rollout
+                                   entre procesos sin repetir combinaciones)
+
+        Raises:
+            ValueError: Si turnos_rotados o partida_inicial son negativos
+        """
+        if turnos_rotados < 0:
+            raise ValueError("La cantidad de tiradas rotadas no puede ser negativa")
+        if partida_inicial < 0:
+            raise ValueError("El número de partida inicial no puede ser negativo")
+        self.__rng__ = random.Random(semilla)
+        permutaciones = []
+        for _ in range(turnos_rotados):
+            permutacion = list(range(36))
+            self.__rng__.shuffle(permutacion)
+            permutaciones.append(tuple(permutacion))
+        self.__permutaciones__ = tuple(permutaciones)
+        self.__partida__ = partida_inicial
+        self.__tirada__ = 0
+        self.__pendiente__ = None
+
+    def nueva_partida(self, numero=None):
+        """
+        Pasa a la partida siguiente del rollout (o a la indicada) desde su primera tirada
+
+        Args:
+            numero (int): Número de partida; None avanza a la siguiente
+        """
+        self.__partida__ = self.__partida__ + 1 if numero is None else numero
+        self.__tirada__ = 0
+        self.__pendiente__ = None
+
+    def get_partida(self):
+        """
+        Retorna el número de la partida actual
+        """
+        return self.__partida__
+
+    def siguiente_indice(self):
+        """
+        Retorna el índice (0-35) de la próxima tirada de la partida actual
+        """
+        tirada = self.__tirada__
+        self.__tirada__ += 1
+        if tirada < len(self.__permutaciones__):
+            return self.__permutaciones__[tirada][(self.__partida__ // 36 ** tirada) % 36]
+        return self.__rng__.randrange(36)
+
+    def siguiente_tirada(self):
+        """
+        Retorna la próxima tirada de la partida actual como (dado1, dado2)
+        """
+        return TIRADAS[self.siguiente_indice()]
+
+    def randint(self, a, b):
+        """
+        Compatible con random.randint para Dice: dos llamadas seguidas con (1, 6) devuelven
+        los dos dados de la misma tirada. Otros rangos se resuelven con el generador interno.
+        """
+        if (a, b) != (1, 6):
+            return self.__rng__.randint(a, b)
+        if self.__pendiente__ is not None:
+            dado2, self.__pendiente__ = self.__pendiente__, None
+            return dado2
+        dado1, self.__pendiente__ = self.siguiente_tirada()
+        return dado1
+
+    def randbytes(self, cantidad):
+        """
+        Compatible con el modo buffer y tirar_lote de Dice: cada byte es el índice (0-35)
+        de una tirada consecutiva de la partida actual
+        """
+        return bytes(self.siguiente_indice() for _ in range(cantidad))
@@ -0,0 +1,75 @@
+"""
+Tablas de movimiento precalculadas al importar el módulo
+
+Reemplazan las ramas por color, dirección, entrada desde la barra y bear off que se
+repetían en cada movimiento. Los índices de origen y destino usan el mismo formato que
+Game.mover_ficha (-1 es la barra como origen y bear off como destino), desplazados en
+uno para poder indexar tuplas: DESTINO[color][desde + 1][dado].
+"""
+
+COLORES = ("blanco", "negro")
+
+# Tipos de movimiento de TIPO[color][desde + 1][dado]
+NORMAL = 0
+ENTRADA = 1
+SACAR = 2
+FUERA_DE_RANGO = 3
+
+# Códigos de error de DISTANCIA[color][desde + 1][hacia + 1] (las distancias válidas son >= 0)
+RETROCESO = -1
+ENTRADA_INVALIDA = -2
+SACAR_DESDE_BARRA = -3
+
+
+def _destino(color, desde, dado):
+    """
+    Calcula el destino y el tipo de movimiento de una ficha que avanza `dado` puntos
+    """
+    if not 1 <= dado <= 6:
+        return None, FUERA_DE_RANGO
+    if color == "blanco":
+        # Blanco avanza hacia índices menores y entra desde la barra por el punto 24 (índice 23)
+        hacia = (24 if desde == -1 else desde) - dado
+        fuera = hacia < 0
+    else:
+        # Negro avanza hacia índices mayores y entra desde la barra por el punto 1 (índice 0)
+        hacia = desde + dado
+        fuera = hacia > 23
+    if desde == -1:
+        return hacia, ENTRADA
+    if fuera:
+        return -1, SACAR
+    return hacia, NORMAL
+
+
+def _distancia(color, desde, hacia):
+    """
+    Calcula la distancia entre dos puntos en la dirección del jugador, o un código de error
+    """
+    if desde == -1:
+        if hacia == -1:
+            return SACAR_DESDE_BARRA
+        if color == "blanco":
+            # Dado 1 → punto 24 (idx 23), dado 6 → punto 19 (idx 18)
+            return 24 - hacia if hacia >= 18 else ENTRADA_INVALIDA
+        # Dado 1 → punto 1 (idx 0), dado 6 → punto 6 (idx 5)
+        return hacia + 1 if hacia <= 5 else ENTRADA_INVALIDA
+    if hacia == -1:
+        # Distancia hasta salir del tablero
+        return desde + 1 if color == "blanco" else 24 - desde
+    if color == "blanco":
+        return desde - hacia if hacia <= desde else RETROCESO
+    return hacia - desde if hacia >= desde else RETROCESO
+
+
+DESTINO = {}
+TIPO = {}
+DISTANCIA = {}
+for _color in COLORES:
+    _filas = [[_destino(_color, desde, dado) for dado in range(7)] for desde in range(-1, 24)]
+    DESTINO[_color] = tuple(tuple(hacia for hacia, _ in fila) for fila in _filas)
+    TIPO[_color] = tuple(tuple(tipo for _, tipo in fila) for fila in _filas)
+    DISTANCIA[_color] = tuple(
+        tuple(_distancia(_color, desde, hacia) for hacia in range(-1, 24)) for desde in range(-1, 24)
+    )
+del _color, _filas
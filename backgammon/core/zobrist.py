@@ -0,0 +1,71 @@
+"""
+Claves de Zobrist para identificar posiciones del tablero con un entero de 64 bits
+
+El hash de un tablero es el XOR de una clave por cada casilla del arreglo compacto
+(puntos, barra y fichas sacadas) según la cantidad de fichas que tiene. Cambiar el
+conteo de una casilla de `a` a `b` solo requiere `hash ^= clave(a) ^ clave(b)`.
+"""
+
+import random
+
+# Conteo máximo (en valor absoluto) contemplado por casilla. Una partida real no pasa
+# de 15, pero se deja holgura para posiciones armadas a mano.
+MAX_CONTEO = 30
+
+# Semilla fija: el hash de una posición es el mismo en todos los procesos y ejecuciones
+_SEMILLA = 0x5EED_BAC6
+
+_generador = random.Random(_SEMILLA)
+
+# CLAVES[casilla][conteo + MAX_CONTEO]; la casilla vacía vale 0 para que el tablero vacío tenga hash 0
+CLAVES = tuple(
+    tuple(0 if conteo == 0 else _generador.getrandbits(64) for conteo in range(-MAX_CONTEO, MAX_CONTEO + 1))
+    for _ in range(28)
+)
+
+# Se combina con el hash del tablero cuando el turno es del jugador negro
+CLAVE_TURNO_NEGRO = _generador.getrandbits(64)
+
+# Casilla equivalente con los colores intercambiados (puntos, barras y fichas sacadas)
+ESPEJO = tuple(23 - i for i in range(24)) + (25, 24, 27, 26)
+
+# CLAVES_ESPEJO[casilla][conteo + MAX_CONTEO]: clave que ese conteo aporta al hash del tablero espejado
+CLAVES_ESPEJO = tuple(
+    tuple(
+        CLAVES[ESPEJO[indice]][(-conteo if indice < 24 else conteo) + MAX_CONTEO]
+        for conteo in range(-MAX_CONTEO, MAX_CONTEO + 1)
+    )
+    for indice in range(28)
+)
+
+
+def hash_casillas(casillas):
+    """
+    Calcula desde cero el hash de un arreglo de casillas
+
+    Args:
+        casillas (Sequence[int]): Conteos de las 28 casillas del tablero
+
+    Returns:
+        int: Hash de Zobrist de 64 bits
+    """
+    resultado = 0
+    for indice, conteo in enumerate(casillas):
+        resultado ^= CLAVES[indice][conteo + MAX_CONTEO]
+    return resultado
+
+
+def hash_espejo(casillas):
+    """
+    Calcula desde cero el hash del tablero espejado (colores intercambiados) sin construirlo
+
+    Args:
+        casillas (Sequence[int]): Conteos de las 28 casillas del tablero
+
+    Returns:
+        int: Igual a hash_casillas del tablero espejado
+    """
+    resultado = 0
+    for indice, conteo in enumerate(casillas):
+        resultado ^= CLAVES_ESPEJO[indice][conteo + MAX_CONTEO]
+    return resultado
@@ -72,19 +72,17 @@ class BoardAdapter:
     @property
     def pos(self):
         """
-        Convierte __puntos__ (listas de Checker) a formato esperado (tuplas con color y cantidad)
+        Convierte las casillas del tablero (conteos con signo) a formato esperado (tuplas con color y cantidad)
         """
         result = {}
-        board = self.__game__.get_board()
-        puntos = board.get_puntos()
+        casillas = self.__game__.get_board().get_casillas()
         
-        for i, punto in enumerate(puntos):
-            if punto:  # Si hay fichas en este punto
-                color = punto[0].get_color()  # Color de la primera ficha
-                count = len(punto)
-                # Convertir "blanco"/"negro" a "white"/"black"
-                color_name = "white" if color == "blanco" else "black"
-                result[i] = (color_name, count)
+        for i in range(24):
+            conteo = casillas[i]
+            if conteo:  # Si hay fichas en este punto
+                # Conteo positivo = blanco, negativo = negro
+                color_name = "white" if conteo > 0 else "black"
+                result[i] = (color_name, abs(conteo))
         return result
 
 
@@ -248,9 +246,8 @@ def render_board(surface, game, font, selected_point=None):
     pygame.draw.rect(surface, LINE, barra_rect, 3, border_radius=8)
     
     # Dibujar fichas en la barra
-    barra = game.get_board().get_barra()
-    blancas_capturadas = len(barra["blanco"])
-    negras_capturadas = len(barra["negro"])
+    blancas_capturadas = game.get_board().get_cantidad_barra("blanco")
+    negras_capturadas = game.get_board().get_cantidad_barra("negro")
     
     # Lado izquierdo: fichas blancas capturadas
     if blancas_capturadas > 0:
@@ -474,6 +471,15 @@ def main():
                         movimientos_requeridos = len(dados_disponibles)
                         movimientos_realizados = 0
                         print(f"Dados tirados: {dados_raw}")
+                        if not game.tiene_movimiento_legal(dados_disponibles):
+                            # Pase forzado: ningún dado se puede usar
+                            print("No hay movimientos posibles. Cambiando turno...")
+                            game.cambiar_turno()
+                            dados_tirados = False
+                            movimientos_realizados = 0
+                            movimientos_requeridos = 0
+                            dados_disponibles = []
+                            print(f"Turno de: {game.get_turno_actual().get_name()}")
                     else:
                         print(f"Debes usar todos los dados antes de tirar de nuevo ({movimientos_realizados}/{movimientos_requeridos})")
             elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
@@ -524,33 +530,10 @@ def main():
                                     selected_point = None
                                     continue
                                 
-                                # Calcular distancia para bear off
-                                distancia = game._calcular_distancia(selected_point, -1, turno_actual)
-                                
-                                # Buscar un dado que sea mayor o igual a la distancia (en bear off se puede usar un dado mayor)
-                                dado_usado = None
-                                # Buscar primero uno exacto, luego el menor que sea >= distancia
-                                dado_exacto = None
-                                dado_minimo = None
-                                for i, valor_dado in enumerate(dados_disponibles):
-                                    if valor_dado == distancia:
-                                        dado_exacto = (i, valor_dado)
-                                        break
-                                    elif valor_dado >= distancia:
-                                        if dado_minimo is None or valor_dado < dado_minimo[1]:
-                                            dado_minimo = (i, valor_dado)
-                                
-                                if dado_exacto:
-                                    idx_dado, valor_dado = dado_exacto
-                                    dado_usado = valor_dado
-                                    dados_disponibles.pop(idx_dado)
-                                elif dado_minimo:
-                                    idx_dado, valor_dado = dado_minimo
-                                    dado_usado = valor_dado
-                                    dados_disponibles.pop(idx_dado)
-                                
+                                # El dado sale de las jugadas legales (el menor que saca la ficha)
+                                dado_usado = game.dado_para_movimiento(selected_point, -1, dados_disponibles)
                                 if dado_usado is None:
-                                    mensaje_error = f"No tienes un dado mayor o igual a {distancia} para guardar esta ficha"
+                                    mensaje_error = f"No puedes guardar esta ficha con los dados {dados_disponibles}"
                                     tiempo_error = pygame.time.get_ticks()
                                     print(mensaje_error)
                                     selected_point = None
@@ -558,6 +541,7 @@ def main():
                                 
                                 # Realizar el movimiento bear off
                                 game.mover_ficha(selected_point, -1, dado_usado)
+                                dados_disponibles.remove(dado_usado)
                                 movimientos_realizados += 1
                                 origen_str = str(selected_point + 1)
                                 print(f"Ficha guardada desde punto {origen_str} usando dado {dado_usado} ({movimientos_realizados}/{movimientos_requeridos})")
@@ -575,7 +559,7 @@ def main():
                                     print("¡Juego terminado!")
                                 
                                 # Verificar si se han usado todos los dados
-                                if movimientos_realizados >= movimientos_requeridos and not game.juego_terminado():
+                                if (movimientos_realizados >= movimientos_requeridos or not game.tiene_movimiento_legal(dados_disponibles)) and not game.juego_terminado():
                                     print("¡Turno completado! Cambiando turno...")
                                     game.cambiar_turno()
                                     dados_tirados = False
@@ -617,8 +601,7 @@ def main():
                         # Seleccionar punto origen
                         # Verificar si hay fichas en la barra que deben ser sacadas primero
                         turno_actual = game.get_turno_actual().get_color()
-                        barra = game.get_board().get_barra()
-                        fichas_en_barra = len(barra[turno_actual])
+                        fichas_en_barra = game.get_board().get_cantidad_barra(turno_actual)
                         
                         # Si hay fichas en la barra, solo se puede seleccionar la barra (-1)
                         if fichas_en_barra > 0 and idx != -1:
@@ -667,31 +650,10 @@ def main():
                                 # Caso especial: bear off (mover a la barra como destino)
                                 elif idx == -1:
                                     # Movimiento bear off: sacar ficha del tablero
-                                    # Calcular distancia usando la lógica del juego
-                                    distancia = game._calcular_distancia(selected_point, -1, turno_actual)
-                                    # Para bear off, buscar un dado mayor o igual
-                                    dado_usado = None
-                                    dado_exacto = None
-                                    dado_minimo = None
-                                    for i, valor_dado in enumerate(dados_disponibles):
-                                        if valor_dado == distancia:
-                                            dado_exacto = (i, valor_dado)
-                                            break
-                                        elif valor_dado >= distancia:
-                                            if dado_minimo is None or valor_dado < dado_minimo[1]:
-                                                dado_minimo = (i, valor_dado)
-                                    
-                                    if dado_exacto:
-                                        idx_dado, valor_dado = dado_exacto
-                                        dado_usado = valor_dado
-                                        dados_disponibles.pop(idx_dado)
-                                    elif dado_minimo:
-                                        idx_dado, valor_dado = dado_minimo
-                                        dado_usado = valor_dado
-                                        dados_disponibles.pop(idx_dado)
-                                    
+                                    # El dado sale de las jugadas legales (el menor que saca la ficha)
+                                    dado_usado = game.dado_para_movimiento(selected_point, -1, dados_disponibles)
                                     if dado_usado is None:
-                                        mensaje_error = f"No tienes un dado mayor o igual a {distancia} para guardar esta ficha"
+                                        mensaje_error = f"No puedes guardar esta ficha con los dados {dados_disponibles}"
                                         tiempo_error = pygame.time.get_ticks()
                                         print(mensaje_error)
                                         selected_point = None
@@ -699,6 +661,7 @@ def main():
                                     
                                     # Realizar el movimiento bear off
                                     game.mover_ficha(selected_point, -1, dado_usado)
+                                    dados_disponibles.remove(dado_usado)
                                     movimientos_realizados += 1
                                     origen_str = str(selected_point + 1)
                                     print(f"Ficha guardada desde punto {origen_str} usando dado {dado_usado} ({movimientos_realizados}/{movimientos_requeridos})")
@@ -716,7 +679,7 @@ def main():
                                         print("¡Juego terminado!")
                                     
                                     # Verificar si se han usado todos los dados
-                                    if movimientos_realizados >= movimientos_requeridos and not game.juego_terminado():
+                                    if (movimientos_realizados >= movimientos_requeridos or not game.tiene_movimiento_legal(dados_disponibles)) and not game.juego_terminado():
                                         print("¡Turno completado! Cambiando turno...")
                                         game.cambiar_turno()
                                         dados_tirados = False
@@ -751,16 +714,13 @@ def main():
                                         continue
                                     distancia = idx - selected_point
                                 
-                                # Buscar un dado que coincida con la distancia
-                                dado_usado = None
-                                for i, valor_dado in enumerate(dados_disponibles):
-                                    if valor_dado == distancia:
-                                        dado_usado = valor_dado
-                                        dados_disponibles.pop(i) # Remover el dado usado
-                                        break
+                                # El movimiento tiene que empezar alguna jugada legal de la tirada
+                                dado_usado = game.dado_para_movimiento(selected_point, idx, dados_disponibles)
                                 
                                 if dado_usado is None:
-                                    if selected_point == -1:
+                                    if distancia in dados_disponibles:
+                                        mensaje_error = "Ese movimiento no deja usar todos los dados que se pueden jugar"
+                                    elif selected_point == -1:
                                         mensaje_error = f"Para sacar una ficha de la barra necesitas un dado {distancia}"
                                     else:
                                         mensaje_error = f"No tienes un dado con valor {distancia}"
@@ -771,6 +731,7 @@ def main():
                                 
                                 # Intentar el movimiento con validación de dado
                                 game.mover_ficha(selected_point, idx, dado_usado)
+                                dados_disponibles.remove(dado_usado)
                                 movimientos_realizados += 1
                                 origen_str = "BARRA" if selected_point == -1 else str(selected_point + 1)
                                 destino_str = "BARRA" if idx == -1 else str(idx + 1)
@@ -790,7 +751,7 @@ def main():
                                 
                                 # Verificar si se han usado todos los dados
                                 # Solo cambiar turno si el juego NO ha terminado
-                                if movimientos_realizados >= movimientos_requeridos and not game.juego_terminado():
+                                if (movimientos_realizados >= movimientos_requeridos or not game.tiene_movimiento_legal(dados_disponibles)) and not game.juego_terminado():
                                     print("¡Turno completado! Cambiando turno...")
                                     game.cambiar_turno()
                                     dados_tirados = False
@@ -822,7 +783,8 @@ def main():
         hitmap = render_board(screen, game, font, selected_point)
 
         # Dibujar información del juego
-        info_text = f"Turno: {game.get_turno_actual().get_name()}"
+        pips = game.get_pips()
+        info_text = f"Turno: {game.get_turno_actual().get_name()} | Pips B/N: {pips['blanco']}/{pips['negro']}"
         if dados_tirados:
             info_text += f" | Dados: {game.get_dice().get_valores()} | Movimientos: {movimientos_realizados}/{movimientos_requeridos}"
         else:
@@ -0,0 +1,12 @@
+"""
+Simulación de partidas sin interfaz entre políticas automáticas
+
+Uso: python -m backgammon.sim --partidas 100 --blanco aleatoria --negro codiciosa --semilla 1
+     python -m backgammon.sim --partidas 10000 --procesos 32 --semilla 1
+"""
+
+from backgammon.sim.motor import ResultadoPartida, jugar_partida, simular, formatear_estadisticas
+from backgammon.sim.paralelo import derivar_semilla, iterar_resultados, simular_paralelo
+from backgammon.sim.politicas import (
+    Politica, PoliticaAleatoria, PoliticaPrimera, PoliticaCodiciosa, POLITICAS, crear_politica,
+)
@@ -0,0 +1,46 @@
+import argparse
+import random
+
+from backgammon.sim.motor import MAX_TURNOS, formatear_estadisticas, simular
+from backgammon.sim.paralelo import TAMANO_LOTE, simular_paralelo
+from backgammon.sim.politicas import POLITICAS, crear_politica
+
+
+def main(argumentos=None):
+    """Juega partidas automáticas e imprime las estadísticas"""
+    parser = argparse.ArgumentParser(description="Simulación de partidas de Backgammon sin interfaz")
+    parser.add_argument("--partidas", type=int, default=100, help="Cantidad de partidas")
+    parser.add_argument("--blanco", choices=sorted(POLITICAS), default="aleatoria", help="Política del jugador blanco")
+    parser.add_argument("--negro", choices=sorted(POLITICAS), default="aleatoria", help="Política del jugador negro")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla para dados y políticas")
+    parser.add_argument("--max-turnos", type=int, default=MAX_TURNOS, help="Tiradas máximas por partida")
+    parser.add_argument("--procesos", type=int, default=None,
+                        help="Reparte las partidas entre procesos (0 usa todos los núcleos)")
+    parser.add_argument("--lote", type=int, default=TAMANO_LOTE, help="Partidas por tarea de cada proceso")
+    opciones = parser.parse_args(argumentos)
+
+    if opciones.procesos is not None:
+        # Sin semilla se elige una y se muestra para poder repetir la simulación
+        semilla = opciones.semilla if opciones.semilla is not None else random.getrandbits(32)
+        estadisticas = simular_paralelo(
+            opciones.partidas, opciones.blanco, opciones.negro, semilla,
+            procesos=opciones.procesos or None, tamano_lote=opciones.lote, max_turnos=opciones.max_turnos,
+        )
+        print(f"Procesos: {estadisticas['procesos']} | Semilla maestra: {semilla}")
+        print(formatear_estadisticas(estadisticas))
+        return estadisticas
+
+    semilla_negro = None if opciones.semilla is None else opciones.semilla + 1
+    estadisticas = simular(
+        opciones.partidas,
+        crear_politica(opciones.blanco, opciones.semilla),
+        crear_politica(opciones.negro, semilla_negro),
+        semilla=opciones.semilla,
+        max_turnos=opciones.max_turnos,
+    )
+    print(formatear_estadisticas(estadisticas))
+    return estadisticas
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Motor de partidas automáticas sin interfaz (sin input() ni pygame)
+
+Juega partidas completas a través de Game entre dos políticas y junta estadísticas de
+rendimiento (partidas y movimientos por segundo) y de resultados (tipos de victoria).
+"""
+
+import random
+import time
+from collections import namedtuple
+
+from backgammon.core.dice import Dice
+from backgammon.core.game import Game
+
+# Tiradas que los dados generan de una vez en las simulaciones
+TAMANO_BUFFER_DADOS = 4096
+
+# Límite de turnos por partida para que una combinación de políticas nunca quede en un bucle
+MAX_TURNOS = 2000
+
+TIPOS_VICTORIA = ("simple", "gammon", "backgammon")
+
+# ganador es "blanco", "negro" o None si la partida se cortó por MAX_TURNOS
+ResultadoPartida = namedtuple("ResultadoPartida", ["ganador", "tipo_victoria", "puntos", "turnos", "movimientos"])
+
+
+def jugar_partida(politica_blanco, politica_negro, max_turnos=MAX_TURNOS, cache=None, dice=None):
+    """
+    Juega una partida completa entre dos políticas
+
+    Los turnos sin movimientos posibles se pasan automáticamente. El historial de
+    deshacer se vacía en cada turno para que la memoria no crezca con la partida.
+
+    Args:
+        politica_blanco (Politica): Política del jugador blanco (mueve primero)
+        politica_negro (Politica): Política del jugador negro
+        max_turnos (int): Cantidad máxima de tiradas antes de cortar la partida
+        cache (CacheJugadas): Caché de jugadas legales (por defecto la compartida)
+        dice (Dice): Dados de la partida (por defecto usan el generador global)
+
+    Returns:
+        ResultadoPartida: Ganador, tipo de victoria, puntos, tiradas y movimientos jugados
+    """
+    game = Game("Blanco", "Negro", cache=cache, dice=dice)
+    turnos, movimientos = continuar_partida(game, politica_blanco, politica_negro, max_turnos)
+
+    ganador = game.get_ganador()
+    return ResultadoPartida(
+        ganador.get_color() if ganador else None,
+        game.get_tipo_victoria(),
+        game.get_puntos_victoria(),
+        turnos,
+        movimientos,
+    )
+
+
+def continuar_partida(game, politica_blanco, politica_negro, max_turnos=MAX_TURNOS, observador=None):
+    """
+    Juega una partida ya empezada desde el turno actual hasta que termina o se agotan las tiradas
+
+    Args:
+        game (Game): Partida a continuar (se modifica)
+        politica_blanco (Politica): Política del jugador blanco
+        politica_negro (Politica): Política del jugador negro
+        max_turnos (int): Cantidad máxima de tiradas a jugar
+        observador (callable): Función que recibe la partida antes de cada tirada (por
+                               ejemplo para registrar las posiciones de un entrenamiento)
+
+    Returns:
+        tuple: (tiradas jugadas, movimientos de fichas hechos)
+    """
+    politicas = {"blanco": politica_blanco, "negro": politica_negro}
+    turnos = 0
+    movimientos = 0
+
+    while not game.juego_terminado() and turnos < max_turnos:
+        if observador is not None:
+            observador(game)
+        dados = game.tirar_dados()
+        turnos += 1
+        if game.tiene_movimiento_legal(dados):
+            jugadas = game.movimientos_legales(dados)
+            jugada = politicas[game.get_turno_actual().get_color()].elegir(game, jugadas)
+            for desde, hacia, dado in jugada:
+                game.mover_ficha(desde, hacia, dado)
+                movimientos += 1
+                if game.juego_terminado():
+                    break
+        game.limpiar_historial()
+        if not game.juego_terminado():
+            game.cambiar_turno()
+    return turnos, movimientos
+
+
+def nuevas_estadisticas():
+    """
+    Crea un diccionario de estadísticas vacío para acumular resultados de partidas
+    """
+    return {
+        "partidas": 0,
+        "cortadas": 0,
+        "turnos": 0,
+        "movimientos": 0,
+        "segundos": 0.0,
+        "victorias": {"blanco": 0, "negro": 0},
+        "puntos": {"blanco": 0, "negro": 0},
+        "tipos_victoria": {tipo: 0 for tipo in TIPOS_VICTORIA},
+    }
+
+
+def acumular(estadisticas, resultado):
+    """
+    Suma el resultado de una partida a las estadísticas
+    """
+    estadisticas["partidas"] += 1
+    estadisticas["turnos"] += resultado.turnos
+    estadisticas["movimientos"] += resultado.movimientos
+    if resultado.ganador is None:
+        estadisticas["cortadas"] += 1
+        return
+    estadisticas["victorias"][resultado.ganador] += 1
+    estadisticas["puntos"][resultado.ganador] += resultado.puntos
+    estadisticas["tipos_victoria"][resultado.tipo_victoria] += 1
+
+
+def completar_tasas(estadisticas):
+    """
+    Agrega partidas por segundo y movimientos por segundo según el tiempo medido
+    """
+    segundos = estadisticas["segundos"]
+    estadisticas["partidas_por_segundo"] = estadisticas["partidas"] / segundos if segundos else 0.0
+    estadisticas["movimientos_por_segundo"] = estadisticas["movimientos"] / segundos if segundos else 0.0
+    return estadisticas
+
+
+def simular(partidas, politica_blanco, politica_negro, semilla=None, max_turnos=MAX_TURNOS, cache=None):
+    """
+    Juega varias partidas seguidas y retorna las estadísticas
+
+    Args:
+        partidas (int): Cantidad de partidas
+        politica_blanco (Politica): Política del jugador blanco
+        politica_negro (Politica): Política del jugador negro
+        semilla (int): Semilla de los dados; None usa una semilla al azar
+        max_turnos (int): Cantidad máxima de tiradas por partida
+        cache (CacheJugadas): Caché de jugadas legales (por defecto la compartida)
+
+    Returns:
+        dict: partidas, cortadas, turnos, movimientos, segundos, victorias y puntos por color,
+              tipos_victoria, partidas_por_segundo y movimientos_por_segundo
+    """
+    # Un solo generador para los dados de todas las partidas, sin tocar el global
+    dice = Dice(rng=random.Random(semilla), tamano_buffer=TAMANO_BUFFER_DADOS)
+
+    estadisticas = nuevas_estadisticas()
+    inicio = time.perf_counter()
+    for _ in range(partidas):
+        acumular(estadisticas, jugar_partida(politica_blanco, politica_negro, max_turnos, cache, dice))
+    estadisticas["segundos"] = time.perf_counter() - inicio
+    return completar_tasas(estadisticas)
+
+
+def formatear_estadisticas(estadisticas):
+    """
+    Retorna un resumen legible de las estadísticas de una simulación
+    """
+    partidas = estadisticas["partidas"]
+    terminadas = partidas - estadisticas["cortadas"]
+    lineas = [
+        f"Partidas: {partidas} ({estadisticas['cortadas']} cortadas por límite de turnos)",
+        f"Tiempo: {estadisticas['segundos']:.2f} s",
+        f"Partidas/seg: {estadisticas['partidas_por_segundo']:.1f}",
+        f"Movimientos/seg: {estadisticas['movimientos_por_segundo']:.1f}",
+        f"Victorias: blanco {estadisticas['victorias']['blanco']}, negro {estadisticas['victorias']['negro']}",
+        f"Puntos: blanco {estadisticas['puntos']['blanco']}, negro {estadisticas['puntos']['negro']}",
+    ]
+    for tipo in TIPOS_VICTORIA:
+        cantidad = estadisticas["tipos_victoria"][tipo]
+        porcentaje = 100 * cantidad / terminadas if terminadas else 0.0
+        lineas.append(f"  {tipo:<10} {cantidad:6d} ({porcentaje:5.1f}%)")
+    return "\n".join(lineas)
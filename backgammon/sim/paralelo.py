@@ -0,0 +1,142 @@
+"""
+Partidas automáticas repartidas entre procesos con semillas deterministas
+
+Cada partida recibe semillas propias derivadas de (semilla maestra, índice de partida), así
+que el resultado de cada partida no depende de cuántos procesos se usen ni de qué proceso
+la juegue: la misma semilla maestra reproduce exactamente las mismas estadísticas. Los
+procesos solo devuelven tuplas ResultadoPartida, nunca objetos Game.
+"""
+
+import hashlib
+import os
+import time
+from multiprocessing import Pool
+
+from backgammon.core.dice import Dice
+from backgammon.sim.motor import (
+    MAX_TURNOS, TAMANO_BUFFER_DADOS, acumular, completar_tasas, jugar_partida, nuevas_estadisticas,
+)
+from backgammon.sim.politicas import crear_politica
+
+# Partidas que juega un proceso por cada pedido al pool
+TAMANO_LOTE = 16
+
+
+def derivar_semilla(semilla_maestra, indice, uso):
+    """
+    Deriva una semilla de 64 bits independiente para una partida y un uso
+
+    Args:
+        semilla_maestra (int): Semilla de toda la simulación
+        indice (int): Número de partida
+        uso (str): "dados", "blanco" o "negro"
+
+    Returns:
+        int: Semilla derivada
+    """
+    datos = f"{semilla_maestra}:{indice}:{uso}".encode()
+    return int.from_bytes(hashlib.blake2b(datos, digest_size=8).digest(), "little")
+
+
+def jugar_partida_sembrada(indice, blanco, negro, semilla_maestra, max_turnos=MAX_TURNOS):
+    """
+    Juega la partida número `indice` de una simulación con sus semillas derivadas
+
+    Args:
+        indice (int): Número de partida
+        blanco (str): Nombre de la política del jugador blanco
+        negro (str): Nombre de la política del jugador negro
+        semilla_maestra (int): Semilla de toda la simulación
+        max_turnos (int): Cantidad máxima de tiradas
+
+    Returns:
+        ResultadoPartida: Resultado compacto de la partida
+    """
+    # Dados con generador propio por partida: no comparten estado con otras partidas del proceso
+    dice = Dice(semilla=derivar_semilla(semilla_maestra, indice, "dados"), tamano_buffer=TAMANO_BUFFER_DADOS)
+    return jugar_partida(
+        crear_politica(blanco, derivar_semilla(semilla_maestra, indice, "blanco")),
+        crear_politica(negro, derivar_semilla(semilla_maestra, indice, "negro")),
+        max_turnos,
+        dice=dice,
+    )
+
+
+def _jugar_lote(tarea):
+    """
+    Juega un rango de partidas dentro de un proceso del pool
+    """
+    inicio, fin, blanco, negro, semilla_maestra, max_turnos = tarea
+    return [
+        (indice, jugar_partida_sembrada(indice, blanco, negro, semilla_maestra, max_turnos))
+        for indice in range(inicio, fin)
+    ]
+
+
+def iterar_resultados(partidas, blanco, negro, semilla_maestra, procesos=None, tamano_lote=TAMANO_LOTE,
+                      max_turnos=MAX_TURNOS):
+    """
+    Juega las partidas en paralelo y entrega los resultados a medida que terminan
+
+    El orden de llegada depende de los procesos, pero cada resultado viene con su índice
+    de partida y es el mismo en cualquier ejecución con la misma semilla maestra.
+
+    Args:
+        partidas (int): Cantidad de partidas
+        blanco (str): Nombre de la política del jugador blanco
+        negro (str): Nombre de la política del jugador negro
+        semilla_maestra (int): Semilla de toda la simulación
+        procesos (int): Cantidad de procesos (None usa todos los núcleos, 1 juega en este proceso)
+        tamano_lote (int): Partidas por tarea enviada a cada proceso
+        max_turnos (int): Cantidad máxima de tiradas por partida
+
+    Yields:
+        tuple: (índice de partida, ResultadoPartida)
+    """
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    if procesos < 1:
+        raise ValueError("La cantidad de procesos debe ser al menos 1")
+    if tamano_lote < 1:
+        raise ValueError("El tamaño de lote debe ser al menos 1")
+
+    tareas = [
+        (inicio, min(inicio + tamano_lote, partidas), blanco, negro, semilla_maestra, max_turnos)
+        for inicio in range(0, partidas, tamano_lote)
+    ]
+    if procesos == 1:
+        for tarea in tareas:
+            yield from _jugar_lote(tarea)
+        return
+
+    with Pool(processes=procesos) as pool:
+        for lote in pool.imap_unordered(_jugar_lote, tareas):
+            yield from lote
+
+
+def simular_paralelo(partidas, blanco="aleatoria", negro="aleatoria", semilla_maestra=0, procesos=None,
+                     tamano_lote=TAMANO_LOTE, max_turnos=MAX_TURNOS):
+    """
+    Juega partidas en varios procesos y junta las estadísticas
+
+    Args:
+        partidas (int): Cantidad de partidas
+        blanco (str): Nombre de la política del jugador blanco
+        negro (str): Nombre de la política del jugador negro
+        semilla_maestra (int): Semilla de toda la simulación
+        procesos (int): Cantidad de procesos (None usa todos los núcleos)
+        tamano_lote (int): Partidas por tarea enviada a cada proceso
+        max_turnos (int): Cantidad máxima de tiradas por partida
+
+    Returns:
+        dict: Las mismas estadísticas que motor.simular, más procesos y semilla_maestra
+    """
+    estadisticas = nuevas_estadisticas()
+    inicio = time.perf_counter()
+    for _, resultado in iterar_resultados(partidas, blanco, negro, semilla_maestra, procesos, tamano_lote,
+                                          max_turnos):
+        acumular(estadisticas, resultado)
+    estadisticas["segundos"] = time.perf_counter() - inicio
+    estadisticas["procesos"] = procesos or os.cpu_count() or 1
+    estadisticas["semilla_maestra"] = semilla_maestra
+    return completar_tasas(estadisticas)
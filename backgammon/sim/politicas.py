@@ -0,0 +1,120 @@
+"""
+Políticas de elección de jugadas para partidas automáticas
+
+Una política recibe la partida y la lista de jugadas legales de la tirada (no vacía) y
+retorna la jugada a aplicar. No debe modificar la partida.
+"""
+
+import random
+from abc import ABC, abstractmethod
+
+from backgammon.core.board import RIVAL, SACADAS, SIGNO
+
+
+class Politica(ABC):
+    """
+    Clase base abstracta de las políticas de juego automático
+    """
+    __slots__ = ()
+    nombre = "base"
+
+    @abstractmethod
+    def elegir(self, game, jugadas):
+        """
+        Elige una jugada entre las legales
+
+        Args:
+            game (Game): Partida en curso (turno del jugador que elige)
+            jugadas (list): Jugadas legales de la tirada, nunca vacía
+
+        Returns:
+            tuple: Una de las jugadas recibidas
+        """
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class PoliticaAleatoria(Politica):
+    """
+    Elige una jugada al azar con un generador propio (reproducible con semilla)
+    """
+    __slots__ = ("__rng__",)
+    nombre = "aleatoria"
+
+    def __init__(self, semilla=None):
+        self.__rng__ = random.Random(semilla)
+
+    def elegir(self, game, jugadas):
+        return self.__rng__.choice(jugadas)
+
+
+class PoliticaPrimera(Politica):
+    """
+    Elige siempre la primera jugada legal generada
+    """
+    __slots__ = ()
+    nombre = "primera"
+
+    def elegir(self, game, jugadas):
+        return jugadas[0]
+
+
+class PoliticaCodiciosa(Politica):
+    """
+    Elige la jugada que deja la mejor diferencia de pip count (pips del rival menos los propios)
+
+    Cada jugada se aplica y se revierte sobre el tablero de la partida, sin copiarlo.
+    Comer fichas suma los pips que el rival tiene que volver a recorrer. Entre jugadas con
+    la misma diferencia prefiere la que saca más fichas y después la que deja menos fichas
+    solas; sin ese desempate la elección dependería del orden de generación, que no es el
+    mismo para los dos colores.
+    """
+    __slots__ = ()
+    nombre = "codiciosa"
+
+    def elegir(self, game, jugadas):
+        board = game.get_board()
+        color = game.get_turno_actual().get_color()
+        rival = RIVAL[color]
+        signo = SIGNO[color]
+        casillas = board.get_casillas()
+
+        mejor = jugadas[0]
+        mejor_valor = None
+        for jugada in jugadas:
+            comidas = []
+            for desde, hacia, _ in jugada:
+                comidas.append(board.aplicar_movimiento(desde, hacia, color))
+            solas = sum(1 for punto in range(24) if casillas[punto] * signo == 1)
+            valor = (board.get_pips(rival) - board.get_pips(color), casillas[SACADAS[color]], -solas)
+            for (desde, hacia, _), comio in zip(reversed(jugada), reversed(comidas)):
+                board.revertir_movimiento(desde, hacia, color, comio)
+            if mejor_valor is None or valor > mejor_valor:
+                mejor, mejor_valor = jugada, valor
+        return mejor
+
+
+POLITICAS = {
+    PoliticaAleatoria.nombre: PoliticaAleatoria,
+    PoliticaPrimera.nombre: PoliticaPrimera,
+    PoliticaCodiciosa.nombre: PoliticaCodiciosa,
+}
+
+
+def crear_politica(nombre, semilla=None):
+    """
+    Crea una política por nombre
+
+    Args:
+        nombre (str): "aleatoria", "primera" o "codiciosa"
+        semilla (int): Semilla para las políticas que usan azar
+
+    Raises:
+        ValueError: Si el nombre no corresponde a ninguna política
+    """
+    if nombre not in POLITICAS:
+        raise ValueError(f"Política desconocida: {nombre}. Opciones: {', '.join(POLITICAS)}")
+    if nombre == PoliticaAleatoria.nombre:
+        return PoliticaAleatoria(semilla)
+    return POLITICAS[nombre]()
@@ -0,0 +1,159 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional: sin él se saltean estos tests
+    np = None
+
+from backgammon.analysis import rollout
+from backgammon.analysis.busqueda import TIRADAS_DISTINTAS
+from backgammon.core.board import Board
+from backgammon.core.game import Game
+from backgammon.core.jugadas import generar_jugadas
+from backgammon.core.position import Position
+
+if np is not None:
+    from backgammon.analysis.bearoff import (
+        BaseBearoff, cantidad_posiciones, generar, guardar, indice_posicion, main, posicion_bearoff,
+        posicion_indice,
+    )
+
+
+def tablero_blanco(posicion):
+    """Blanco con `posicion` en casa y negro ya sin fichas en el tablero"""
+    casillas = [0] * 28
+    for punto, fichas in enumerate(posicion):
+        casillas[punto] = fichas
+    casillas[26] = 15 - sum(posicion)
+    casillas[27] = 15
+    board = Board()
+    board.cargar_casillas(casillas)
+    return board
+
+
+@lru_cache(maxsize=None)
+def media_con_game(posicion):
+    """Tiradas esperadas calculadas con el generador de jugadas del juego, como referencia"""
+    if sum(posicion) == 0:
+        return 0.0
+    board = tablero_blanco(posicion)
+    esperado = 1.0
+    for dados, probabilidad in TIRADAS_DISTINTAS:
+        mejor = float("inf")
+        for jugada in generar_jugadas(board, "blanco", dados):
+            comidas = [board.aplicar_movimiento(desde, hacia, "blanco") for desde, hacia, _ in jugada]
+            mejor = min(mejor, media_con_game(tuple(board.get_casillas()[:6])))
+            for (desde, hacia, _), comio in zip(reversed(jugada), reversed(comidas)):
+                board.revertir_movimiento(desde, hacia, "blanco", comio)
+        esperado += probabilidad * mejor
+    return esperado
+
+
+@unittest.skipIf(np is None, "numpy no está instalado")
+class TestBearoff(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "bearoff.bin")
+        self.medias, self.distribuciones = generar(fichas=4)
+        guardar(self.ruta, self.medias, self.distribuciones, fichas=4)
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_hash_perfecto(self):
+        cantidad = cantidad_posiciones(5)
+        posiciones = {posicion_indice(indice, 5) for indice in range(cantidad)}
+        self.assertEqual(len(posiciones), cantidad)
+        self.assertTrue(all(sum(posicion) <= 5 for posicion in posiciones))
+        for indice in range(cantidad):
+            self.assertEqual(indice_posicion(posicion_indice(indice, 5)), indice)
+        self.assertEqual(cantidad_posiciones(), 54264)
+        self.assertEqual(posicion_indice(cantidad_posiciones() - 1), (15, 0, 0, 0, 0, 0))
+
+    def test_coincide_con_el_juego(self):
+        for indice in range(len(self.medias)):
+            posicion = posicion_indice(indice, 4)
+            self.assertAlmostEqual(self.medias[indice], media_con_game(posicion), msg=posicion)
+
+    def test_distribuciones(self):
+        np.testing.assert_allclose(self.distribuciones.sum(axis=1), 1.0)
+        tiradas = np.arange(self.distribuciones.shape[1])
+        np.testing.assert_allclose(self.distribuciones @ tiradas, self.medias)
+
+    def test_lectura_con_mmap(self):
+        with BaseBearoff(self.ruta) as base:
+            self.assertEqual(len(base), cantidad_posiciones(4))
+            self.assertEqual(base.get_fichas(), 4)
+            self.assertAlmostEqual(base.media((0, 2, 0, 0, 0, 0)), 1 + 10 / 36, places=6)
+            np.testing.assert_allclose(base.distribucion((0, 2, 0, 0, 0, 0))[:3], [0, 26 / 36, 10 / 36], atol=1e-4)
+            with self.assertRaises(ValueError):
+                base.media((0, 0, 0, 0, 0, 5))
+
+    def test_archivo_invalido(self):
+        with open(self.ruta, "r+b") as archivo:
+            archivo.write(b"XXXX")
+        with self.assertRaises(ValueError):
+            BaseBearoff(self.ruta)
+
+    def test_posicion_desde_board(self):
+        board = tablero_blanco((1, 0, 2, 0, 0, 1))
+        self.assertEqual(posicion_bearoff(board, "blanco"), (1, 0, 2, 0, 0, 1))
+        self.assertIsNone(posicion_bearoff(Game("Blanco", "Negro").get_board(), "blanco"))
+
+        casillas = [0] * 28
+        casillas[23], casillas[18], casillas[27] = -2, -1, 12
+        casillas[5], casillas[26] = 3, 12
+        board.cargar_casillas(casillas)
+        self.assertEqual(posicion_bearoff(board, "negro"), (2, 0, 0, 0, 0, 1))
+        with BaseBearoff(self.ruta) as base:
+            # Blanco gana si termina en n tiradas y negro necesita n o más
+            blanco = base.distribucion((0, 0, 0, 0, 0, 3))
+            negro = base.distribucion((2, 0, 0, 0, 0, 1))
+            esperado = sum(blanco[n] * negro[n:].sum() for n in range(1, len(blanco)))
+            self.assertAlmostEqual(base.probabilidad_ganar(board, "blanco"), esperado, places=6)
+            esperado = sum(negro[n] * blanco[n:].sum() for n in range(1, len(negro)))
+            self.assertAlmostEqual(base.probabilidad_ganar(board, "negro"), esperado, places=6)
+
+    def test_rollout_con_la_tabla(self):
+        casillas = [0] * 28
+        casillas[1], casillas[4], casillas[26] = 2, 1, 12
+        casillas[20], casillas[23], casillas[27] = -2, -1, 12
+        board = Board()
+        board.cargar_casillas(casillas)
+        posicion = Position.desde_board(board, "negro")
+        exacto = rollout(posicion, bearoff=self.ruta)
+        self.assertEqual(exacto.partidas, 0)
+        with BaseBearoff(self.ruta) as base:
+            self.assertAlmostEqual(exacto.ganar, base.probabilidad_ganar(board, "negro"))
+        simulado = rollout(posicion, partidas=1296, politica="codiciosa")
+        self.assertAlmostEqual(simulado.ganar, exacto.ganar, delta=0.05)
+
+    def test_mas_fichas_que_la_base(self):
+        casillas = [0] * 28
+        casillas[0], casillas[3], casillas[26] = 3, 2, 10
+        casillas[23], casillas[20], casillas[27] = -3, -2, 10
+        board = Board()
+        board.cargar_casillas(casillas)
+        with BaseBearoff(self.ruta) as base:
+            self.assertIsNone(base.probabilidad_ganar(board, "blanco"))
+        # El rollout no usa la tabla y juega las partidas, también al cortarlas
+        resultado = rollout(Position.desde_board(board, "blanco"), partidas=36, bearoff=self.ruta, truncar=2)
+        self.assertEqual(resultado.partidas, 36)
+
+    def test_main(self):
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            main(["--salida", self.ruta, "--fichas", "2"])
+        self.assertIn("28 posiciones", salida.getvalue())
+        with BaseBearoff(self.ruta) as base:
+            self.assertEqual(len(base), 28)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional: sin él se saltean estos tests
+    np = None
+
+from backgammon.analysis.busqueda import TIRADAS_DISTINTAS, Busqueda
+from backgammon.core.board import Board
+from backgammon.core.game import Game
+from backgammon.core.jugadas import generar_jugadas
+from backgammon.core.position import Position
+
+if np is not None:
+    from backgammon.analysis.bearoff import cantidad_posiciones, posicion_indice
+    from backgammon.analysis.bearoff_doble import BaseBearoffDoble, generar, guardar, main
+
+
+def tablero(blanco, negro):
+    """Blanco con `blanco` en su casa y negro con `negro` en la suya, contando desde el borde"""
+    casillas = [0] * 28
+    for punto, fichas in enumerate(blanco):
+        casillas[punto] = fichas
+    for punto, fichas in enumerate(negro):
+        casillas[23 - punto] = -fichas
+    casillas[26] = 15 - sum(blanco)
+    casillas[27] = 15 - sum(negro)
+    board = Board()
+    board.cargar_casillas(casillas)
+    return board
+
+
+@lru_cache(maxsize=None)
+def probabilidad_con_game(propia, rival):
+    """Probabilidad de ganar del que tiene el turno calculada con el generador de jugadas del juego"""
+    if sum(propia) == 0:
+        return 1.0
+    if sum(rival) == 0:
+        return 0.0
+    board = tablero(propia, rival)
+    esperado = 0.0
+    for dados, probabilidad in TIRADAS_DISTINTAS:
+        mejor = 0.0
+        for jugada in generar_jugadas(board, "blanco", dados):
+            comidas = [board.aplicar_movimiento(desde, hacia, "blanco") for desde, hacia, _ in jugada]
+            mejor = max(mejor, 1.0 - probabilidad_con_game(rival, tuple(board.get_casillas()[:6])))
+            for (desde, hacia, _), comio in zip(reversed(jugada), reversed(comidas)):
+                board.revertir_movimiento(desde, hacia, "blanco", comio)
+        esperado += probabilidad * mejor
+    return esperado
+
+
+@unittest.skipIf(np is None, "numpy no está instalado")
+class TestBearoffDoble(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "bearoff2.bin")
+        self.tabla = generar(fichas=3)
+        guardar(self.ruta, self.tabla, fichas=3, filas_por_bloque=10)
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_coincide_con_el_juego(self):
+        for propia in range(cantidad_posiciones(2)):
+            for rival in range(1, cantidad_posiciones(2)):
+                esperado = probabilidad_con_game(posicion_indice(propia, 3), posicion_indice(rival, 3))
+                self.assertAlmostEqual(self.tabla[propia, rival], esperado, places=6)
+
+    def test_lectura_por_bloques(self):
+        for compresion in ("zlib", "lzma"):
+            guardar(self.ruta, self.tabla, fichas=3, compresion=compresion, filas_por_bloque=10)
+            with BaseBearoffDoble(self.ruta, capacidad_bloques=2) as base:
+                self.assertEqual(base.get_fichas(), 3)
+                for indice in range(0, cantidad_posiciones(3), 7):
+                    propia = posicion_indice(indice, 3)
+                    rival = posicion_indice(cantidad_posiciones(3) - 1 - indice, 3)
+                    self.assertAlmostEqual(base.probabilidad(propia, rival), float(self.tabla[indice, -1 - indice]))
+                with self.assertRaises(ValueError):
+                    base.probabilidad((0, 0, 0, 0, 0, 4), (1, 0, 0, 0, 0, 0))
+
+    def test_archivo_invalido(self):
+        with open(self.ruta, "r+b") as archivo:
+            archivo.write(b"XXXX")
+        with self.assertRaises(ValueError):
+            BaseBearoffDoble(self.ruta)
+
+    def test_consulta_desde_game(self):
+        game = Game("Blanco", "Negro")
+        with BaseBearoffDoble(self.ruta) as base:
+            self.assertIsNone(base.consultar(game))
+            game.cargar_posicion(Position.desde_board(tablero((1, 1, 0, 0, 0, 0), (0, 0, 0, 0, 0, 3)), "negro"))
+            self.assertAlmostEqual(base.consultar(game), probabilidad_con_game((0, 0, 0, 0, 0, 3), (1, 1, 0, 0, 0, 0)))
+            self.assertIsNone(base.probabilidad_ganar(tablero((4, 0, 0, 0, 0, 0), (1, 0, 0, 0, 0, 0)), "blanco"))
+
+    def test_busqueda_juega_perfecto(self):
+        board = tablero((0, 0, 0, 1, 1, 1), (0, 1, 0, 0, 1, 0))
+        with BaseBearoffDoble(self.ruta) as base:
+            busqueda = Busqueda(profundidad=1, evaluador=base.evaluador())
+            game = Game("Blanco", "Negro")
+            game.cargar_posicion(Position.desde_board(board, "blanco"))
+            jugada, valor = busqueda.mejor_jugada(game, [2, 1])
+            self.assertIsNotNone(jugada)
+            finales = []
+            for opcion in generar_jugadas(board, "blanco", [2, 1]):
+                comidas = [board.aplicar_movimiento(desde, hacia, "blanco") for desde, hacia, _ in opcion]
+                finales.append(1.0 - probabilidad_con_game((0, 1, 0, 0, 1, 0), tuple(board.get_casillas()[:6])))
+                for (desde, hacia, _), comio in zip(reversed(opcion), reversed(comidas)):
+                    board.revertir_movimiento(desde, hacia, "blanco", comio)
+            self.assertAlmostEqual(valor, 2 * max(finales) - 1, places=6)
+
+    def test_rechaza_posiciones_con_gammon(self):
+        with self.assertRaises(ValueError):
+            generar(fichas=9)
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(["--salida", self.ruta, "--fichas", "9"])
+
+    def test_main(self):
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            main(["--salida", self.ruta, "--fichas", "2", "--compresion", "lzma"])
+        self.assertIn("28 x 28", salida.getvalue())
+        with BaseBearoffDoble(self.ruta) as base:
+            self.assertEqual(base.probabilidad((0, 0, 0, 0, 0, 0), (1, 0, 0, 0, 0, 0)), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
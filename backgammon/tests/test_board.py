@@ -1,5 +1,6 @@
 import unittest
 from backgammon.core.board import Board
+from backgammon.core.zobrist import hash_casillas
 class TestBoard(unittest.TestCase):
     
     def test_inicializacion_estandar(self):
@@ -41,6 +42,164 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(len(b.get_barra()["negro"]), 0)
         self.assertFalse(b.quitar_barra("negro"))
 
+    def test_casillas_compactas_con_signo(self):
+        b = Board()
+        casillas = b.get_casillas()
+        self.assertEqual(len(casillas), 28)
+        self.assertEqual(casillas[23], 2)
+        self.assertEqual(casillas[0], -2)
+        self.assertEqual(b.get_conteo(18), -5)
+        self.assertEqual(b.get_color(12), "blanco")
+        self.assertIsNone(b.get_color(1))
+        self.assertEqual(sum(c for c in casillas[:24] if c > 0), 15)
+        self.assertEqual(sum(c for c in casillas[:24] if c < 0), -15)
+
+    def test_vista_puntos_compatible(self):
+        b = Board()
+        punto = b.get_puntos()[18]
+        self.assertEqual(len(punto), 5)
+        self.assertEqual(punto[0].get_color(), "negro")
+        self.assertEqual(punto[-1].get_color(), "negro")
+        self.assertEqual([f.get_color() for f in b.get_puntos()[23]], ["blanco", "blanco"])
+        with self.assertRaises(IndexError):
+            b.get_puntos()[1][0]
+        # La vista refleja los cambios sin volver a pedirla
+        b.agregar_ficha("negro", 18)
+        self.assertEqual(len(punto), 6)
+
+    def test_vista_usa_fichas_compartidas(self):
+        b = Board()
+        self.assertIs(b.get_puntos()[12][0], b.get_puntos()[12][4])
+        self.assertFalse(hasattr(b, "__dict__"))
+
+    def test_agregar_ficha_punto_ocupado_por_otro_color(self):
+        b = Board()
+        with self.assertRaises(ValueError):
+            b.agregar_ficha("blanco", 0)
+
+    def test_asignar_puntos_y_barra_formato_anterior(self):
+        b = Board()
+        b.__puntos__ = [[] for _ in range(24)]
+        b.__barra__ = {"blanco": [], "negro": []}
+        self.assertTrue(all(len(p) == 0 for p in b.get_puntos()))
+        b.agregar_barra("blanco")
+        self.assertEqual(len(b.get_barra()["blanco"]), 1)
+        self.assertEqual(len(b.get_barra().get("negro")), 0)
+
+    def test_agregados_posicion_inicial(self):
+        b = Board()
+        for color in ("blanco", "negro"):
+            self.assertEqual(b.get_fichas_en_tablero(color), 15)
+            self.assertEqual(b.get_fuera_de_casa(color), 10)
+            self.assertEqual(b.get_en_casa_rival(color), 2)
+            self.assertEqual(b.get_pips(color), 167)
+
+    def test_agregados_se_actualizan_en_cada_movimiento(self):
+        b = Board()
+        b.quitar_ficha(23)
+        b.agregar_barra("blanco")
+        self.assertEqual(b.get_fichas_en_tablero("blanco"), 14)
+        self.assertEqual(b.get_en_casa_rival("blanco"), 1)
+        self.assertEqual(b.get_pips("blanco"), 167 - 24 + 25)
+        b.quitar_barra("blanco")
+        b.agregar_ficha("blanco", 5)
+        self.assertEqual(b.get_fichas_en_tablero("blanco"), 15)
+        self.assertEqual(b.get_fuera_de_casa("blanco"), 9)
+        self.assertEqual(b.get_pips("blanco"), 167 - 24 + 6)
+        b.__puntos__ = [[] for _ in range(24)]
+        self.assertEqual(b.get_fichas_en_tablero("negro"), 0)
+        self.assertEqual(b.get_pips("negro"), 0)
+
+    def test_hash_incremental_coincide_con_calculo_completo(self):
+        b = Board()
+        self.assertEqual(b.hash(), hash_casillas(b.get_casillas()))
+        b.quitar_ficha(23)
+        b.agregar_barra("blanco")
+        b.agregar_sacada("negro")
+        self.assertEqual(b.hash(), hash_casillas(b.get_casillas()))
+
+    def test_hash_depende_solo_de_la_posicion(self):
+        b1 = Board()
+        b2 = Board()
+        inicial = b1.hash()
+        b1.quitar_ficha(12)
+        b1.agregar_ficha("blanco", 9)
+        b1.quitar_ficha(7)
+        b1.agregar_ficha("blanco", 4)
+        # Mismo resultado con los movimientos en otro orden
+        b2.quitar_ficha(7)
+        b2.agregar_ficha("blanco", 4)
+        b2.quitar_ficha(12)
+        b2.agregar_ficha("blanco", 9)
+        self.assertNotEqual(b1.hash(), inicial)
+        self.assertEqual(b1.hash(), b2.hash())
+        # Deshacer los movimientos vuelve al hash inicial
+        b1.quitar_ficha(9)
+        b1.agregar_ficha("blanco", 12)
+        b1.quitar_ficha(4)
+        b1.agregar_ficha("blanco", 7)
+        self.assertEqual(b1.hash(), inicial)
+
+    def test_ocupados_y_ficha_mas_atrasada(self):
+        b = Board()
+        self.assertEqual(b.get_ocupados("blanco"), (1 << 5) | (1 << 7) | (1 << 12) | (1 << 23))
+        self.assertEqual(b.get_mas_atrasada("blanco"), 23)
+        self.assertEqual(b.get_mas_atrasada("negro"), 0)
+        b.quitar_ficha(23)
+        self.assertEqual(b.get_mas_atrasada("blanco"), 23)
+        b.quitar_ficha(23)
+        self.assertEqual(b.get_mas_atrasada("blanco"), 12)
+        b.aplicar_movimiento(0, 3, "negro")
+        b.aplicar_movimiento(0, 3, "negro")
+        self.assertEqual(b.get_mas_atrasada("negro"), 3)
+        # Las máscaras incrementales coinciden con las de una carga completa
+        copia = Board()
+        copia.cargar_casillas(b.get_casillas())
+        for color in ("blanco", "negro"):
+            self.assertEqual(b.get_ocupados(color), copia.get_ocupados(color))
+        b.__puntos__ = [[] for _ in range(24)]
+        self.assertIsNone(b.get_mas_atrasada("blanco"))
+
+    def test_hay_contacto(self):
+        b = Board()
+        self.assertTrue(b.hay_contacto())
+        casillas = [0] * 28
+        casillas[5], casillas[8], casillas[26] = 3, 2, 10
+        casillas[9], casillas[20], casillas[27] = -1, -4, 10
+        b.cargar_casillas(casillas)
+        self.assertFalse(b.hay_contacto())
+        # Cruzar la última ficha negra vuelve a crear contacto, y deshacerlo lo rompe
+        comio = b.aplicar_movimiento(8, 10, "blanco")
+        self.assertTrue(b.hay_contacto())
+        b.revertir_movimiento(8, 10, "blanco", comio)
+        self.assertFalse(b.hay_contacto())
+        b.aplicar_movimiento(8, 9, "blanco")
+        self.assertTrue(b.hay_contacto())
+
+    def test_hash_espejo_incremental(self):
+        b = Board()
+        # La posición inicial es simétrica
+        self.assertEqual(b.hash_espejo(), b.hash())
+        b.aplicar_movimiento(23, 20, "blanco")
+        b.aplicar_movimiento(20, -1, "blanco")
+        b.aplicar_movimiento(0, 2, "negro")
+        b.quitar_ficha(18)
+        b.agregar_barra("negro")
+        espejo = b.espejar()
+        self.assertEqual(b.hash_espejo(), espejo.hash())
+        self.assertEqual(espejo.hash_espejo(), b.hash())
+        self.assertEqual(b.hash_canonico("negro"), espejo.hash_canonico("blanco"))
+        self.assertEqual(espejo.get_sacadas(), {"blanco": 0, "negro": 1})
+        self.assertEqual(espejo.get_cantidad_barra("blanco"), 1)
+        self.assertEqual(espejo.get_pips("blanco"), b.get_pips("negro"))
+        self.assertEqual(list(espejo.espejar().get_casillas()), list(b.get_casillas()))
+
+    def test_sacadas(self):
+        b = Board()
+        self.assertEqual(b.get_sacadas(), {"blanco": 0, "negro": 0})
+        b.agregar_sacada("negro")
+        self.assertEqual(b.get_sacadas(), {"blanco": 0, "negro": 1})
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
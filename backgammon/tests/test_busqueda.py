@@ -0,0 +1,162 @@
+import unittest
+
+from backgammon.analysis.busqueda import (
+    TIRADAS_DISTINTAS, Busqueda, PoliticaBusqueda, evaluar_por_pips, puntos_ganados,
+)
+from backgammon.core.board import Board, RIVAL, SACADAS
+from backgammon.core.dice import Dice
+from backgammon.core.game import Game
+from backgammon.core.jugadas import espejar_jugada, generar_jugadas
+from backgammon.core.position import Position
+from backgammon.sim import PoliticaAleatoria, jugar_partida
+
+
+def partida(casillas, turno="blanco"):
+    board = Board()
+    board.cargar_casillas(casillas)
+    game = Game("Blanco", "Negro")
+    game.cargar_posicion(Position.desde_board(board, turno))
+    return game
+
+
+def carrera():
+    """Final de carrera chico: blanco con 3 fichas en casa y negro con 3"""
+    casillas = [0] * 28
+    casillas[0] = 2
+    casillas[3] = 1
+    casillas[26] = 12
+    casillas[20] = -2
+    casillas[22] = -1
+    casillas[27] = 12
+    return casillas
+
+
+def valor_jugada(board, color, jugada, profundidad):
+    """Expectiminimax sin poda ni tabla, como referencia"""
+    comidas = [board.aplicar_movimiento(desde, hacia, color) for desde, hacia, _ in jugada]
+    puntos = puntos_ganados(board, color)
+    if puntos:
+        valor = puntos
+    elif profundidad <= 1:
+        valor = -evaluar_por_pips(board, RIVAL[color])
+    else:
+        valor = -valor_azar(board, RIVAL[color], profundidad - 1)
+    for (desde, hacia, _), comio in zip(reversed(jugada), reversed(comidas)):
+        board.revertir_movimiento(desde, hacia, color, comio)
+    return valor
+
+
+def valor_azar(board, color, profundidad):
+    total = 0.0
+    for dados, probabilidad in TIRADAS_DISTINTAS:
+        jugadas = generar_jugadas(board, color, dados)
+        if jugadas:
+            valor = max(valor_jugada(board, color, jugada, profundidad) for jugada in jugadas)
+        elif profundidad <= 1:
+            valor = -evaluar_por_pips(board, RIVAL[color])
+        else:
+            valor = -valor_azar(board, RIVAL[color], profundidad - 1)
+        total += probabilidad * valor
+    return total
+
+
+class TestBusqueda(unittest.TestCase):
+
+    def test_tiradas_distintas(self):
+        self.assertEqual(len(TIRADAS_DISTINTAS), 21)
+        self.assertAlmostEqual(sum(probabilidad for _, probabilidad in TIRADAS_DISTINTAS), 1.0)
+        self.assertIn(([3, 3, 3, 3], 1 / 36), TIRADAS_DISTINTAS)
+
+    def test_puntos_ganados(self):
+        casillas = [0] * 28
+        casillas[26] = 15
+        casillas[20] = -15
+        board = Board()
+        board.cargar_casillas(casillas)
+        self.assertEqual(puntos_ganados(board, "blanco"), 2)
+        self.assertEqual(puntos_ganados(board, "negro"), 0)
+
+        casillas[20], casillas[27] = -14, 1
+        board.cargar_casillas(casillas)
+        self.assertEqual(puntos_ganados(board, "blanco"), 1)
+
+        casillas[20], casillas[27], casillas[2] = -14, 0, -1
+        board.cargar_casillas(casillas)
+        self.assertEqual(puntos_ganados(board, "blanco"), 3)
+
+    def test_profundidad_invalida(self):
+        with self.assertRaises(ValueError):
+            Busqueda(profundidad=0)
+
+    def test_saca_las_ultimas_fichas(self):
+        casillas = carrera()
+        casillas[3], casillas[26] = 0, 13
+        game = partida(casillas)
+        jugada, valor = Busqueda(2).mejor_jugada(game, [2, 1])
+        self.assertEqual(sorted(hacia for _, hacia, _ in jugada), [-1, -1])
+        self.assertEqual(valor, 1.0)
+
+    def test_coincide_con_expectiminimax_sin_poda(self):
+        game = partida(carrera())
+        board = game.get_board()
+        for dados in ([2, 1], [6, 5], [1, 1, 1, 1]):
+            busqueda = Busqueda(2)
+            _, valor = busqueda.mejor_jugada(game, dados)
+            esperado = max(valor_jugada(board, "blanco", jugada, 2) for jugada in generar_jugadas(board, "blanco", dados))
+            self.assertAlmostEqual(valor, esperado)
+
+    def test_evaluar_coincide_y_usa_la_tabla(self):
+        game = partida(carrera(), turno="negro")
+        busqueda = Busqueda(2)
+        valor = busqueda.evaluar(game)
+        self.assertAlmostEqual(valor, valor_azar(game.get_board(), "negro", 2))
+        self.assertEqual(busqueda.evaluar(game), valor)
+        self.assertGreater(busqueda.get_estadisticas()["aciertos_tabla"], 0)
+        busqueda.limpiar()
+        self.assertEqual(busqueda.get_estadisticas()["tabla"], 0)
+
+    def test_tabla_compartida_por_los_dos_colores(self):
+        game = partida(carrera(), turno="negro")
+        espejo = Game("Blanco", "Negro")
+        espejo.cargar_posicion(game.get_posicion().canonica())
+        busqueda = Busqueda(2)
+        valor = busqueda.evaluar(game)
+        aciertos = busqueda.get_estadisticas()["aciertos_tabla"]
+        self.assertEqual(busqueda.evaluar(espejo), valor)
+        self.assertEqual(busqueda.get_estadisticas()["aciertos_tabla"], aciertos + 1)
+        jugada, _ = Busqueda(2).mejor_jugada(game, [4, 2])
+        self.assertEqual(Busqueda(2).mejor_jugada(espejo, [4, 2])[0], espejar_jugada(jugada))
+
+    def test_no_modifica_el_tablero(self):
+        game = Game("Blanco", "Negro")
+        antes = game.get_board().get_casillas()[:]
+        hash_antes = game.hash()
+        jugada, _ = Busqueda(2).mejor_jugada(game, [6, 5])
+        self.assertIsNotNone(jugada)
+        self.assertEqual(game.get_board().get_casillas()[:], antes)
+        self.assertEqual(game.hash(), hash_antes)
+
+    def test_capacidad_de_la_tabla(self):
+        busqueda = Busqueda(2, capacidad_tabla=3)
+        busqueda.mejor_jugada(Game("Blanco", "Negro"), [3, 1])
+        self.assertLessEqual(busqueda.get_estadisticas()["tabla"], 3)
+
+    def test_evaluador_propio(self):
+        # Un evaluador que solo mira las fichas sacadas prefiere sacar antes que mover
+        casillas = carrera()
+        game = partida(casillas)
+        def sacadas(board, color):
+            casillas = board.get_casillas()
+            return (casillas[SACADAS[color]] - casillas[SACADAS[RIVAL[color]]]) / 15
+
+        busqueda = Busqueda(1, evaluador=sacadas)
+        jugada, _ = busqueda.mejor_jugada(game, [4, 1])
+        self.assertIn(-1, [hacia for _, hacia, _ in jugada])
+
+    def test_politica_busqueda(self):
+        resultado = jugar_partida(PoliticaBusqueda(), PoliticaAleatoria(3), max_turnos=400, dice=Dice(semilla=5))
+        self.assertEqual(resultado.ganador, "blanco")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+
+from backgammon.core.board import Board
+from backgammon.core.cache import CACHE_JUGADAS, CacheJugadas
+from backgammon.core.game import Game
+from backgammon.core.jugadas import espejar_jugada, generar_jugadas
+
+
+def finales(board, color, jugadas):
+    """Hashes de las posiciones a las que llevan las jugadas"""
+    resultado = set()
+    for jugada in jugadas:
+        comidas = [board.aplicar_movimiento(desde, hacia, color) for desde, hacia, _ in jugada]
+        resultado.add(board.hash())
+        for (desde, hacia, _), comio in zip(reversed(jugada), reversed(comidas)):
+            board.revertir_movimiento(desde, hacia, color, comio)
+    return resultado
+
+
+class TestCacheJugadas(unittest.TestCase):
+
+    def test_fallo_y_acierto(self):
+        cache = CacheJugadas(capacidad=10)
+        board = Board()
+        primera = cache.obtener(board, "blanco", [3, 1])
+        segunda = cache.obtener(board, "blanco", [1, 3])
+        self.assertEqual(primera, generar_jugadas(Board(), "blanco", [3, 1]))
+        self.assertEqual(primera, segunda)
+        self.assertEqual(cache.get_fallos(), 1)
+        self.assertEqual(cache.get_aciertos(), 1)
+        self.assertEqual(len(cache), 1)
+
+    def test_colores_comparten_la_forma_canonica(self):
+        # La posición inicial es su propio espejo: negro reutiliza las jugadas de blanco espejadas
+        cache = CacheJugadas(capacidad=10)
+        board = Board()
+        blanco = cache.obtener(board, "blanco", [3, 1])
+        negro = cache.obtener(board, "negro", [3, 1])
+        self.assertNotEqual(blanco, negro)
+        self.assertEqual(sorted(negro), sorted(generar_jugadas(board, "negro", [3, 1])))
+        self.assertEqual(cache.get_fallos(), 1)
+        self.assertEqual(cache.get_aciertos(), 1)
+
+    def test_orden_no_depende_de_la_historia(self):
+        # Con la caché fría, calentada por blanco o desactivada, negro recibe la misma lista
+        tableros = [Board()]
+        tableros.append(Board())
+        tableros[1].aplicar_movimiento(12, 7, "blanco")
+        for board in tableros:
+            for dados in ([3, 1], [6, 6, 6, 6], [5, 2]):
+                fria = CacheJugadas(capacidad=10).obtener(board, "negro", dados)
+                caliente = CacheJugadas(capacidad=10)
+                caliente.obtener(board.espejar(), "blanco", dados)
+                self.assertEqual(caliente.obtener(board, "negro", dados), fria)
+                self.assertEqual(CacheJugadas(capacidad=0).obtener(board, "negro", dados), fria)
+                self.assertEqual(finales(board, "negro", fria), finales(board, "negro", generar_jugadas(board, "negro", dados)))
+
+    def test_color_es_parte_de_la_clave(self):
+        cache = CacheJugadas(capacidad=10)
+        board = Board()
+        board.aplicar_movimiento(12, 7, "blanco")
+        blanco = cache.obtener(board, "blanco", [3, 1])
+        negro = cache.obtener(board, "negro", [3, 1])
+        self.assertEqual(sorted(negro), sorted(generar_jugadas(board, "negro", [3, 1])))
+        self.assertEqual(cache.get_fallos(), 2)
+        # El espejo con blanco al turno es la misma entrada que negro en el tablero original
+        self.assertEqual(sorted(cache.obtener(board.espejar(), "blanco", [1, 3])),
+                         sorted(espejar_jugada(jugada) for jugada in negro))
+        self.assertEqual(cache.get_fallos(), 2)
+        self.assertNotEqual(blanco, negro)
+
+    def test_resultado_modificable_no_afecta_la_cache(self):
+        cache = CacheJugadas(capacidad=10)
+        jugadas = cache.obtener(Board(), "blanco", [6, 5])
+        cantidad = len(jugadas)
+        jugadas.clear()
+        self.assertEqual(len(cache.obtener(Board(), "blanco", [6, 5])), cantidad)
+
+    def test_desalojo_lru(self):
+        cache = CacheJugadas(capacidad=2)
+        board = Board()
+        cache.obtener(board, "blanco", [3, 1])
+        cache.obtener(board, "blanco", [6, 5])
+        cache.obtener(board, "blanco", [3, 1])  # [3, 1] pasa a ser la más reciente
+        cache.obtener(board, "blanco", [4, 2])  # Desaloja [6, 5]
+        self.assertEqual(cache.get_desalojos(), 1)
+        cache.obtener(board, "blanco", [3, 1])
+        self.assertEqual(cache.get_aciertos(), 2)
+        cache.obtener(board, "blanco", [6, 5])
+        self.assertEqual(cache.get_fallos(), 4)
+
+    def test_capacidad(self):
+        cache = CacheJugadas(capacidad=3)
+        for dados in ([3, 1], [6, 5], [4, 2]):
+            cache.obtener(Board(), "blanco", dados)
+        cache.set_capacidad(1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get_desalojos(), 2)
+        with self.assertRaises(ValueError):
+            cache.set_capacidad(-1)
+
+    def test_capacidad_cero_no_guarda(self):
+        cache = CacheJugadas(capacidad=0)
+        self.assertEqual(len(cache.obtener(Board(), "blanco", [3, 1])), 16)
+        self.assertEqual(len(cache), 0)
+
+    def test_estadisticas_y_limpiar(self):
+        cache = CacheJugadas(capacidad=10)
+        cache.obtener(Board(), "blanco", [3, 1])
+        cache.obtener(Board(), "blanco", [3, 1])
+        estadisticas = cache.get_estadisticas()
+        self.assertEqual(estadisticas["aciertos"], 1)
+        self.assertEqual(estadisticas["fallos"], 1)
+        self.assertEqual(estadisticas["tasa_aciertos"], 0.5)
+        cache.limpiar()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.get_estadisticas()["tasa_aciertos"], 0.0)
+
+    def test_game_usa_la_cache(self):
+        cache = CacheJugadas(capacidad=10)
+        game = Game("Ana", "Luis", cache=cache)
+        self.assertIs(game.get_cache(), cache)
+        game.movimientos_legales([3, 1])
+        game.movimientos_legales([1, 3])
+        self.assertEqual(cache.get_aciertos(), 1)
+        self.assertIs(Game("Ana", "Luis").get_cache(), CACHE_JUGADAS)
+
+
+if __name__ == "__main__":
+    unittest.main()
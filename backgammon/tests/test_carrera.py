@@ -0,0 +1,74 @@
+import unittest
+
+from backgammon.analysis import (
+    Busqueda, EvaluadorCarrera, conteo_keith, conteo_thorp, evaluador_por_fase, probabilidad_carrera,
+)
+from backgammon.core.board import Board
+from backgammon.core.game import Game
+from backgammon.core.position import Position
+
+
+def carrera(blanco, negro):
+    """Tablero sin contacto: `blanco` y `negro` son {punto desde el borde (1-24): fichas}"""
+    casillas = [0] * 28
+    for punto, fichas in blanco.items():
+        casillas[punto - 1] = fichas
+    for punto, fichas in negro.items():
+        casillas[24 - punto] = -fichas
+    casillas[26] = 15 - sum(blanco.values())
+    casillas[27] = 15 - sum(negro.values())
+    board = Board()
+    board.cargar_casillas(casillas)
+    return board
+
+
+class TestCarrera(unittest.TestCase):
+
+    def test_conteo_keith(self):
+        # 3 en el punto 1, 2 en el 2, 4 en el 3 y puntos 4 y 6 vacíos
+        board = carrera({1: 3, 2: 2, 3: 4, 5: 1}, {6: 2})
+        self.assertEqual(board.get_pips("blanco"), 24)
+        self.assertEqual(conteo_keith(board, "blanco"), 24 + 4 + 1 + 1 + 2)
+        self.assertEqual(conteo_keith(board, "negro"), 12 + 2)
+
+    def test_conteo_thorp(self):
+        board = carrera({1: 3, 2: 2, 3: 4, 5: 1}, {6: 2})
+        self.assertEqual(conteo_thorp(board, "blanco"), 24 + 20 + 3 - 4)
+        self.assertEqual(conteo_thorp(board, "negro"), 12 + 4 - 1)
+
+    def test_probabilidad_carrera(self):
+        self.assertEqual(probabilidad_carrera(0, 10), 1.0)
+        self.assertEqual(probabilidad_carrera(10, 0), 0.0)
+        # En una carrera pareja el turno vale algo, y más pips en contra bajan la probabilidad
+        self.assertGreater(probabilidad_carrera(80, 80), 0.5)
+        self.assertLess(probabilidad_carrera(80, 80), 0.7)
+        self.assertLess(probabilidad_carrera(90, 80), probabilidad_carrera(80, 80))
+        self.assertAlmostEqual(probabilidad_carrera(100, 100) + probabilidad_carrera(108, 100), 1.0, delta=0.1)
+
+    def test_memoria_por_posicion(self):
+        evaluador = EvaluadorCarrera("thorp")
+        board = carrera({1: 3, 2: 2}, {6: 2, 5: 2})
+        equidad = evaluador(board, "blanco")
+        self.assertEqual(evaluador(board, "blanco"), equidad)
+        self.assertAlmostEqual(evaluador.probabilidad(board, "blanco"), (equidad + 1) / 2)
+        self.assertEqual(evaluador.get_estadisticas(), {"aciertos": 2, "entradas": 1})
+        with self.assertRaises(ValueError):
+            EvaluadorCarrera("otro")
+
+    def test_como_evaluador_de_busqueda(self):
+        board = carrera({8: 2, 1: 1}, {6: 3})
+        game = Game("Blanco", "Negro")
+        game.cargar_posicion(Position.desde_board(board, "blanco"))
+        jugada, valor = Busqueda(profundidad=1, evaluador=EvaluadorCarrera()).mejor_jugada(game, [6, 1])
+        self.assertIsNotNone(jugada)
+        self.assertTrue(-1.0 <= valor <= 1.0)
+
+    def test_evaluador_por_fase(self):
+        evaluar = evaluador_por_fase(lambda board, color: 0.25)
+        self.assertEqual(evaluar(Board(), "blanco"), 0.25)
+        board = carrera({1: 3, 2: 2}, {6: 2, 5: 2})
+        self.assertEqual(evaluar(board, "blanco"), EvaluadorCarrera()(board, "blanco"))
+
+
+if __name__ == "__main__":
+    unittest.main()
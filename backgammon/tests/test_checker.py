@@ -10,5 +10,15 @@ class TestChecker(unittest.TestCase):
         c = Checker("negro")
         self.assertEqual(str(c), "negro")
 
+    def test_instancia_compartida_por_color(self):
+        self.assertIs(Checker("blanco"), Checker("blanco"))
+        self.assertIsNot(Checker("blanco"), Checker("negro"))
+
+    def test_inmutable(self):
+        c = Checker("blanco")
+        with self.assertRaises(AttributeError):
+            c.__color__ = "negro"
+        self.assertFalse(hasattr(c, "__dict__"))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -9,6 +9,20 @@ from backgammon.core.game import Game
 from backgammon.core.exceptions import MovimientoInvalidoError, JuegoTerminadoError
 
 
+def parchar(objeto, nombre, **kwargs):
+    """
+    patch.object sobre una sola instancia de una clase con __slots__ (sin __dict__)
+
+    La instancia pasa a una subclase vacía propia y el parche se aplica sobre esa subclase, así
+    no alcanza a otras instancias de la clase.
+    """
+    clase = type(objeto)
+    if "_parchable" not in vars(clase):
+        clase = type(clase.__name__, (clase,), {"__slots__": (), "_parchable": True})
+        objeto.__class__ = clase
+    return patch.object(clase, nombre, **kwargs)
+
+
 class TestBackgammonCLI(unittest.TestCase):
     """Tests completos para BackgammonCLI"""
     
@@ -20,6 +34,15 @@ class TestBackgammonCLI(unittest.TestCase):
         """Limpieza después de cada test"""
         self.cli = None
     
+    def test_parchar_solo_afecta_la_instancia(self):
+        """El parche de una instancia no alcanza a otras partidas"""
+        game, otra = Game("Colo", "Juan"), Game("Ana", "Luis")
+        with parchar(game, 'tirar_dados', return_value=[3, 5]):
+            self.assertEqual(game.tirar_dados(), [3, 5])
+            self.assertIsNot(type(otra).tirar_dados, type(game).tirar_dados)
+            self.assertIsInstance(game, Game)
+        self.assertIs(type(game).tirar_dados, Game.tirar_dados)
+    
     def test_inicializacion(self):
         """Test de inicialización del CLI"""
         self.assertIsNone(self.cli.__game__)
@@ -78,8 +101,8 @@ class TestBackgammonCLI(unittest.TestCase):
         # Crear partida
         self.cli.__game__ = Game("Colo", "Juan")
         
-        with patch.object(self.cli.__game__, 'tirar_dados', return_value=[3, 5]) as mock_tirar:
-            with patch.object(self.cli.__game__.get_dice(), 'es_doble', return_value=False):
+        with parchar(self.cli.__game__, 'tirar_dados', return_value=[3, 5]) as mock_tirar:
+            with parchar(self.cli.__game__.get_dice(), 'es_doble', return_value=False):
                 with patch('builtins.print') as mock_print:
                     self.cli._tirar_dados()
                     
@@ -94,13 +117,26 @@ class TestBackgammonCLI(unittest.TestCase):
                     self.assertTrue(any("Dados: [3, 5]" in str(call) for call in mock_print.call_args_list))
                     self.assertTrue(any("Dados disponibles: [3, 5]" in str(call) for call in mock_print.call_args_list))
     
+    def test_tirar_dados_sin_movimientos_pasa_turno(self):
+        """Test de pase automático cuando la tirada no se puede jugar"""
+        self.cli.__game__ = Game("Colo", "Juan")
+        
+        with parchar(self.cli.__game__, 'tirar_dados', return_value=[3, 5]):
+            with parchar(self.cli.__game__, 'tiene_movimiento_legal', return_value=False):
+                with patch('builtins.print') as mock_print:
+                    self.cli._tirar_dados()
+                    
+                    self.assertEqual(self.cli.__game__.get_turno_actual().get_color(), "negro")
+                    self.assertEqual(self.cli.__dados_disponibles__, [])
+                    self.assertTrue(any("No hay movimientos posibles" in str(call) for call in mock_print.call_args_list))
+    
     def test_tirar_dados_doble(self):
         """Test de tirar dados dobles"""
         # Crear partida
         self.cli.__game__ = Game("Colo", "Juan")
         
-        with patch.object(self.cli.__game__, 'tirar_dados', return_value=[4, 4, 4, 4]) as mock_tirar:
-            with patch.object(self.cli.__game__.get_dice(), 'es_doble', return_value=True):
+        with parchar(self.cli.__game__, 'tirar_dados', return_value=[4, 4, 4, 4]) as mock_tirar:
+            with parchar(self.cli.__game__.get_dice(), 'es_doble', return_value=True):
                 with patch('builtins.print') as mock_print:
                     self.cli._tirar_dados()
                     
@@ -129,6 +165,52 @@ class TestBackgammonCLI(unittest.TestCase):
             # Verificar mensaje de error
             self.assertTrue(any("No hay dados disponibles" in str(call) for call in mock_print.call_args_list))
     
+    def test_ver_jugadas_sin_dados(self):
+        """Test que falla al ver jugadas sin dados"""
+        self.cli.__game__ = Game("Colo", "Juan")
+        
+        with patch('builtins.print') as mock_print:
+            self.cli._ver_jugadas()
+            
+            self.assertTrue(any("No hay dados disponibles" in str(call) for call in mock_print.call_args_list))
+    
+    def test_ver_jugadas_con_dados(self):
+        """Test de listado de jugadas legales"""
+        self.cli.__game__ = Game("Colo", "Juan")
+        self.cli.__dados_disponibles__ = [3, 1]
+        
+        with patch('builtins.print') as mock_print:
+            self.cli._procesar_comando("jugadas")
+            
+            self.assertTrue(any("JUGADAS LEGALES (16)" in str(call) for call in mock_print.call_args_list))
+            self.assertTrue(any("8/5" in str(call) and "6/5" in str(call) for call in mock_print.call_args_list))
+    
+    def test_sugerir_jugada(self):
+        """Test de la sugerencia de la búsqueda"""
+        self.cli.__game__ = Game("Colo", "Juan")
+        self.cli.__dados_disponibles__ = [6, 5]
+        
+        with patch('builtins.print') as mock_print:
+            self.cli._procesar_comando("sugerir")
+            
+            self.assertTrue(any("SUGERENCIA" in str(call) and "equidad" in str(call) for call in mock_print.call_args_list))
+    
+    def test_sugerir_reusa_la_tabla(self):
+        """Test de que las sugerencias comparten la tabla de transposición"""
+        self.cli.__game__ = Game("Colo", "Juan")
+        self.cli.__dados_disponibles__ = [6, 5]
+        busqueda = self.cli.__busqueda__
+        
+        with patch('builtins.print'):
+            self.cli._sugerir_jugada()
+            tabla = busqueda.get_estadisticas()["tabla"]
+            aciertos = busqueda.get_estadisticas()["aciertos_tabla"]
+            self.cli._sugerir_jugada()
+        
+        self.assertIs(self.cli.__busqueda__, busqueda)
+        self.assertGreater(tabla, 0)
+        self.assertGreater(busqueda.get_estadisticas()["aciertos_tabla"], aciertos)
+    
     def test_cambiar_turno_sin_partida(self):
         """Test que falla al cambiar turno sin partida"""
         with patch('builtins.print') as mock_print:
@@ -144,7 +226,7 @@ class TestBackgammonCLI(unittest.TestCase):
         self.cli.__dados_disponibles__ = [3, 5]
         self.cli.__dados_usados__ = [2]
         
-        with patch.object(self.cli.__game__, 'cambiar_turno') as mock_cambiar:
+        with parchar(self.cli.__game__, 'cambiar_turno') as mock_cambiar:
             with patch('builtins.print') as mock_print:
                 self.cli._cambiar_turno()
                 
@@ -247,6 +329,7 @@ class TestBackgammonCLI(unittest.TestCase):
             # Verificar que se muestra el tablero
             self.assertTrue(any("TABLERO DE BACKGAMMON" in str(call) for call in mock_print.call_args_list))
             self.assertTrue(any("TURNO ACTUAL" in str(call) for call in mock_print.call_args_list))
+            self.assertTrue(any("Pips - Blancas: 167 | Negras: 167" in str(call) for call in mock_print.call_args_list))
     
     def test_ver_tablero_con_fichas_en_barra(self):
         """Test de mostrar tablero con fichas en barra"""
@@ -357,7 +440,7 @@ class TestBackgammonCLI(unittest.TestCase):
         self.cli.__game__ = Game("Colo", "Juan")
         self.cli.__dados_disponibles__ = [3, 5]
         
-        with patch.object(self.cli.__game__, 'cambiar_turno') as mock_cambiar:
+        with parchar(self.cli.__game__, 'cambiar_turno') as mock_cambiar:
             with patch('builtins.print'):
                 self.cli._cambiar_turno()
                 
@@ -394,7 +477,7 @@ class TestBackgammonCLI(unittest.TestCase):
         self.cli.__game__ = Game("Colo", "Juan")
         self.cli.__dados_disponibles__ = [3, 5]
         
-        with patch.object(self.cli.__game__, 'mover_ficha') as mock_mover:
+        with parchar(self.cli.__game__, 'mover_ficha') as mock_mover:
             with patch('builtins.print'):
                 self.cli._mover_ficha()
                 
@@ -459,9 +542,9 @@ class TestBackgammonCLI(unittest.TestCase):
         self.cli.__dados_disponibles__ = [3, 5]
         
         # Simular que el juego termina después del movimiento
-        with patch.object(self.cli.__game__, 'juego_terminado', return_value=True):
-            with patch.object(self.cli.__game__, 'get_ganador', return_value=self.cli.__game__.get_player1()):
-                with patch.object(self.cli.__game__, 'mover_ficha'):
+        with parchar(self.cli.__game__, 'juego_terminado', return_value=True):
+            with parchar(self.cli.__game__, 'get_ganador', return_value=self.cli.__game__.get_player1()):
+                with parchar(self.cli.__game__, 'mover_ficha'):
                     with patch('builtins.print'):
                         self.cli._mover_ficha()
     
@@ -471,7 +554,7 @@ class TestBackgammonCLI(unittest.TestCase):
         self.cli.__game__ = Game("Colo", "Juan")
         self.cli.__dados_disponibles__ = [3]  # Solo un dado
         
-        with patch.object(self.cli.__game__, 'mover_ficha'):
+        with parchar(self.cli.__game__, 'mover_ficha'):
             with patch('builtins.print'):
                 self.cli._mover_ficha()
                 # Verificar que se usaron todos los dados
@@ -486,7 +569,7 @@ class TestBackgammonCLI(unittest.TestCase):
         # Agregar ficha a la barra
         self.cli.__game__.get_board().agregar_barra("blanco")
         
-        with patch.object(self.cli.__game__, 'mover_ficha') as mock_mover:
+        with parchar(self.cli.__game__, 'mover_ficha') as mock_mover:
             with patch('builtins.print'):
                 self.cli._mover_ficha()
                 # Verificar que se llamó mover_ficha desde barra
@@ -498,7 +581,7 @@ class TestBackgammonCLI(unittest.TestCase):
         self.cli.__game__ = Game("Colo", "Juan")
         self.cli.__dados_disponibles__ = [1, 5]
         
-        with patch.object(self.cli.__game__, 'mover_ficha'):
+        with parchar(self.cli.__game__, 'mover_ficha'):
             with patch('builtins.print'):
                 try:
                     self.cli._mover_ficha()
@@ -621,7 +704,7 @@ class TestBackgammonCLI(unittest.TestCase):
         cli = BackgammonCLI()
         cli.__game__ = Game("Colo", "Juan")
         # Simular error al tirar dados
-        with patch.object(cli.__game__, 'tirar_dados', side_effect=Exception("Error")):
+        with parchar(cli.__game__, 'tirar_dados', side_effect=Exception("Error")):
             with patch('builtins.print') as mock_print:
                 cli._tirar_dados()
                 # Debería mostrar error
@@ -634,7 +717,7 @@ class TestBackgammonCLI(unittest.TestCase):
         cli.__game__.tirar_dados()
         with patch('builtins.input', side_effect=['5', '4']):
             # Simular error general
-            with patch.object(cli.__game__, 'mover_ficha', side_effect=Exception("Error general")):
+            with parchar(cli.__game__, 'mover_ficha', side_effect=Exception("Error general")):
                 with patch('builtins.print') as mock_print:
                     cli._mover_ficha()
                     # Debería mostrar error
@@ -656,7 +739,7 @@ class TestBackgammonCLI(unittest.TestCase):
         cli = BackgammonCLI()
         cli.__game__ = Game("Colo", "Juan")
         # Simular error al cambiar turno
-        with patch.object(cli.__game__, 'cambiar_turno', side_effect=Exception("Error")):
+        with parchar(cli.__game__, 'cambiar_turno', side_effect=Exception("Error")):
             with patch('builtins.print') as mock_print:
                 cli._cambiar_turno()
                 # Debería manejar la excepción
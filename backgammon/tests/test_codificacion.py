@@ -0,0 +1,103 @@
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional: sin él se saltean estos tests
+    np = None
+
+from backgammon.cli.main import BackgammonCLI
+from backgammon.core.board import Board
+from backgammon.core.game import Game
+
+if np is not None:
+    from backgammon.analysis.codificacion import (
+        ENTRADAS_COMPACTA, ENTRADAS_TESAURO, codificar_compacta, codificar_tesauro,
+    )
+
+
+def casillas_iniciales():
+    return list(Game("Blanco", "Negro").get_board().get_casillas())
+
+
+def codificar_lento(casillas, color):
+    """Codificación de Tesauro ficha por ficha, como referencia"""
+    rival = "negro" if color == "blanco" else "blanco"
+    signo = 1 if color == "blanco" else -1
+    entradas = []
+    for lado in (signo, -signo):
+        for distancia in range(24):
+            punto = distancia if color == "blanco" else 23 - distancia
+            fichas = max(casillas[punto] * lado, 0)
+            entradas += [float(fichas >= 1), float(fichas >= 2), float(fichas >= 3), max(fichas - 3, 0) / 2]
+    barra = {"blanco": 24, "negro": 25}
+    sacadas = {"blanco": 26, "negro": 27}
+    entradas += [casillas[barra[color]] / 2, casillas[barra[rival]] / 2]
+    entradas += [casillas[sacadas[color]] / 15, casillas[sacadas[rival]] / 15, 1.0, 0.0]
+    return entradas
+
+
+@unittest.skipIf(np is None, "numpy no está instalado")
+class TestCodificacion(unittest.TestCase):
+
+    def setUp(self):
+        casillas = [0] * 28
+        casillas[0], casillas[5], casillas[12], casillas[24], casillas[26] = 6, 1, -2, 1, 7
+        casillas[3], casillas[20], casillas[23], casillas[25], casillas[27] = -1, -5, 2, 2, 7
+        self.mixta = casillas
+
+    def test_coincide_con_la_referencia(self):
+        lote = [casillas_iniciales(), self.mixta, self.mixta]
+        colores = ["blanco", "blanco", "negro"]
+        entradas = codificar_tesauro(lote, colores)
+        self.assertEqual(entradas.shape, (3, ENTRADAS_TESAURO))
+        self.assertEqual(entradas.dtype, np.float32)
+        for fila, casillas, color in zip(entradas, lote, colores):
+            np.testing.assert_allclose(fila, codificar_lento(casillas, color))
+
+    def test_simetria(self):
+        casillas = casillas_iniciales()
+        entradas = codificar_tesauro([casillas, casillas], ["blanco", "negro"])
+        np.testing.assert_array_equal(entradas[0], entradas[1])
+
+    def test_posiciones_del_cli(self):
+        cli = BackgammonCLI()
+        cli.__game__ = Game("Blanco", "Negro")
+        posiciones = cli._obtener_posiciones()
+        np.testing.assert_array_equal(
+            codificar_tesauro([posiciones]), codificar_tesauro([casillas_iniciales()]),
+        )
+        # Sin barra ni sacadas en la entrada: todas las fichas que faltan cuentan como sacadas
+        sacadas = codificar_compacta(np.array([self.mixta[:24]]))[0, 98:]
+        np.testing.assert_allclose(sacadas, [6 / 15, 7 / 15])
+
+    def test_salida_reservada(self):
+        salida = np.zeros((4, ENTRADAS_TESAURO), dtype=np.float32)
+        resultado = codificar_tesauro(np.array([self.mixta] * 4, dtype=np.int8), "negro", salida)
+        self.assertIs(resultado, salida)
+        np.testing.assert_allclose(salida[2], codificar_lento(self.mixta, "negro"))
+        with self.assertRaises(ValueError):
+            codificar_tesauro([self.mixta], "blanco", np.zeros((2, ENTRADAS_TESAURO), dtype=np.float32))
+
+    def test_compacta(self):
+        entradas = codificar_compacta([self.mixta], "blanco")
+        self.assertEqual(entradas.shape, (1, ENTRADAS_COMPACTA))
+        self.assertEqual(list(entradas[0, 0:4]), [0.0, 1.0, 0.0, 0.0])  # 6 fichas propias en el punto 1
+        self.assertEqual(list(entradas[0, 20:24]), [1.0, 0.0, 0.0, 0.0])  # Ficha sola en el punto 6
+        self.assertEqual(list(entradas[0, 12:16]), [0.0, 0.0, 1.0, 0.0])  # Ficha sola rival en el punto 4
+        np.testing.assert_allclose(entradas[0, 96:], [0.5, 1.0, 7 / 15, 7 / 15])
+
+    def test_formas_invalidas(self):
+        with self.assertRaises(ValueError):
+            codificar_tesauro(np.zeros((2, 26)))
+        with self.assertRaises(ValueError):
+            codificar_tesauro(np.zeros((2, 24)), ["blanco"])
+
+    def test_desde_board(self):
+        board = Board()
+        board.cargar_casillas(self.mixta)
+        tablero = np.frombuffer(board.get_casillas(), dtype=np.int8)
+        np.testing.assert_allclose(codificar_tesauro(tablero, "blanco")[0], codificar_lento(self.mixta, "blanco"))
+
+
+if __name__ == "__main__":
+    unittest.main()
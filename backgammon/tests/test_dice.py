@@ -1,7 +1,8 @@
+import random
 import unittest
 from unittest.mock import patch
 
-from backgammon.core.dice import Dice
+from backgammon.core.dice import Dice, TIRADAS
 
 class TestDice(unittest.TestCase):
     def test_estado_inicial(self):
@@ -9,6 +10,7 @@ class TestDice(unittest.TestCase):
         self.assertEqual(d.get_dado1(), 0)
         self.assertEqual(d.get_dado2(), 0)
         self.assertFalse(d.es_doble())
+        self.assertFalse(hasattr(d, "__dict__"))
         self.assertEqual(d.get_valores(), [0, 0])
 
 
@@ -32,6 +34,59 @@ class TestDice(unittest.TestCase):
         self.assertTrue(d.es_doble())
         self.assertEqual(d.get_valores(), [4, 4, 4, 4])
 
+    def test_semilla_reproducible(self):
+        primeros = [Dice(semilla=42).tirar() for _ in range(3)]
+        d1 = Dice(semilla=42)
+        d2 = Dice(rng=random.Random(42))
+        self.assertEqual([d1.tirar() for _ in range(20)], [d2.tirar() for _ in range(20)])
+        self.assertEqual(primeros[0], primeros[1])
+
+    @patch("backgammon.core.dice.random.randint", side_effect=AssertionError("no debe usar el generador global"))
+    def test_generador_propio_no_usa_el_global(self, _mock_randint):
+        d = Dice(semilla=1)
+        for _ in range(10):
+            self.assertTrue(all(1 <= valor <= 6 for valor in d.tirar()))
+
+    def test_modo_buffer(self):
+        d = Dice(semilla=7, tamano_buffer=8)
+        tiradas = []
+        for _ in range(50):  # Varias recargas del buffer
+            valores = d.tirar()
+            tiradas.append((d.get_dado1(), d.get_dado2()))
+            self.assertEqual(d.es_doble(), d.get_dado1() == d.get_dado2())
+            self.assertEqual(len(valores), 4 if d.es_doble() else 2)
+        otro = Dice(semilla=7, tamano_buffer=8)
+        self.assertEqual(tiradas, [tuple(otro.tirar()[:2]) for _ in range(50)])
+
+    def test_tirar_lote(self):
+        d = Dice(semilla=3)
+        d.tirar()
+        ultima = d.get_valores()
+        lote = d.tirar_lote(3600)
+        self.assertEqual(len(lote), 3600)
+        self.assertEqual(set(lote), set(TIRADAS))
+        self.assertEqual(d.get_valores(), ultima)
+        self.assertEqual(d.tirar_lote(0), [])
+        with self.assertRaises(ValueError):
+            d.tirar_lote(-1)
+
+    def test_tirar_lote_consume_el_buffer(self):
+        d = Dice(semilla=5, tamano_buffer=10)
+        d.tirar()
+        lote = d.tirar_lote(25)
+        otro = Dice(semilla=5, tamano_buffer=10)
+        secuencia = [tuple(otro.tirar()[:2]) for _ in range(10)]
+        self.assertEqual(lote[:9], secuencia[1:])
+
+    def test_reiniciar_conserva_el_generador(self):
+        d = Dice(semilla=9, tamano_buffer=4)
+        d.tirar()
+        d.reiniciar()
+        self.assertEqual(d.get_valores(), [0, 0])
+        self.assertTrue(all(1 <= valor <= 6 for valor in d.tirar()))
+        with self.assertRaises(ValueError):
+            Dice(tamano_buffer=-1)
+
     def test_repr(self):
         d = Dice()
         rep = repr(d)
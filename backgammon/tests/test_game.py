@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import patch
 
+from backgammon.core import reglas
+from backgammon.core.dice import Dice
 from backgammon.core.game import Game
 from backgammon.core.exceptions import GameError, MovimientoInvalidoError, JuegoTerminadoError
 
@@ -42,6 +44,7 @@ class TestGame(unittest.TestCase):
         self.assertEqual(game.get_player1().get_name(), "Colo")
         self.assertEqual(game.get_player2().get_name(), "Juan")
         self.assertEqual(game.get_turno_actual(), game.get_player1())
+        self.assertFalse(hasattr(game, "__dict__"))
     
     def test_cambiar_turno(self):
         """Test de cambio de turnos"""
@@ -58,6 +61,18 @@ class TestGame(unittest.TestCase):
         game.cambiar_turno()
         self.assertEqual(game.get_turno_actual(), game.get_player1())
     
+    def test_hash_incluye_turno(self):
+        """Test de que el hash de la partida distingue al jugador que mueve"""
+        game = Game("Colo", "Juan")
+        hash_blanco = game.hash()
+        game.cambiar_turno()
+        self.assertNotEqual(game.hash(), hash_blanco)
+        game.cambiar_turno()
+        self.assertEqual(game.hash(), hash_blanco)
+        
+        game.mover_ficha(5, 4, valor_dado=1)
+        self.assertNotEqual(game.hash(), hash_blanco)
+    
     @patch("backgammon.core.dice.random.randint", side_effect=[3, 5])
     def test_tirar_dados_normal(self, _mock_randint):
         """Test de tirar dados con valores normales"""
@@ -653,6 +668,168 @@ class TestGame(unittest.TestCase):
         self.assertEqual(game.get_tipo_victoria(), "gammon")
         self.assertEqual(game.get_puntos_victoria(), 2)
 
+    
+    def test_mover_ficha_retorna_registro(self):
+        """Test de que mover_ficha retorna el registro compacto del movimiento"""
+        game = Game("Colo", "Juan")
+        game.get_board().agregar_ficha("negro", 4)
+        
+        movimiento = game.mover_ficha(5, 4, valor_dado=1)
+        self.assertEqual((movimiento.desde, movimiento.hacia, movimiento.dado), (5, 4, 1))
+        self.assertEqual(movimiento.color, "blanco")
+        self.assertTrue(movimiento.comio)
+        self.assertFalse(movimiento.sacada)
+        self.assertFalse(movimiento.fin)
+    
+    def test_deshacer_y_rehacer_movimiento_con_captura(self):
+        """Test de deshacer y rehacer un movimiento que come una ficha"""
+        game = Game("Colo", "Juan")
+        game.get_board().agregar_ficha("negro", 4)
+        posicion_inicial = game.get_posicion()
+        hash_inicial = game.hash()
+        
+        movimiento = game.mover_ficha(5, 4, valor_dado=1)
+        posicion_final = game.get_posicion()
+        
+        self.assertEqual(game.deshacer(), movimiento)
+        self.assertEqual(game.get_posicion(), posicion_inicial)
+        self.assertEqual(game.hash(), hash_inicial)
+        self.assertEqual(game.get_board().get_pips("negro"), posicion_inicial.to_board().get_pips("negro"))
+        self.assertIsNone(game.deshacer())
+        
+        self.assertEqual(game.rehacer(), movimiento)
+        self.assertEqual(game.get_posicion(), posicion_final)
+        self.assertIsNone(game.rehacer())
+    
+    def test_deshacer_bear_off_que_termina_la_partida(self):
+        """Test de deshacer el bear off ganador: la partida vuelve a estar en juego"""
+        game = Game("Colo", "Juan")
+        game.get_board().__puntos__ = [[] for _ in range(24)]
+        game.get_board().agregar_ficha("blanco", 0)
+        game.get_board().agregar_ficha("negro", 20)
+        
+        movimiento = game.mover_ficha(0, -1, valor_dado=1)
+        self.assertTrue(movimiento.sacada)
+        self.assertTrue(movimiento.fin)
+        self.assertTrue(game.juego_terminado())
+        
+        game.deshacer()
+        self.assertFalse(game.juego_terminado())
+        self.assertIsNone(game.get_ganador())
+        self.assertIsNone(game.get_tipo_victoria())
+        self.assertEqual(game.get_fichas_sacadas()["blanco"], 0)
+        self.assertEqual(len(game.get_board().get_puntos()[0]), 1)
+        
+        game.rehacer()
+        self.assertTrue(game.juego_terminado())
+        self.assertEqual(game.get_tipo_victoria(), "gammon")
+    
+    def test_nuevo_movimiento_descarta_rehacer(self):
+        """Test de que un movimiento nuevo descarta los movimientos deshechos"""
+        game = Game("Colo", "Juan")
+        game.mover_ficha(5, 4, valor_dado=1)
+        game.deshacer()
+        game.mover_ficha(7, 4, valor_dado=3)
+        self.assertIsNone(game.rehacer())
+
+    
+    def test_movimientos_legales(self):
+        """Test de generación de jugadas legales para el jugador actual"""
+        game = Game("Colo", "Juan")
+        jugadas = game.movimientos_legales([3, 1])
+        self.assertEqual(len(jugadas), 16)
+        
+        game.cambiar_turno()
+        for jugada in game.movimientos_legales([3, 1]):
+            self.assertTrue(all(hacia > desde for desde, hacia, _ in jugada))
+        
+        game.__juego_terminado__ = True
+        self.assertEqual(game.movimientos_legales([3, 1]), [])
+    
+    def test_es_movimiento_valido(self):
+        """Test de validación sin excepciones ni cambios en el tablero"""
+        game = Game("Colo", "Juan")
+        self.assertEqual(game.es_movimiento_valido(7, 4, 3), reglas.VALIDO)
+        self.assertEqual(game.es_movimiento_valido(7, 0, 7), reglas.DESTINO_BLOQUEADO)
+        self.assertEqual(game.es_movimiento_valido(30, 4), reglas.ORIGEN_FUERA_DE_RANGO)
+        self.assertEqual(game.get_board().get_conteo(7), 3)
+        self.assertEqual(game.__historial__, [])
+        
+        game.__juego_terminado__ = True
+        self.assertEqual(game.es_movimiento_valido(7, 4, 3), reglas.JUEGO_TERMINADO)
+    
+    def test_dados_inyectados(self):
+        """Test de partida con dados de generador propio"""
+        dice = Dice(semilla=1)
+        game = Game("Colo", "Juan", dice=dice)
+        self.assertIs(game.get_dice(), dice)
+        valores = game.tirar_dados()
+        self.assertEqual(valores, Game("Colo", "Juan", dice=Dice(semilla=1)).tirar_dados())
+        game.reiniciar_juego()
+        self.assertIs(game.get_dice(), dice)
+        self.assertEqual(dice.get_valores(), [0, 0])
+    
+    def test_tiene_movimiento_legal(self):
+        """Test de detección de tiradas sin movimientos posibles"""
+        game = Game("Colo", "Juan")
+        self.assertTrue(game.tiene_movimiento_legal([6, 5]))
+        self.assertFalse(game.tiene_movimiento_legal([]))
+        
+        # Ficha blanca en la barra con la casa negra cerrada
+        casillas = [0] * 28
+        casillas[24] = 1
+        casillas[5] = 14
+        for punto in range(18, 24):
+            casillas[punto] = -2
+        game.get_board().cargar_casillas(casillas)
+        self.assertFalse(game.tiene_movimiento_legal([6, 6, 6, 6]))
+        
+        game.__juego_terminado__ = True
+        self.assertFalse(game.tiene_movimiento_legal([6, 5]))
+
+    def test_dado_para_movimiento(self):
+        """Test de elección del dado para un movimiento suelto según las jugadas legales"""
+        game = Game("Colo", "Juan")
+        hash_inicial = game.hash()
+        self.assertEqual(game.dado_para_movimiento(7, 4, [3, 1]), 3)
+        self.assertEqual(game.dado_para_movimiento(5, 4, [3, 1]), 1)
+        self.assertIsNone(game.dado_para_movimiento(7, 4, [6, 5]))
+        self.assertIsNone(game.dado_para_movimiento(7, 4, []))
+        self.assertEqual(game.hash(), hash_inicial)
+        
+        # Si solo se puede usar un dado tiene que ser el mayor
+        casillas = [0] * 28
+        casillas[9] = 1
+        casillas[26] = 14
+        casillas[1] = -2
+        casillas[27] = 13
+        game.get_board().cargar_casillas(casillas)
+        self.assertEqual(game.movimientos_legales([5, 3]), [((9, 4, 5),)])
+        self.assertEqual(game.es_movimiento_valido(9, 6, 3), reglas.VALIDO)
+        self.assertIsNone(game.dado_para_movimiento(9, 6, [5, 3]))
+        self.assertEqual(game.dado_para_movimiento(9, 4, [5, 3]), 5)
+        
+        game.__juego_terminado__ = True
+        self.assertIsNone(game.dado_para_movimiento(9, 4, [5, 3]))
+    
+    def test_get_pips(self):
+        """Test del pip count mantenido con cada movimiento"""
+        game = Game("Colo", "Juan")
+        self.assertEqual(game.get_pips(), {"blanco": 167, "negro": 167})
+        game.get_board().aplicar_movimiento(12, 7, "blanco")
+        self.assertEqual(game.get_pips("blanco"), 162)
+        self.assertEqual(game.get_pips("negro"), 167)
+
+    def test_es_carrera(self):
+        """Test de detección de carrera sin contacto"""
+        game = Game("Colo", "Juan")
+        self.assertFalse(game.es_carrera())
+        casillas = [0] * 28
+        casillas[3], casillas[26] = 5, 10
+        casillas[18], casillas[27] = -5, 10
+        game.get_board().cargar_casillas(casillas)
+        self.assertTrue(game.es_carrera())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+
+from backgammon.core.board import Board
+from backgammon.core.game import Game
+from backgammon.core.jugadas import existe_movimiento, generar_jugadas, movimientos_simples
+
+
+def tablero_vacio():
+    board = Board()
+    board.cargar_casillas([0] * 28)
+    return board
+
+
+class TestJugadas(unittest.TestCase):
+
+    def test_apertura_3_1(self):
+        board = Board()
+        casillas_antes = list(board.get_casillas())
+        jugadas = generar_jugadas(board, "blanco", [3, 1])
+        self.assertEqual(len(jugadas), 16)
+        self.assertIn(((7, 4, 3), (5, 4, 1)), jugadas + [tuple(reversed(j)) for j in jugadas])
+        # El tablero queda igual después de generar
+        self.assertEqual(list(board.get_casillas()), casillas_antes)
+
+    def test_doble_usa_cuatro_movimientos(self):
+        jugadas = generar_jugadas(Board(), "blanco", [6, 6, 6, 6])
+        self.assertEqual(len(jugadas), 11)
+        self.assertTrue(all(len(jugada) == 4 for jugada in jugadas))
+
+    def test_jugadas_aplicables_con_mover_ficha(self):
+        game = Game("Colo", "Juan")
+        for jugada in game.movimientos_legales([5, 2]):
+            for movimiento in jugada:
+                game.mover_ficha(*movimiento)
+            for _ in jugada:
+                game.deshacer()
+        self.assertEqual(game.get_posicion(), Game("Colo", "Juan").get_posicion())
+
+    def test_barra_obligatoria(self):
+        board = tablero_vacio()
+        board.agregar_barra("blanco")
+        board.agregar_ficha("blanco", 10)
+        for punto in (20, 21):
+            board.agregar_ficha("negro", punto)
+            board.agregar_ficha("negro", punto)
+        self.assertEqual(movimientos_simples(board, "blanco", 3), [])
+        jugadas = generar_jugadas(board, "blanco", [3, 2])
+        self.assertEqual(sorted(jugadas), [((-1, 22, 2), (10, 7, 3)), ((-1, 22, 2), (22, 19, 3))])
+
+    def test_barra_bloqueada_no_hay_jugadas(self):
+        board = tablero_vacio()
+        board.agregar_barra("blanco")
+        for punto in range(18, 24):
+            board.agregar_ficha("negro", punto)
+            board.agregar_ficha("negro", punto)
+        self.assertEqual(generar_jugadas(board, "blanco", [4, 4, 4, 4]), [])
+        self.assertFalse(existe_movimiento(board, "blanco", [4, 4, 4, 4]))
+        board.quitar_ficha(20)
+        board.quitar_ficha(20)
+        self.assertFalse(existe_movimiento(board, "blanco", [3, 2]))
+        self.assertTrue(existe_movimiento(board, "blanco", [4, 2]))
+
+    def test_existe_movimiento_coincide_con_generar_jugadas(self):
+        board = Board()
+        for color in ("blanco", "negro"):
+            for dado1 in range(1, 7):
+                for dado2 in range(dado1, 7):
+                    dados = [dado1] * 4 if dado1 == dado2 else [dado1, dado2]
+                    self.assertEqual(existe_movimiento(board, color, dados), bool(generar_jugadas(board, color, dados)))
+
+    def test_bear_off_con_dado_mayor(self):
+        board = tablero_vacio()
+        board.agregar_ficha("blanco", 1)
+        board.agregar_ficha("blanco", 1)
+        board.agregar_ficha("negro", 20)
+        jugadas = generar_jugadas(board, "blanco", [6, 5])
+        self.assertEqual(len(jugadas), 1)
+        self.assertEqual(sorted(m[1] for m in jugadas[0]), [-1, -1])
+
+    def test_dado_mayor_saca_desde_cualquier_punto(self):
+        # Regla de este juego, distinta del estándar: el 6 saca la ficha del punto 1 aunque
+        # haya una ficha en el 6 (ver el docstring del módulo jugadas)
+        board = tablero_vacio()
+        board.agregar_ficha("blanco", 5)
+        board.agregar_ficha("blanco", 0)
+        board.agregar_ficha("negro", 20)
+        self.assertIn((0, -1), movimientos_simples(board, "blanco", 6))
+        self.assertTrue(existe_movimiento(board, "blanco", [6]))
+        jugadas = generar_jugadas(board, "blanco", [6, 1])
+        self.assertIn(((0, -1, 6), (5, 4, 1)), jugadas)
+        self.assertEqual(len(jugadas), 3)
+
+    def test_si_solo_entra_un_dado_usa_el_mayor(self):
+        board = tablero_vacio()
+        board.agregar_ficha("blanco", 10)
+        board.agregar_ficha("negro", 3)
+        board.agregar_ficha("negro", 3)
+        self.assertEqual(generar_jugadas(board, "blanco", [1, 6]), [((10, 4, 6),)])
+
+    def test_negro_respeta_su_direccion(self):
+        jugadas = generar_jugadas(Board(), "negro", [6, 5])
+        for jugada in jugadas:
+            for desde, hacia, dado in jugada:
+                self.assertEqual(hacia - desde, dado)
+
+
+if __name__ == "__main__":
+    unittest.main()
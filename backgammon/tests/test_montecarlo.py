@@ -0,0 +1,75 @@
+import unittest
+
+from backgammon.analysis import estimar_por_pips, rollout
+from backgammon.core.board import Board
+from backgammon.core.game import Game
+from backgammon.core.position import Position
+
+
+def posicion(casillas, turno):
+    board = Board()
+    board.cargar_casillas(casillas)
+    return Position.desde_board(board, turno)
+
+
+def blanco_por_ganar(turno):
+    """Blanco con una sola ficha en el punto 1 y negro con todo en casa sin sacar"""
+    casillas = [0] * 28
+    casillas[0] = 1
+    casillas[26] = 14
+    for punto in range(18, 23):
+        casillas[punto] = -3
+    return posicion(casillas, turno)
+
+
+class TestRollout(unittest.TestCase):
+
+    def test_gammon_seguro(self):
+        resultado = rollout(blanco_por_ganar("blanco"), partidas=36)
+        self.assertEqual(resultado.color, "blanco")
+        self.assertEqual(resultado.partidas, 36)
+        self.assertEqual(resultado.ganar, 1.0)
+        self.assertEqual(resultado.ganar_gammon, 1.0)
+        self.assertEqual(resultado.ganar_backgammon, 0.0)
+        self.assertEqual(resultado.equidad, 2.0)
+        self.assertEqual(resultado.error_estandar, 0.0)
+
+    def test_punto_de_vista_del_jugador_con_turno(self):
+        resultado = rollout(blanco_por_ganar("negro"), partidas=36)
+        self.assertEqual(resultado.color, "negro")
+        self.assertEqual(resultado.ganar, 0.0)
+        self.assertEqual(resultado.perder_gammon, 0.0)  # Negro siempre llega a sacar alguna ficha
+        self.assertEqual(resultado.equidad, -1.0)
+
+    def test_detencion_por_error(self):
+        resultado = rollout(blanco_por_ganar("blanco"), partidas=1296, error_objetivo=0.01, minimo=72)
+        self.assertEqual(resultado.partidas, 72)
+        paralelo = rollout(blanco_por_ganar("blanco"), partidas=1296, error_objetivo=0.01, minimo=72, procesos=2)
+        self.assertEqual(paralelo, resultado)
+
+    def test_truncado(self):
+        game = Game("Blanco", "Negro")
+        resultado = rollout(game, partidas=4, truncar=0)
+        self.assertEqual(resultado.truncadas, 4)
+        self.assertAlmostEqual(resultado.ganar, estimar_por_pips(game))
+        self.assertGreater(resultado.ganar, 0.5)  # Tener el turno con pips iguales es ventaja
+
+    def test_reproducible_y_paralelo(self):
+        game = Game("Blanco", "Negro")
+        secuencial = rollout(game, partidas=8, truncar=4, semilla=3, tamano_lote=4)
+        paralelo = rollout(game, partidas=8, truncar=4, semilla=3, tamano_lote=4, procesos=2)
+        self.assertEqual(secuencial, paralelo)
+
+    def test_parametros_invalidos(self):
+        game = Game("Blanco", "Negro")
+        with self.assertRaises(ValueError):
+            rollout(game, partidas=0)
+        with self.assertRaises(ValueError):
+            rollout(game, procesos=0)
+        game.__juego_terminado__ = True
+        with self.assertRaises(ValueError):
+            rollout(game)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,10 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(player_blanco.get_color(), "blanco")
         self.assertEqual(player_negro.get_color(), "negro")
 
+    def test_sin_dict_por_instancia(self):
+        player = Player("Ana", "blanco")
+        self.assertFalse(hasattr(player, "__dict__"))
+
 if __name__ == "__main__":
     unittest.main()
 
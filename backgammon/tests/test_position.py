@@ -0,0 +1,93 @@
+import pickle
+import unittest
+
+from backgammon.core.board import Board
+from backgammon.core.game import Game
+from backgammon.core.position import Position
+
+
+class TestPosition(unittest.TestCase):
+
+    def test_desde_game_captura_tablero_y_turno(self):
+        game = Game("Colo", "Juan")
+        game.cambiar_turno()
+        posicion = game.get_posicion()
+        self.assertEqual(posicion.get_turno(), "negro")
+        self.assertEqual(list(posicion.get_casillas()), list(game.get_board().get_casillas()))
+        self.assertEqual(len(posicion.to_bytes()), 29)
+
+    def test_hasheable_y_comparable(self):
+        game = Game("Colo", "Juan")
+        p1 = game.get_posicion()
+        p2 = Position.desde_board(Board())
+        self.assertEqual(p1, p2)
+        self.assertEqual(hash(p1), hash(p2))
+        self.assertEqual(len({p1, p2}), 1)
+        game.mover_ficha(5, 4, valor_dado=1)
+        p3 = game.get_posicion()
+        self.assertNotEqual(p1, p3)
+        self.assertEqual(sorted([p3, p1]), sorted([p1, p3]))
+
+    def test_zobrist_coincide_con_game(self):
+        game = Game("Colo", "Juan")
+        game.mover_ficha(12, 9, valor_dado=3)
+        game.cambiar_turno()
+        self.assertEqual(game.get_posicion().zobrist(), game.hash())
+
+    def test_pickle_compacto(self):
+        posicion = Game("Colo", "Juan").get_posicion()
+        for protocolo in range(3, pickle.HIGHEST_PROTOCOL + 1):
+            datos = pickle.dumps(posicion, protocol=protocolo)
+            # Los 29 bytes de la posición más unos pocos de pickle, sin la ruta de la clase
+            self.assertLess(len(datos), 64)
+            self.assertNotIn(b"backgammon", datos)
+            self.assertEqual(pickle.loads(datos), posicion)
+        self.assertLess(len(pickle.dumps(posicion)), 64)
+
+    def test_inmutable(self):
+        posicion = Game("Colo", "Juan").get_posicion()
+        with self.assertRaises(AttributeError):
+            posicion.__datos__ = b""
+        with self.assertRaises(TypeError):
+            posicion.get_casillas()[0] = 3
+
+    def test_datos_invalidos(self):
+        with self.assertRaises(ValueError):
+            Position(b"\x00" * 10)
+        with self.assertRaises(ValueError):
+            Position(b"\x00" * 28 + b"\x05")
+
+    def test_conversion_a_board_y_game(self):
+        game = Game("Colo", "Juan")
+        game.get_board().quitar_ficha(23)
+        game.get_board().agregar_barra("blanco")
+        posicion = game.get_posicion()
+
+        board = posicion.to_board()
+        self.assertEqual(board.get_casillas(), game.get_board().get_casillas())
+        self.assertEqual(board.hash(), game.get_board().hash())
+        self.assertEqual(board.get_pips("blanco"), game.get_board().get_pips("blanco"))
+
+        copia = Game.desde_posicion(posicion)
+        self.assertEqual(copia.get_posicion(), posicion)
+        self.assertEqual(len(copia.get_board().get_barra()["blanco"]), 1)
+
+    def test_espejar_y_forma_canonica(self):
+        game = Game("Colo", "Juan")
+        game.get_board().quitar_ficha(23)
+        game.get_board().agregar_barra("blanco")
+        game.cambiar_turno()
+        posicion = game.get_posicion()
+
+        canonica = posicion.canonica()
+        self.assertEqual(canonica.get_turno(), "blanco")
+        self.assertEqual(canonica, posicion.espejar())
+        self.assertEqual(canonica.espejar(), posicion)
+        self.assertIs(canonica.canonica(), canonica)
+        self.assertEqual(canonica.get_casillas()[25], 1)
+        self.assertEqual(canonica.get_casillas()[0], -1)
+        self.assertEqual(canonica.to_board().hash(), game.hash_canonico())
+
+
+if __name__ == "__main__":
+    unittest.main()
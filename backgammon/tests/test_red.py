@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional: sin él se saltean estos tests
+    np = None
+
+from backgammon.analysis.busqueda import Busqueda
+from backgammon.core.game import Game
+
+if np is not None:
+    from backgammon.analysis.codificacion import ENTRADAS_COMPACTA, codificar_tesauro
+    from backgammon.analysis.red import ENTRADAS, SALIDAS, RedNeuronal
+
+
+@unittest.skipIf(np is None, "numpy no está instalado")
+class TestRedNeuronal(unittest.TestCase):
+
+    def setUp(self):
+        self.red = RedNeuronal(semilla=1)
+        self.game = Game("Blanco", "Negro")
+
+    def test_capas_y_tipo(self):
+        self.assertEqual(self.red.get_capas(), (ENTRADAS, 80, SALIDAS))
+        self.assertEqual(self.red.get_dtype(), np.float32)
+        self.assertEqual(RedNeuronal(dtype=np.float64).evaluar_lote(np.zeros((1, ENTRADAS))).dtype, np.float64)
+        with self.assertRaises(ValueError):
+            RedNeuronal(capas=(ENTRADAS,))
+        with self.assertRaises(ValueError):
+            RedNeuronal(capas=(50, 5))
+
+    def test_red_compacta(self):
+        red = RedNeuronal(capas=(ENTRADAS_COMPACTA, 40, SALIDAS), semilla=2)
+        valores = red.evaluar_jugadas(self.game.get_board(), "blanco", self.game.movimientos_legales([6, 5]))
+        self.assertTrue((np.abs(valores) <= 3).all())
+
+    def test_lote_igual_a_individual(self):
+        casillas = self.game.get_board().get_casillas()
+        lote = codificar_tesauro([casillas, casillas], ["blanco", "negro"])
+        probabilidades = self.red.evaluar_lote(lote)
+        self.assertEqual(probabilidades.shape, (2, SALIDAS))
+        self.assertTrue(((probabilidades > 0) & (probabilidades < 1)).all())
+        np.testing.assert_allclose(probabilidades[0], self.red.probabilidades(self.game.get_board(), "blanco"), rtol=1e-6)
+
+    def test_guardar_y_cargar(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "red.npz")
+            self.red.guardar(ruta)
+            cargada = RedNeuronal.cargar(ruta, dtype=np.float64)
+        board = self.game.get_board()
+        self.assertEqual(cargada.get_dtype(), np.float64)
+        self.assertAlmostEqual(cargada.evaluar(board, "blanco"), self.red.evaluar(board, "blanco"), places=5)
+
+    def test_evaluar_jugadas(self):
+        board = self.game.get_board()
+        antes = board.hash()
+        jugadas = self.game.movimientos_legales([1, 1, 1, 1])
+        valores = self.red.evaluar_jugadas(board, "blanco", jugadas)
+        self.assertEqual(valores.shape, (len(jugadas),))
+        self.assertEqual(board.hash(), antes)
+        for jugada, valor in zip(jugadas[:5], valores):
+            comidas = [board.aplicar_movimiento(desde, hacia, "blanco") for desde, hacia, _ in jugada]
+            self.assertAlmostEqual(valor, -self.red.evaluar(board, "negro"), places=5)
+            for (desde, hacia, _), comio in zip(reversed(jugada), reversed(comidas)):
+                board.revertir_movimiento(desde, hacia, "blanco", comio)
+
+    def test_como_evaluador_de_busqueda(self):
+        jugada, valor = Busqueda(1, evaluador=self.red).mejor_jugada(self.game, [6, 5])
+        valores = self.red.evaluar_jugadas(self.game.get_board(), "blanco", self.game.movimientos_legales([6, 5]))
+        self.assertIsNotNone(jugada)
+        self.assertAlmostEqual(valor, float(valores.max()), places=5)
+        self.assertIsNotNone(Busqueda(2, evaluador=self.red).mejor_jugada(self.game, [3, 1])[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
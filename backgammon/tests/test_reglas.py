@@ -0,0 +1,62 @@
+import unittest
+
+from backgammon.core import reglas
+from backgammon.core.board import Board
+from backgammon.core.reglas import describir_motivo, validar_movimiento
+
+
+class TestReglas(unittest.TestCase):
+
+    def setUp(self):
+        self.board = Board()
+
+    def test_movimientos_validos(self):
+        self.assertEqual(validar_movimiento(self.board, "blanco", 7, 4, 3), reglas.VALIDO)
+        self.assertEqual(validar_movimiento(self.board, "negro", 0, 3, 3), reglas.VALIDO)
+        self.assertEqual(validar_movimiento(self.board, "blanco", 23, 10), reglas.VALIDO)
+
+    def test_origen(self):
+        self.assertEqual(validar_movimiento(self.board, "blanco", 24, 20), reglas.ORIGEN_FUERA_DE_RANGO)
+        self.assertEqual(validar_movimiento(self.board, "blanco", 5, 30), reglas.DESTINO_FUERA_DE_RANGO)
+        self.assertEqual(validar_movimiento(self.board, "blanco", 5, 5), reglas.MISMO_PUNTO)
+        self.assertEqual(validar_movimiento(self.board, "blanco", -1, 20, 4), reglas.BARRA_VACIA)
+        self.assertEqual(validar_movimiento(self.board, "blanco", 4, 2, 2), reglas.ORIGEN_VACIO)
+        self.assertEqual(validar_movimiento(self.board, "blanco", 0, 2), reglas.ORIGEN_RIVAL)
+
+    def test_distancia(self):
+        self.assertEqual(validar_movimiento(self.board, "blanco", 5, 8, 3), reglas.RETROCESO)
+        self.assertEqual(validar_movimiento(self.board, "blanco", 7, 3, 3), reglas.DISTANCIA_DISTINTA)
+        self.board.agregar_barra("negro")
+        self.assertEqual(validar_movimiento(self.board, "negro", -1, 10, 4), reglas.ENTRADA_INVALIDA)
+        # Barra -> bear off se rechaza antes como mismo punto (ambos son -1)
+        self.assertEqual(validar_movimiento(self.board, "negro", -1, -1, 4), reglas.MISMO_PUNTO)
+
+    def test_destino(self):
+        self.assertEqual(validar_movimiento(self.board, "blanco", 7, 0), reglas.DESTINO_BLOQUEADO)
+        self.assertEqual(validar_movimiento(self.board, "blanco", 5, -1, 6), reglas.BEAR_OFF_NO_PERMITIDO)
+
+    def test_bear_off(self):
+        casillas = [0] * 28
+        casillas[2] = 1
+        self.board.cargar_casillas(casillas)
+        self.assertEqual(validar_movimiento(self.board, "blanco", 2, -1, 2), reglas.DADO_INSUFICIENTE)
+        self.assertEqual(validar_movimiento(self.board, "blanco", 2, -1, 3), reglas.VALIDO)
+        self.assertEqual(validar_movimiento(self.board, "blanco", 2, -1, 6), reglas.VALIDO)
+
+    def test_no_modifica_el_tablero(self):
+        antes = list(self.board.get_casillas())
+        validar_movimiento(self.board, "blanco", 7, 4, 3)
+        self.assertEqual(list(self.board.get_casillas()), antes)
+
+    def test_describir_motivo(self):
+        self.assertEqual(describir_motivo(reglas.DESTINO_BLOQUEADO, "blanco", 7, 0), "El punto 0 está bloqueado por el oponente")
+        self.assertEqual(
+            describir_motivo(reglas.DISTANCIA_DISTINTA, "blanco", 7, 3, 3),
+            "El movimiento debe usar exactamente el valor del dado (3), distancia: 4",
+        )
+        with self.assertRaises(ValueError):
+            describir_motivo(99, "blanco", 0, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
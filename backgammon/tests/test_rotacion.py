@@ -0,0 +1,64 @@
+import unittest
+
+from backgammon.core.dice import Dice, TIRADAS
+from backgammon.core.rotacion import DadosRotados
+
+
+class TestDadosRotados(unittest.TestCase):
+
+    def primeras_tiradas(self, fuente, partidas, cantidad):
+        resultado = []
+        for numero in range(partidas):
+            fuente.nueva_partida(numero)
+            resultado.append(tuple(fuente.siguiente_tirada() for _ in range(cantidad)))
+        return resultado
+
+    def test_primera_tirada_estratificada(self):
+        primeras = [tiradas[0] for tiradas in self.primeras_tiradas(DadosRotados(semilla=1), 72, 1)]
+        self.assertEqual(sorted(primeras[:36]), sorted(TIRADAS))
+        self.assertEqual(sorted(primeras[36:]), sorted(TIRADAS))
+
+    def test_pares_de_tiradas_estratificados(self):
+        pares = self.primeras_tiradas(DadosRotados(semilla=2), 36 ** 2, 2)
+        self.assertEqual(len(set(pares)), 36 ** 2)
+
+    def test_tiradas_no_rotadas_al_azar(self):
+        fuente = DadosRotados(semilla=3, turnos_rotados=1)
+        tiradas = [fuente.siguiente_tirada() for _ in range(500)]
+        self.assertTrue(set(tiradas[1:]) <= set(TIRADAS))
+        self.assertGreater(len(set(tiradas[1:])), 30)
+
+    def test_reproducible(self):
+        primera = self.primeras_tiradas(DadosRotados(semilla=4), 40, 5)
+        segunda = self.primeras_tiradas(DadosRotados(semilla=4), 40, 5)
+        self.assertEqual(primera, segunda)
+
+    def test_nueva_partida_avanza(self):
+        fuente = DadosRotados(semilla=5, partida_inicial=10)
+        self.assertEqual(fuente.get_partida(), 10)
+        fuente.nueva_partida()
+        self.assertEqual(fuente.get_partida(), 11)
+        with self.assertRaises(ValueError):
+            DadosRotados(turnos_rotados=-1)
+
+    def test_como_fuente_de_dice(self):
+        fuente = DadosRotados(semilla=6)
+        esperadas = self.primeras_tiradas(DadosRotados(semilla=6), 36, 2)
+        dice = Dice(rng=fuente)
+        for numero in range(36):
+            fuente.nueva_partida(numero)
+            obtenidas = []
+            for _ in range(2):
+                dice.tirar()
+                obtenidas.append((dice.get_dado1(), dice.get_dado2()))
+            self.assertEqual(tuple(obtenidas), esperadas[numero])
+
+    def test_tirar_lote_con_rotacion(self):
+        fuente = DadosRotados(semilla=7)
+        lote = Dice(rng=fuente).tirar_lote(3)
+        otra = DadosRotados(semilla=7)
+        self.assertEqual(lote, [otra.siguiente_tirada() for _ in range(3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from backgammon.core.game import Game
+from backgammon.sim import (
+    Politica, PoliticaAleatoria, PoliticaCodiciosa, PoliticaPrimera, crear_politica, derivar_semilla,
+    iterar_resultados, jugar_partida, simular, simular_paralelo,
+)
+from backgammon.sim.__main__ import main
+
+
+class TestPoliticas(unittest.TestCase):
+
+    def test_base_abstracta(self):
+        with self.assertRaises(TypeError):
+            Politica()
+
+        class SinElegir(Politica):
+            __slots__ = ()
+
+        with self.assertRaises(TypeError):
+            SinElegir()
+
+    def test_primera(self):
+        self.assertEqual(PoliticaPrimera().elegir(None, [(1,), (2,)]), (1,))
+
+    def test_aleatoria_reproducible(self):
+        jugadas = [(i,) for i in range(20)]
+        primera = [PoliticaAleatoria(7).elegir(None, jugadas) for _ in range(5)]
+        segunda = [PoliticaAleatoria(7).elegir(None, jugadas) for _ in range(5)]
+        self.assertEqual(primera, segunda)
+
+    def test_codiciosa_prefiere_comer(self):
+        game = Game("Blanco", "Negro")
+        casillas = [0] * 28
+        casillas[10] = 1
+        casillas[5] = 14
+        casillas[8] = -1
+        casillas[20] = -14
+        game.get_board().cargar_casillas(casillas)
+        jugadas = game.movimientos_legales([2, 1])
+        antes = list(game.get_board().get_casillas())
+        jugada = PoliticaCodiciosa().elegir(game, jugadas)
+        self.assertIn((10, 8, 2), jugada)
+        self.assertEqual(list(game.get_board().get_casillas()), antes)
+
+    def test_crear_politica(self):
+        self.assertIsInstance(crear_politica("codiciosa"), PoliticaCodiciosa)
+        self.assertIsInstance(crear_politica("aleatoria", 3), PoliticaAleatoria)
+        with self.assertRaises(ValueError):
+            crear_politica("inexistente")
+
+
+class TestMotor(unittest.TestCase):
+
+    def test_partida_completa(self):
+        resultado = jugar_partida(PoliticaAleatoria(1), PoliticaAleatoria(2))
+        self.assertIn(resultado.ganador, ("blanco", "negro"))
+        self.assertIn(resultado.tipo_victoria, ("simple", "gammon", "backgammon"))
+        self.assertIn(resultado.puntos, (1, 2, 3))
+        self.assertGreater(resultado.movimientos, 0)
+
+    def test_partida_cortada(self):
+        resultado = jugar_partida(PoliticaPrimera(), PoliticaPrimera(), max_turnos=2)
+        self.assertIsNone(resultado.ganador)
+        self.assertEqual(resultado.turnos, 2)
+        self.assertEqual(resultado.puntos, 0)
+
+    def test_simular_reproducible(self):
+        primera = simular(2, PoliticaAleatoria(1), PoliticaAleatoria(2), semilla=5)
+        segunda = simular(2, PoliticaAleatoria(1), PoliticaAleatoria(2), semilla=5)
+        self.assertEqual(primera["partidas"], 2)
+        self.assertEqual(primera["movimientos"], segunda["movimientos"])
+        self.assertEqual(primera["victorias"], segunda["victorias"])
+        self.assertEqual(sum(primera["tipos_victoria"].values()), 2 - primera["cortadas"])
+        self.assertGreater(primera["movimientos_por_segundo"], 0)
+
+    def test_main(self):
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            estadisticas = main(["--partidas", "1", "--blanco", "primera", "--negro", "codiciosa", "--semilla", "3"])
+        self.assertEqual(estadisticas["partidas"], 1)
+        self.assertIn("Movimientos/seg", salida.getvalue())
+
+
+
+class TestParalelo(unittest.TestCase):
+
+    def test_derivar_semilla(self):
+        self.assertEqual(derivar_semilla(1, 5, "dados"), derivar_semilla(1, 5, "dados"))
+        self.assertNotEqual(derivar_semilla(1, 5, "dados"), derivar_semilla(1, 6, "dados"))
+        self.assertNotEqual(derivar_semilla(1, 5, "dados"), derivar_semilla(1, 5, "blanco"))
+        self.assertNotEqual(derivar_semilla(1, 5, "dados"), derivar_semilla(2, 5, "dados"))
+
+    def test_resultados_no_dependen_de_los_procesos(self):
+        secuencial = sorted(iterar_resultados(4, "aleatoria", "primera", 11, procesos=1))
+        paralelo = sorted(iterar_resultados(4, "aleatoria", "primera", 11, procesos=2, tamano_lote=1))
+        self.assertEqual(secuencial, paralelo)
+        self.assertEqual([indice for indice, _ in secuencial], [0, 1, 2, 3])
+
+    def test_simular_paralelo(self):
+        estadisticas = simular_paralelo(3, "primera", "aleatoria", 4, procesos=1)
+        self.assertEqual(estadisticas["partidas"], 3)
+        self.assertEqual(estadisticas["semilla_maestra"], 4)
+        repetida = simular_paralelo(3, "primera", "aleatoria", 4, procesos=1)
+        for clave in ("movimientos", "turnos", "victorias", "puntos", "tipos_victoria"):
+            self.assertEqual(estadisticas[clave], repetida[clave])
+
+    def test_procesos_invalidos(self):
+        with self.assertRaises(ValueError):
+            list(iterar_resultados(1, "primera", "primera", 0, procesos=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from backgammon.core.tablas import (
+    DESTINO, DISTANCIA, ENTRADA, ENTRADA_INVALIDA, FUERA_DE_RANGO, NORMAL, RETROCESO, SACAR,
+    SACAR_DESDE_BARRA, TIPO,
+)
+
+
+class TestTablas(unittest.TestCase):
+
+    def test_destino_blanco(self):
+        self.assertEqual(DESTINO["blanco"][12 + 1][3], 9)
+        self.assertEqual(TIPO["blanco"][12 + 1][3], NORMAL)
+        self.assertEqual(DESTINO["blanco"][0][1], 23)
+        self.assertEqual(TIPO["blanco"][0][6], ENTRADA)
+        self.assertEqual(DESTINO["blanco"][2 + 1][5], -1)
+        self.assertEqual(TIPO["blanco"][2 + 1][5], SACAR)
+
+    def test_destino_negro(self):
+        self.assertEqual(DESTINO["negro"][11 + 1][5], 16)
+        self.assertEqual(DESTINO["negro"][0][6], 5)
+        self.assertEqual(DESTINO["negro"][21 + 1][3], -1)
+        self.assertEqual(TIPO["negro"][23 + 1][1], SACAR)
+
+    def test_dado_fuera_de_rango(self):
+        self.assertIsNone(DESTINO["blanco"][5 + 1][0])
+        self.assertEqual(TIPO["negro"][5 + 1][0], FUERA_DE_RANGO)
+
+    def test_distancias(self):
+        self.assertEqual(DISTANCIA["blanco"][5 + 1][2 + 1], 3)
+        self.assertEqual(DISTANCIA["negro"][15 + 1][20 + 1], 5)
+        self.assertEqual(DISTANCIA["blanco"][0][18 + 1], 6)
+        self.assertEqual(DISTANCIA["negro"][0][0 + 1], 1)
+        self.assertEqual(DISTANCIA["negro"][20 + 1][0], 4)
+        self.assertEqual(DISTANCIA["blanco"][2 + 1][5 + 1], RETROCESO)
+        self.assertEqual(DISTANCIA["negro"][0][10 + 1], ENTRADA_INVALIDA)
+        self.assertEqual(DISTANCIA["blanco"][0][0], SACAR_DESDE_BARRA)
+
+    def test_destino_y_distancia_coinciden(self):
+        for color in ("blanco", "negro"):
+            for desde in range(-1, 24):
+                for dado in range(1, 7):
+                    hacia = DESTINO[color][desde + 1][dado]
+                    distancia = DISTANCIA[color][desde + 1][hacia + 1]
+                    if TIPO[color][desde + 1][dado] == SACAR:
+                        self.assertLessEqual(distancia, dado)
+                    else:
+                        self.assertEqual(distancia, dado)
+
+
+if __name__ == "__main__":
+    unittest.main()
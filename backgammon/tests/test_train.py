@@ -0,0 +1,130 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional: sin él se saltean estos tests
+    np = None
+
+from backgammon.core.game import Game
+
+if np is not None:
+    from backgammon.analysis.red import RedNeuronal
+    from backgammon.train import (
+        Trayectoria, actualizar_td, cargar_punto_control, entrenar, invertir, jugar_trayectoria,
+    )
+    from backgammon.train.__main__ import main
+    from backgammon.train.autojuego import jugar_trayectoria_sembrada
+    from backgammon.train.td import resultado_final
+
+
+def red_chica(semilla=0):
+    return RedNeuronal((198, 8, 5), semilla=semilla)
+
+
+@unittest.skipIf(np is None, "numpy no está instalado")
+class TestTD(unittest.TestCase):
+
+    def test_invertir(self):
+        probabilidades = np.array([[0.6, 0.2, 0.05, 0.1, 0.01]])
+        np.testing.assert_allclose(invertir(probabilidades), [[0.4, 0.1, 0.01, 0.2, 0.05]])
+        np.testing.assert_allclose(invertir(invertir(probabilidades)), probabilidades)
+
+    def test_resultado_final(self):
+        np.testing.assert_array_equal(resultado_final("blanco", 2, "blanco"), [1, 1, 0, 0, 0])
+        np.testing.assert_array_equal(resultado_final("blanco", 3, "negro"), [0, 0, 0, 1, 1])
+
+    def test_aprende_una_partida(self):
+        red = red_chica()
+        trayectoria = jugar_trayectoria_sembrada(red, 0, 1)
+        errores = [actualizar_td(red, trayectoria, alfa=0.5) for _ in range(20)]
+        self.assertLess(errores[-1], errores[0])
+
+    def test_partida_cortada(self):
+        red = red_chica()
+        casillas = np.frombuffer(Game("Blanco", "Negro").get_board().get_casillas(), dtype=np.int8)
+        trayectoria = Trayectoria(casillas[np.newaxis].copy(), ["blanco"], None, 0)
+        antes = [matriz.copy() for matriz in red.get_pesos()[0]]
+        self.assertEqual(actualizar_td(red, trayectoria), 0.0)
+        for matriz, original in zip(red.get_pesos()[0], antes):
+            np.testing.assert_array_equal(matriz, original)
+
+
+@unittest.skipIf(np is None, "numpy no está instalado")
+class TestAutojuego(unittest.TestCase):
+
+    def test_trayectoria(self):
+        red = red_chica()
+        trayectoria = jugar_trayectoria_sembrada(red, 3, 7)
+        self.assertEqual(trayectoria.tableros.shape, (len(trayectoria.colores), 28))
+        self.assertEqual(list(trayectoria.tableros[0]), list(Game("Blanco", "Negro").get_board().get_casillas()))
+        self.assertEqual(trayectoria.colores[:2], ["blanco", "negro"])
+        self.assertIn(trayectoria.ganador, ("blanco", "negro"))
+        self.assertIn(trayectoria.puntos, (1, 2, 3))
+        self.assertEqual(trayectoria.colores[-1], trayectoria.ganador)
+
+    def test_reproducible(self):
+        primera = jugar_trayectoria_sembrada(red_chica(), 3, 7)
+        segunda = jugar_trayectoria_sembrada(red_chica(), 3, 7)
+        np.testing.assert_array_equal(primera.tableros, segunda.tableros)
+
+    def test_partida_cortada(self):
+        trayectoria = jugar_trayectoria(red_chica(), max_turnos=3)
+        self.assertEqual(len(trayectoria.colores), 3)
+        self.assertIsNone(trayectoria.ganador)
+
+
+@unittest.skipIf(np is None, "numpy no está instalado")
+class TestEntrenamiento(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "pesos.npz")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_puntos_de_control_y_reanudar(self):
+        reportes = []
+        entrenar(3, ruta=self.ruta, red=red_chica(), guardar_cada=2, reportar_cada=1, reporte=reportes.append)
+        red, partidas = cargar_punto_control(self.ruta)
+        self.assertEqual(partidas, 3)
+        self.assertEqual(red.get_capas(), (198, 8, 5))
+        self.assertEqual(len(reportes), 3)
+        self.assertGreater(reportes[-1]["partidas_por_segundo"], 0)
+
+        entrenar(5, ruta=self.ruta, reanudar=True)
+        self.assertEqual(cargar_punto_control(self.ruta)[1], 5)
+        self.assertFalse(os.path.exists(self.ruta + ".tmp"))
+
+    def test_reproducible(self):
+        primera = entrenar(2, red=red_chica(), semilla=4)
+        segunda = entrenar(2, red=red_chica(), semilla=4)
+        np.testing.assert_array_equal(primera.get_pesos()[0][0], segunda.get_pesos()[0][0])
+
+    def test_varios_procesos(self):
+        reportes = []
+        entrenar(4, ruta=self.ruta, red=red_chica(), procesos=2, tamano_lote=1, reportar_cada=4, reporte=reportes.append)
+        self.assertEqual(cargar_punto_control(self.ruta)[1], 4)
+        self.assertEqual(sum(reportes[-1]["victorias"].values()) + reportes[-1]["cortadas"], 4)
+
+    def test_parametros_invalidos(self):
+        with self.assertRaises(ValueError):
+            entrenar(1, procesos=0)
+        with self.assertRaises(ValueError):
+            entrenar(1, tamano_lote=0)
+
+    def test_main(self):
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            main(["--partidas", "2", "--salida", self.ruta, "--ocultas", "4", "--codificacion", "compacta",
+                  "--reportar-cada", "2"])
+        self.assertIn("partidas/s", salida.getvalue())
+        self.assertEqual(cargar_punto_control(self.ruta)[0].get_capas(), (100, 4, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
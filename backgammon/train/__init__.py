@@ -0,0 +1,12 @@
+"""
+Entrenamiento por autojuego con TD(λ) de la red neuronal de evaluación (requiere numpy)
+
+Uso: python -m backgammon.train --partidas 100000 --salida pesos.npz --procesos 8
+     python -m backgammon.train --partidas 200000 --salida pesos.npz --reanudar
+"""
+
+from backgammon.train.autojuego import PoliticaRed, Trayectoria, jugar_trayectoria
+from backgammon.train.entrenamiento import (
+    cargar_punto_control, entrenar, formatear_progreso, guardar_punto_control,
+)
+from backgammon.train.td import actualizar_td, invertir
@@ -0,0 +1,51 @@
+import argparse
+
+from backgammon.analysis.codificacion import ENTRADAS_COMPACTA, ENTRADAS_TESAURO
+from backgammon.analysis.red import OCULTAS
+from backgammon.sim.motor import MAX_TURNOS
+from backgammon.train.entrenamiento import TAMANO_LOTE, entrenar, formatear_progreso
+from backgammon.train.td import ALFA, LAMBDA
+
+CODIFICACIONES = {"tesauro": ENTRADAS_TESAURO, "compacta": ENTRADAS_COMPACTA}
+
+
+def main(argumentos=None):
+    """Entrena la red por autojuego e imprime el progreso"""
+    parser = argparse.ArgumentParser(description="Entrenamiento TD(λ) por autojuego de la red de Backgammon")
+    parser.add_argument("--partidas", type=int, default=10000, help="Total de partidas a entrenar")
+    parser.add_argument("--salida", default="pesos.npz", help="Archivo .npz de los puntos de control")
+    parser.add_argument("--reanudar", action="store_true", help="Sigue desde el punto de control de --salida")
+    parser.add_argument("--alfa", type=float, default=ALFA, help="Tasa de aprendizaje")
+    parser.add_argument("--lambda", dest="lambda_", type=float, default=LAMBDA, help="Decaimiento de las trazas")
+    parser.add_argument("--ocultas", type=int, default=OCULTAS, help="Unidades ocultas de una red nueva")
+    parser.add_argument("--codificacion", choices=sorted(CODIFICACIONES), default="tesauro",
+                        help="Entradas de una red nueva")
+    parser.add_argument("--procesos", type=int, default=1,
+                        help="Procesos que juegan partidas (0 usa todos los núcleos)")
+    parser.add_argument("--lote", type=int, default=TAMANO_LOTE, help="Partidas por tarea de cada proceso")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla de los dados y de los pesos iniciales")
+    parser.add_argument("--max-turnos", type=int, default=MAX_TURNOS, help="Tiradas máximas por partida")
+    parser.add_argument("--guardar-cada", type=int, default=1000, help="Partidas entre puntos de control")
+    parser.add_argument("--reportar-cada", type=int, default=100, help="Partidas entre líneas de progreso")
+    opciones = parser.parse_args(argumentos)
+
+    return entrenar(
+        opciones.partidas,
+        ruta=opciones.salida,
+        reanudar=opciones.reanudar,
+        alfa=opciones.alfa,
+        lambda_=opciones.lambda_,
+        procesos=opciones.procesos or None,
+        tamano_lote=opciones.lote,
+        semilla=opciones.semilla,
+        max_turnos=opciones.max_turnos,
+        guardar_cada=opciones.guardar_cada,
+        reportar_cada=opciones.reportar_cada,
+        reporte=lambda progreso: print(formatear_progreso(progreso), flush=True),
+        ocultas=opciones.ocultas,
+        entradas=CODIFICACIONES[opciones.codificacion],
+    )
+
+
+if __name__ == "__main__":
+    main()
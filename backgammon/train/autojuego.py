@@ -0,0 +1,82 @@
+"""
+Partidas de autojuego para el entrenamiento: la red juega contra sí misma a través de Game
+y se registra la posición antes de cada tirada
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from backgammon.core.dice import Dice
+from backgammon.core.game import Game
+from backgammon.sim.motor import MAX_TURNOS, TAMANO_BUFFER_DADOS, continuar_partida
+from backgammon.sim.paralelo import derivar_semilla
+from backgammon.sim.politicas import Politica
+
+# tableros: matriz int8 (n, 28) con las casillas antes de cada tirada
+# colores: color con el turno en cada posición
+# ganador: "blanco", "negro" o None si la partida se cortó; puntos: 1, 2 o 3 (0 si se cortó)
+Trayectoria = namedtuple("Trayectoria", ["tableros", "colores", "ganador", "puntos"])
+
+
+class PoliticaRed(Politica):
+    """
+    Política que elige la jugada con mejor equidad según una red, evaluando todas las
+    jugadas de la tirada en un solo lote
+    """
+    __slots__ = ("__red__",)
+    nombre = "red"
+
+    def __init__(self, red):
+        self.__red__ = red
+
+    def elegir(self, game, jugadas):
+        valores = self.__red__.evaluar_jugadas(game.get_board(), game.get_turno_actual().get_color(), jugadas)
+        return jugadas[int(np.argmax(valores))]
+
+
+def jugar_trayectoria(red, dice=None, max_turnos=MAX_TURNOS):
+    """
+    Juega una partida de la red contra sí misma y retorna sus posiciones y su resultado
+
+    Args:
+        red (RedNeuronal): Red que elige las jugadas de los dos jugadores
+        dice (Dice): Dados de la partida
+        max_turnos (int): Tiradas máximas antes de cortar la partida
+
+    Returns:
+        Trayectoria: Posiciones antes de cada tirada y resultado
+    """
+    game = Game("Blanco", "Negro", dice=dice)
+    tableros = []
+    colores = []
+
+    def registrar(partida):
+        tableros.append(bytes(partida.get_board().get_casillas()))
+        colores.append(partida.get_turno_actual().get_color())
+
+    politica = PoliticaRed(red)
+    continuar_partida(game, politica, politica, max_turnos, observador=registrar)
+    ganador = game.get_ganador()
+    return Trayectoria(
+        np.frombuffer(b"".join(tableros), dtype=np.int8).reshape(len(tableros), 28),
+        colores,
+        ganador.get_color() if ganador else None,
+        game.get_puntos_victoria() if ganador else 0,
+    )
+
+
+def jugar_trayectoria_sembrada(red, indice, semilla_maestra, max_turnos=MAX_TURNOS):
+    """
+    Juega la partida número `indice` de un entrenamiento con dados de semilla derivada
+    """
+    dice = Dice(semilla=derivar_semilla(semilla_maestra, indice, "dados"), tamano_buffer=TAMANO_BUFFER_DADOS)
+    return jugar_trayectoria(red, dice, max_turnos)
+
+
+def _jugar_lote(tarea):
+    """
+    Juega un rango de partidas de autojuego dentro de un proceso del pool
+    """
+    red, inicio, fin, semilla_maestra, max_turnos = tarea
+    return [jugar_trayectoria_sembrada(red, indice, semilla_maestra, max_turnos) for indice in range(inicio, fin)]
@@ -0,0 +1,174 @@
+"""
+Bucle de entrenamiento por autojuego con puntos de control
+
+Los procesos del pool juegan partidas con una copia de la red y el proceso principal aplica
+las actualizaciones TD(λ) a medida que llegan las partidas. Cada tarea nueva sale con los
+pesos del momento, así que las partidas en vuelo usan pesos con a lo sumo unas pocas
+actualizaciones de atraso. Con un solo proceso todo corre en el mismo proceso y el
+entrenamiento es reproducible con la misma semilla.
+"""
+
+import copy
+import os
+import time
+from collections import deque
+from multiprocessing import Pool
+
+import numpy as np
+
+from backgammon.analysis.codificacion import ENTRADAS_TESAURO
+from backgammon.analysis.red import OCULTAS, SALIDAS, RedNeuronal
+from backgammon.sim.motor import MAX_TURNOS
+from backgammon.train.autojuego import _jugar_lote
+from backgammon.train.td import ALFA, LAMBDA, actualizar_td
+
+# Partidas por tarea de cada proceso
+TAMANO_LOTE = 4
+
+
+def guardar_punto_control(red, ruta, partidas):
+    """
+    Guarda los pesos y la cantidad de partidas entrenadas en un .npz
+
+    Se escribe primero un archivo temporal y después se reemplaza, para que un corte a mitad
+    de la escritura no deje un punto de control roto.
+    """
+    temporal = f"{ruta}.tmp"
+    with open(temporal, "wb") as archivo:
+        red.guardar(archivo, partidas=partidas)
+    os.replace(temporal, ruta)
+
+
+def cargar_punto_control(ruta, dtype=np.float32):
+    """
+    Carga un punto de control
+
+    Returns:
+        tuple: (RedNeuronal, partidas entrenadas)
+    """
+    red = RedNeuronal.cargar(ruta, dtype=dtype)
+    with np.load(ruta) as datos:
+        partidas = int(datos["partidas"]) if "partidas" in datos else 0
+    return red, partidas
+
+
+def entrenar(partidas, ruta=None, red=None, reanudar=False, alfa=ALFA, lambda_=LAMBDA, procesos=1,
+             tamano_lote=TAMANO_LOTE, semilla=0, max_turnos=MAX_TURNOS, guardar_cada=1000,
+             reportar_cada=100, reporte=None, ocultas=OCULTAS, entradas=ENTRADAS_TESAURO):
+    """
+    Entrena una red por autojuego con TD(λ)
+
+    Args:
+        partidas (int): Total de partidas a entrenar (contando las de un punto de control reanudado)
+        ruta (str): Archivo .npz de los puntos de control (None no guarda)
+        red (RedNeuronal): Red inicial (None crea una nueva o la carga al reanudar)
+        reanudar (bool): Si existe el archivo de `ruta`, sigue desde ese punto de control
+        alfa (float): Tasa de aprendizaje
+        lambda_ (float): Decaimiento de las trazas de elegibilidad
+        procesos (int): Procesos que juegan partidas (None usa todos los núcleos)
+        tamano_lote (int): Partidas por tarea de cada proceso
+        semilla (int): Semilla de los dados y de los pesos iniciales
+        max_turnos (int): Tiradas máximas por partida
+        guardar_cada (int): Partidas entre puntos de control
+        reportar_cada (int): Partidas entre llamadas a `reporte`
+        reporte (callable): Recibe un diccionario con el progreso (ver formatear_progreso);
+                            el error TD medio es el de las partidas desde el reporte anterior
+        ocultas (int): Unidades ocultas de una red nueva
+        entradas (int): Entradas de una red nueva (198 Tesauro o 100 compacta)
+
+    Returns:
+        RedNeuronal: La red entrenada
+
+    Raises:
+        ValueError: Si los parámetros no son válidos
+    """
+    if procesos is not None and procesos < 1:
+        raise ValueError("La cantidad de procesos debe ser al menos 1")
+    if tamano_lote < 1:
+        raise ValueError("El tamaño de lote debe ser al menos 1")
+
+    inicio = 0
+    if reanudar and ruta is not None and os.path.exists(ruta):
+        red, inicio = cargar_punto_control(ruta)
+    elif red is None:
+        red = RedNeuronal((entradas, ocultas, SALIDAS), semilla=semilla)
+
+    progreso = {"partidas": inicio, "nuevas": 0, "segundos": 0.0, "error_medio": 0.0,
+                "victorias": {"blanco": 0, "negro": 0}, "cortadas": 0}
+    errores = 0.0  # Suma del error TD desde el último reporte
+    ventana = 0
+    reloj = time.perf_counter()
+
+    def tareas():
+        for desde in range(inicio, partidas, tamano_lote):
+            yield desde, min(desde + tamano_lote, partidas)
+
+    def enviar(pool, desde, hasta):
+        # El pool serializa la tarea en otro hilo: se envía una copia para que las
+        # actualizaciones que siguen no la modifiquen a mitad de camino
+        return pool.apply_async(_jugar_lote, ((copy.deepcopy(red), desde, hasta, semilla, max_turnos),))
+
+    def registrar(trayectoria):
+        nonlocal errores, ventana
+        errores += actualizar_td(red, trayectoria, alfa, lambda_)
+        ventana += 1
+        progreso["partidas"] += 1
+        progreso["nuevas"] += 1
+        if trayectoria.ganador is None:
+            progreso["cortadas"] += 1
+        else:
+            progreso["victorias"][trayectoria.ganador] += 1
+        if reporte is not None and progreso["partidas"] % reportar_cada == 0:
+            progreso["segundos"] = time.perf_counter() - reloj
+            progreso["error_medio"] = errores / ventana
+            errores, ventana = 0.0, 0
+            reporte(completar_progreso(progreso))
+        if ruta is not None and progreso["partidas"] % guardar_cada == 0:
+            guardar_punto_control(red, ruta, progreso["partidas"])
+
+    if procesos == 1:
+        for desde, hasta in tareas():
+            for trayectoria in _jugar_lote((red, desde, hasta, semilla, max_turnos)):
+                registrar(trayectoria)
+    else:
+        procesos = procesos or os.cpu_count() or 1
+        with Pool(processes=procesos) as pool:
+            pendientes = deque()
+            rangos = tareas()
+            # Se mantienen tantas tareas en vuelo como procesos; cada una sale con los pesos actuales
+            for desde, hasta in rangos:
+                pendientes.append(enviar(pool, desde, hasta))
+                if len(pendientes) >= procesos:
+                    break
+            while pendientes:
+                trayectorias = pendientes.popleft().get()
+                siguiente = next(rangos, None)
+                for trayectoria in trayectorias:
+                    registrar(trayectoria)
+                if siguiente is not None:
+                    pendientes.append(enviar(pool, *siguiente))
+
+    if ruta is not None and progreso["nuevas"]:
+        guardar_punto_control(red, ruta, progreso["partidas"])
+    return red
+
+
+def completar_progreso(progreso):
+    """
+    Agrega partidas por segundo al progreso según el tiempo medido
+    """
+    segundos = progreso["segundos"]
+    progreso["partidas_por_segundo"] = progreso["nuevas"] / segundos if segundos else 0.0
+    return progreso
+
+
+def formatear_progreso(progreso):
+    """
+    Arma una línea de texto con el progreso del entrenamiento
+    """
+    return (
+        f"Partidas: {progreso['partidas']} | {progreso['partidas_por_segundo']:.1f} partidas/s | "
+        f"Error TD: {progreso['error_medio']:.4f} | "
+        f"Blanco {progreso['victorias']['blanco']} - Negro {progreso['victorias']['negro']}"
+        f" | Cortadas: {progreso['cortadas']}"
+    )
@@ -0,0 +1,92 @@
+"""
+Actualización TD(λ) de una RedNeuronal con una partida completa
+
+Las salidas de la red son las cinco probabilidades del jugador con el turno, que cambia en
+cada posición de la trayectoria. El objetivo de la posición t es la evaluación de la
+posición t + 1 vista desde el otro lado (invertir) y el de la última es el resultado real.
+
+Las trazas de elegibilidad se aplican en forma vectorizada: con los pesos fijos durante la
+partida, sumar alfa * delta_t * e_t con e_t = suma de lambda^(t-k) * gradiente_k es lo mismo
+que propagar hacia atrás por la red, en una sola pasada por lotes, el error acumulado
+E_k = delta_k + lambda * E_(k+1) de cada posición. Así no hace falta una traza por peso.
+La suma se divide por la cantidad de posiciones: alfa es el paso sobre el promedio de la
+partida y no depende de lo larga que sea. El valor por defecto equivale a unos 0.1 por
+posición en una partida típica, como en las actualizaciones en línea de TD-Gammon.
+"""
+
+import numpy as np
+
+# invertir(p) = (1 - ganar, perder_gammon, perder_backgammon, ganar_gammon, ganar_backgammon)
+_INTERCAMBIO = np.array([0, 3, 4, 1, 2])
+_SIGNOS = np.array([-1.0, 1.0, 1.0, 1.0, 1.0])
+_CONSTANTE = np.array([1.0, 0.0, 0.0, 0.0, 0.0])
+
+ALFA = 10.0
+LAMBDA = 0.7
+
+
+def invertir(probabilidades):
+    """
+    Pasa probabilidades (n, 5) al punto de vista del rival
+    """
+    return _CONSTANTE + _SIGNOS * probabilidades[..., _INTERCAMBIO]
+
+
+def resultado_final(ganador, puntos, color):
+    """
+    Vector de resultado de una partida terminada desde el punto de vista de `color`
+    """
+    gammon = 1.0 if puntos >= 2 else 0.0
+    backgammon = 1.0 if puntos >= 3 else 0.0
+    if ganador == color:
+        return np.array([1.0, gammon, backgammon, 0.0, 0.0])
+    return np.array([0.0, 0.0, 0.0, gammon, backgammon])
+
+
+def actualizar_td(red, trayectoria, alfa=ALFA, lambda_=LAMBDA):
+    """
+    Ajusta los pesos de la red con una partida completa por TD(λ)
+
+    Args:
+        red (RedNeuronal): Red a entrenar (se modifica)
+        trayectoria (Trayectoria): Posiciones y resultado de la partida
+        alfa (float): Tasa de aprendizaje sobre el promedio de las posiciones de la partida
+        lambda_ (float): Decaimiento de las trazas de elegibilidad (0 a 1)
+
+    Returns:
+        float: Error TD absoluto medio de la partida antes de actualizar
+    """
+    if len(trayectoria.colores) == 0:
+        return 0.0
+    activaciones = red.propagar(red.codificar(trayectoria.tableros, trayectoria.colores))
+    salida = activaciones[-1]
+
+    objetivos = np.empty_like(salida)
+    objetivos[:-1] = invertir(salida[1:])
+    if trayectoria.ganador is None:
+        # Partida cortada: la última posición no tiene objetivo
+        objetivos[-1] = salida[-1]
+    else:
+        objetivos[-1] = resultado_final(trayectoria.ganador, trayectoria.puntos, trayectoria.colores[-1])
+    deltas = objetivos - salida
+
+    # Error acumulado con las trazas, hacia atrás; el error de la posición siguiente se
+    # invierte (sin la constante) porque está del otro lado
+    errores = np.empty_like(deltas)
+    acumulado = np.zeros(deltas.shape[1], dtype=deltas.dtype)
+    for indice in range(len(deltas) - 1, -1, -1):
+        acumulado = deltas[indice] + lambda_ * _SIGNOS * acumulado[_INTERCAMBIO]
+        errores[indice] = acumulado
+
+    pesos, sesgos = red.get_pesos()
+    paso = alfa / len(deltas)
+    gradiente = (errores * salida * (1.0 - salida)).astype(salida.dtype)
+    for capa in range(len(pesos) - 1, -1, -1):
+        entrada = activaciones[capa]
+        cambio_pesos = entrada.T @ gradiente
+        cambio_sesgos = gradiente.sum(axis=0)
+        if capa > 0:
+            gradiente = (gradiente @ pesos[capa].T) * entrada * (1.0 - entrada)
+        pesos[capa] += paso * cambio_pesos
+        sesgos[capa] += paso * cambio_sesgos
+    return float(np.abs(deltas).mean())